@@ -1,4 +1,3 @@
-import json
 import os
 import platform
 
@@ -15,6 +14,16 @@ from param_est.fitness_functions import (
     parity_of_mz_auxin_concentrations_with_VDB_data,
     parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point,
 )
+from param_est.evaluation_log import (
+    SURROGATE_ESTIMATE,
+    EvaluationLog,
+    read_fitness_cache,
+    read_simulated_population,
+    solution_key,
+)
+from param_est.reference_data import REFERENCE_DATA, VDB_MZ_SUMMARY, VDB_XPP_BOUNDARY
+from param_est.ga_checkpoint import load_checkpoint, make_checkpoint, save_checkpoint, set_rng_state
+from param_est.surrogate import SurrogateScreen
 from src.sim.simulation.sim import GrowingSim
 
 SCREEN_WIDTH = 1000
@@ -52,9 +61,22 @@ AUX_SYN_DEG_PARAM_NAMES = [
 
 
 class ARORAGeneticAlg:
-    def __init__(self, filename: str, circ_mod: str):
+    def __init__(
+        self,
+        filename: str,
+        circ_mod: str,
+        checkpoint_filename: str = None,
+        surrogate: SurrogateScreen = None,
+    ):
         self.ga_instance = None
         self.filename = filename
+        self.evaluation_log = EvaluationLog(filename)
+        if checkpoint_filename is None:
+            checkpoint_filename = f"{os.path.splitext(filename)[0]}_checkpoint.pkl"
+        self.checkpoint_filename = checkpoint_filename
+        self.num_generations = None
+        self.fitness_cache = {}
+        self.surrogate = surrogate
         self.population = []
         if circ_mod == "auxsyndeg_only":
             self.param_names = AUX_SYN_DEG_PARAM_NAMES
@@ -71,19 +93,52 @@ class ARORAGeneticAlg:
         params = pd.Series(solution, index=self.param_names)
         for param in self.param_names:
             chromosome[param] = params[param]
-        if not self._check_constraints(params, chromosome):
+        key = solution_key(solution)
+        if key in self.fitness_cache:
+            print("Reusing fitness of previously evaluated chromosome")
+            fitness = self.fitness_cache[key]
+            chromosome["reused_fitness"] = True
+        elif not self._check_constraints(params, chromosome):
             print("Invalid solution")
-            cost = np.inf
+            fitness = -np.inf
+        elif self._screened_out(solution, ga_instance.generations_completed, chromosome):
+            print("Surrogate predicts chromosome is not promising, skipping simulation")
+            fitness = chromosome["surrogate_mean"]
         else:
             print(f"Running ARORA with params: {params}")
             fitness = self._run_ARORA(params, chromosome)
+            if self.surrogate is not None:
+                self.surrogate.add_observation(solution, fitness)
         chromosome["fitness"] = fitness
+        if not chromosome.get(SURROGATE_ESTIMATE, False):
+            self.fitness_cache[key] = fitness
         self.population.append(chromosome)
         print(f"Chromosome entry: {chromosome}")
-        with open(self.filename, "w") as f:
-            json.dump(self.population, f, indent=4)
+        self.evaluation_log.append_evaluation(chromosome, ga_instance.generations_completed)
         return fitness
 
+    def _screened_out(self, solution, generation, chromosome):
+        # Returns True if the surrogate rules out simulating the chromosome
+        if self.surrogate is None:
+            return False
+        simulate, mean, std = self.surrogate.screen(solution, generation)
+        if np.isnan(mean):
+            return False
+        chromosome["surrogate_mean"] = mean
+        chromosome["surrogate_std"] = std
+        chromosome[SURROGATE_ESTIMATE] = not simulate
+        return not simulate
+
+    def _train_surrogate_from_log(self):
+        # Seed the surrogate with every simulated chromosome already in the evaluation log
+        if not os.path.exists(self.filename):
+            return
+        for chromosome in read_simulated_population(self.filename):
+            if "fitness" in chromosome and all(p in chromosome for p in self.param_names):
+                self.surrogate.add_observation(
+                    [chromosome[p] for p in self.param_names], chromosome["fitness"]
+                )
+
     def _check_constraints(self, params, chromosome):
         # Check constraints here
         # ks = params['k_s']
@@ -109,7 +164,6 @@ class ARORAGeneticAlg:
             SCREEN_HEIGHT,
             SCREEN_TITLE,
             timestep,
-            root_midpoint_x,
             vis,
             cell_val_file,
             v_file,
@@ -133,6 +187,9 @@ class ARORAGeneticAlg:
             chromosome["finished"] = False
             tick = simulation.get_tick()
             chromosome["tick"] = tick
+            # run_sim only closes the window when the run finishes; an open window left for the
+            # garbage collector would unset the active window of a later simulation
+            simulation.close()
             print("Fitness set to -infinity")
             fitness = -np.inf
             try:
@@ -167,9 +224,9 @@ class ARORAGeneticAlg:
     def _calculate_fitness(self, simulation, chromosome):
         # calculate fitness
         fitness = parity_of_mz_auxin_concentrations_with_VDB_data(
-            simulation, chromosome
+            simulation, chromosome, REFERENCE_DATA.get(VDB_MZ_SUMMARY)
         ) + parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(
-            simulation, chromosome
+            simulation, chromosome, REFERENCE_DATA.get(VDB_XPP_BOUNDARY)
         )
         return fitness
 
@@ -249,7 +306,26 @@ class ARORAGeneticAlg:
             tau_range,
         ]
 
-    def run_genetic_alg(self):
+    def run_genetic_alg(self, resume: bool = False, random_seed: int = None):
+        """
+        Runs the genetic algorithm, checkpointing its state at the start and after every generation.
+
+        Parameters
+        ----------
+        resume : bool, optional
+            If True, continue from the last checkpoint instead of a random initial population.
+            Fitness values already recorded in the evaluation log are reused rather than
+            re-simulated. Starts from scratch if no checkpoint exists.
+        random_seed : int, optional
+            Seed for pygad's random number generators. A resumed run restores the generator
+            state from the checkpoint instead.
+
+        Notes
+        -----
+        If a SurrogateScreen was given, it is trained on the chromosomes already simulated in
+        the evaluation log before the run starts and on each new simulation as the run
+        progresses.
+        """
         if self.param_names == AUX_SYN_DEG_PARAM_NAMES:
             genespace = self.make_paramspace_aux_syn_deg()
         elif self.param_names == INDEP_SYN_DEG_PARAM_NAMES:
@@ -258,12 +334,15 @@ class ARORAGeneticAlg:
             "num_generations":20,
             "num_parents_mating": 25,
             "fitness_func": self.fitness_function,
+            "on_start": self.on_start,
+            "on_generation": self.on_gen,
             "sol_per_pop": 50,
             "num_genes": len(genespace),
             "gene_space": genespace,
             "mutation_percent_genes": 5,
             "save_best_solutions": False,
             "parent_selection_type": "sss",
+            "random_seed": random_seed,
         }
         ga_parameters_for_saving = {
             "num_generations": 20,
@@ -278,20 +357,57 @@ class ARORAGeneticAlg:
             "parent_selection_type": "sss",
             "initialization_file": "aux_syndegonly_init_vals.json",
             "hours_per_simulation": 27,
+            "random_seed": random_seed,
+            "surrogate_screening": self.surrogate is not None,
         }
+        self.num_generations = ga_parameters["num_generations"]
+        checkpoint = load_checkpoint(self.checkpoint_filename) if resume else None
+        if resume and checkpoint is None:
+            print(f"No checkpoint found at {self.checkpoint_filename}, starting a new run")
+        if checkpoint is not None:
+            completed = checkpoint["generations_completed"]
+            remaining = checkpoint["num_generations"] - completed
+            if remaining <= 0:
+                print(f"Checkpointed run already completed {completed} generations")
+                return
+            self.fitness_cache = read_fitness_cache(self.filename, self.param_names)
+            print(
+                f"Resuming from generation {completed} "
+                f"with {len(self.fitness_cache)} previously evaluated chromosomes"
+            )
+            self.num_generations = checkpoint["num_generations"]
+            ga_parameters["num_generations"] = remaining
+            ga_parameters["initial_population"] = checkpoint["population"]
+            ga_parameters_for_saving["resumed_from_generation"] = completed
+        if self.surrogate is not None:
+            self._train_surrogate_from_log()
         self.population.append(ga_parameters_for_saving)
-        # with open(self.filename, 'w') as f:
-        #    json.dump({'GA_parameters': ga_parameters_for_saving}, f, indent=4)
+        self.evaluation_log.append_ga_parameters(ga_parameters_for_saving)
         # Initialize the GA with the parameters
         self.ga_instance = pygad.GA(**ga_parameters)
+        if checkpoint is not None:
+            self.ga_instance.generations_completed = checkpoint["generations_completed"]
+            set_rng_state(self.ga_instance, checkpoint["rng_state"])
 
         self.ga_instance.run()
 
+    def save_checkpoint(self, ga_instance):
+        save_checkpoint(self.checkpoint_filename, make_checkpoint(ga_instance, self.num_generations))
+
+    def on_start(self, ga_instance):
+        # Checkpoint the initial population so a run killed during generation 0 can resume
+        if ga_instance.generations_completed == 0:
+            self.save_checkpoint(ga_instance)
+
     def on_gen(self, ga_instance):
         print("Generation : ", ga_instance.generations_completed)
-        print("Fitness of the best solution :", ga_instance.best_solution()[1])
+        print("Fitness of the best solution :", max(ga_instance.last_generation_fitness))
+        self.save_checkpoint(ga_instance)
 
     def analyze_results(self):
+        if self.ga_instance is None:
+            print("No genetic algorithm run to analyze")
+            return
         solution, solution_fitness, solution_idx = self.ga_instance.best_solution()
         print("Parameters of the best solution : {solution}".format(solution=solution))
         print(
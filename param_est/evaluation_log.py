@@ -0,0 +1,303 @@
+import json
+import os
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+EVALUATION_RECORD = "evaluation"
+GA_PARAMETERS_RECORD = "ga_parameters"
+SURROGATE_ESTIMATE = "surrogate_estimate"
+
+
+def _to_builtin(value: Any) -> Any:
+    """
+    Converts NumPy scalars and arrays to builtin Python types so they can be written as JSON.
+
+    Parameters
+    ----------
+    value : Any
+        The value json could not serialize.
+
+    Returns
+    -------
+    Any
+        A JSON serializable version of `value`.
+    """
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class EvaluationLog:
+    """
+    Append-only, crash-safe log of genetic algorithm fitness evaluations.
+
+    Every record is written as one JSON object per line (JSON Lines) and flushed to disk
+    before the write returns, so a run that is killed loses at most the line being written.
+    Each evaluation record carries the generation it was evaluated in.
+
+    Attributes
+    ----------
+    filename : str
+        Path of the JSON Lines file records are appended to.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines file records are appended to.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Initializes the EvaluationLog. The log file is created on the first append.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the JSON Lines file records are appended to.
+        """
+        self.filename = filename
+
+    def append(self, record: dict) -> None:
+        """
+        Appends one record to the log and forces it to disk.
+
+        Parameters
+        ----------
+        record : dict
+            The record to append. Must be JSON serializable (NumPy values are converted).
+        """
+        line = json.dumps(record, default=_to_builtin)
+        with open(self.filename, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append_evaluation(self, chromosome: dict, generation: int) -> None:
+        """
+        Appends the result of one fitness evaluation to the log.
+
+        Parameters
+        ----------
+        chromosome : dict
+            The chromosome entry populated during the fitness evaluation.
+        generation : int
+            The generation the chromosome was evaluated in.
+        """
+        record = {"record": EVALUATION_RECORD, "generation": generation}
+        record.update(chromosome)
+        self.append(record)
+
+    def append_ga_parameters(self, ga_parameters: dict) -> None:
+        """
+        Appends the parameters the genetic algorithm was run with to the log.
+
+        Parameters
+        ----------
+        ga_parameters : dict
+            Description of the genetic algorithm settings.
+        """
+        record = {"record": GA_PARAMETERS_RECORD}
+        record.update(ga_parameters)
+        self.append(record)
+
+
+def read_log(filename: str) -> list[dict]:
+    """
+    Reads every record in an evaluation log.
+
+    A final line that cannot be parsed is assumed to have been cut off by a crash
+    and is skipped. Unparseable lines anywhere else raise an error.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+
+    Returns
+    -------
+    list[dict]
+        The records in the order they were written.
+
+    Raises
+    ------
+    ValueError
+        If a line other than the last one is not valid JSON.
+    """
+    with open(filename, "r") as f:
+        lines = [line for line in f.read().split("\n") if line.strip() != ""]
+    records = []
+    for line_num, line in enumerate(lines):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            if line_num == len(lines) - 1:
+                print(f"Skipping truncated final record in {filename}")
+                break
+            raise ValueError(f"Corrupt record on line {line_num + 1} of {filename}: {e}")
+    return records
+
+
+def read_population(filename: str) -> list[dict]:
+    """
+    Reconstructs the list of evaluated chromosomes from an evaluation log.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+
+    Returns
+    -------
+    list[dict]
+        One dictionary per evaluated chromosome, in evaluation order, including the
+        generation index, parameter values and fitness.
+    """
+    population = []
+    for record in read_log(filename):
+        if record.get("record") == EVALUATION_RECORD:
+            chromosome = dict(record)
+            del chromosome["record"]
+            population.append(chromosome)
+    return population
+
+
+def read_simulated_population(filename: str) -> list[dict]:
+    """
+    Reconstructs the list of chromosomes whose fitness was calculated from a simulation,
+    leaving out fitness values estimated by a surrogate model.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+
+    Returns
+    -------
+    list[dict]
+        One dictionary per simulated chromosome, in evaluation order.
+    """
+    return [c for c in read_population(filename) if not c.get(SURROGATE_ESTIMATE, False)]
+
+
+def read_ga_parameters(filename: str) -> list[dict]:
+    """
+    Returns every genetic algorithm parameter record in an evaluation log.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+
+    Returns
+    -------
+    list[dict]
+        The parameter records, one per (re)start of the genetic algorithm.
+    """
+    parameters = []
+    for record in read_log(filename):
+        if record.get("record") == GA_PARAMETERS_RECORD:
+            params = dict(record)
+            del params["record"]
+            parameters.append(params)
+    return parameters
+
+
+def summarize_best_so_far(filename: str, param_names: list[str]) -> pd.DataFrame:
+    """
+    Summarizes the best fitness found in each generation and across all generations so far.
+    Fitness values estimated by a surrogate model instead of simulated are ignored.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+    param_names : list[str]
+        Names of the genes, used to report the parameters of the best chromosome so far.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per generation with columns 'generation', 'num_evaluations',
+        'generation_best_fitness', 'best_fitness_so_far' and one column per parameter
+        holding the best-so-far chromosome's value.
+    """
+    population = pd.DataFrame(read_simulated_population(filename))
+    columns = [
+        "generation",
+        "num_evaluations",
+        "generation_best_fitness",
+        "best_fitness_so_far",
+    ] + param_names
+    if len(population) == 0:
+        return pd.DataFrame(columns=columns)
+
+    population["fitness"] = population["fitness"].astype(float)
+    summary = []
+    best_so_far = None
+    for generation, group in population.groupby("generation", sort=True):
+        generation_best = group.loc[group["fitness"].idxmax()]
+        if best_so_far is None or generation_best["fitness"] > best_so_far["fitness"]:
+            best_so_far = generation_best
+        row = {
+            "generation": generation,
+            "num_evaluations": len(group),
+            "generation_best_fitness": generation_best["fitness"],
+            "best_fitness_so_far": best_so_far["fitness"],
+        }
+        for param in param_names:
+            row[param] = best_so_far.get(param)
+        summary.append(row)
+    return pd.DataFrame(summary, columns=columns)
+
+
+def solution_key(values) -> tuple:
+    """
+    Returns a hashable key identifying a chromosome by its gene values.
+
+    Parameters
+    ----------
+    values : iterable
+        The gene values, in parameter order.
+
+    Returns
+    -------
+    tuple
+        The gene values as a tuple of floats.
+    """
+    return tuple(float(value) for value in values)
+
+
+def read_fitness_cache(filename: str, param_names: list[str]) -> dict:
+    """
+    Maps every simulated chromosome in an evaluation log to its fitness.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the JSON Lines evaluation log.
+    param_names : list[str]
+        Names of the genes, in chromosome order.
+
+    Returns
+    -------
+    dict
+        Fitness keyed by `solution_key` of the chromosome's gene values. Empty if the log
+        does not exist.
+    """
+    if not os.path.exists(filename):
+        return {}
+    cache = {}
+    for chromosome in read_simulated_population(filename):
+        if "fitness" not in chromosome or any(p not in chromosome for p in param_names):
+            continue
+        key = solution_key(chromosome[p] for p in param_names)
+        cache[key] = float(chromosome["fitness"])
+    return cache
@@ -5,6 +5,12 @@ from scipy.stats import spearmanr
 
 from src.sim.simulation.sim import GrowingSim
 from src.agent.cell import Cell
+from param_est.reference_data import (
+    REFERENCE_DATA,
+    VDB_MZ_SUMMARY,
+    VDB_XPP_BOUNDARY,
+    ReferenceDataset,
+)
 
 
 def avg_auxin_root_tip_greater_than_elsewhere(sim: GrowingSim, chromosome: dict) -> float:
@@ -37,7 +43,8 @@ def auxin_greater_in_larger_cells_at_trans_elon_interface(sim: GrowingSim, chrom
     xpp_trans_and_elon_cells = [cell for cell in transition_and_elongation_cells if (cell.get_cell_type() == 'peri')]
     # get correlation coefficient between cell size and auxin concentration in xpp_trans_and_elon_cells
     # Trying with all cells
-    areas = [cell.get_quad_perimeter().get_area() for cell in xpp_trans_and_elon_cells]
+    tissue_geometry = sim.get_tissue_geometry()
+    areas = [tissue_geometry.get_cell_value(cell, 'area') for cell in xpp_trans_and_elon_cells]
     auxins = [cell.get_circ_mod().get_auxin() for cell in xpp_trans_and_elon_cells]
     corr_coeff = spearmanr(areas, auxins).statistic
     if corr_coeff < 0:
@@ -76,7 +83,9 @@ def auxin_oscillation_across_XPP_cells_in_OZ(sim: GrowingSim, chromosome: dict)
     # Return highest frequency peak
     return max(fourier) # maximizing this
 
-def parity_of_mz_auxin_concentrations_with_VDB_data(sim: GrowingSim, chromosome: dict) -> float:
+def parity_of_mz_auxin_concentrations_with_VDB_data(
+    sim: GrowingSim, chromosome: dict, vdb_mz_summary: ReferenceDataset = None
+) -> float:
     """
     Returns the Pearson correlation coefficient of parity of the auxin concentrations in the meristematic zone cells 
     between ARORA and the VDB data.
@@ -87,6 +96,9 @@ def parity_of_mz_auxin_concentrations_with_VDB_data(sim: GrowingSim, chromosome:
         The simulation object containing the cells.
     chromosome : dict
         Dictionary being populated with information about this simulation's run.
+    vdb_mz_summary : ReferenceDataset, optional
+        Preloaded VDB meristematic zone summary ('auxin_mean' and 'centroid_y_locations').
+        Taken from the reference data registry if not given.
 
     Returns
     -------
@@ -94,30 +106,34 @@ def parity_of_mz_auxin_concentrations_with_VDB_data(sim: GrowingSim, chromosome:
         The parity of the auxin concentrations in the marginal zone cells with the VDB data.
     """
 
-    # Step 1: Load VDB and ARORA data
-    vdb_summary_df = pd.read_csv('param_est/vdb_summary_seven_peri_cells_across_27_ticks.csv')
+    # Step 1: Load ARORA data
+    if vdb_mz_summary is None:
+        vdb_mz_summary = REFERENCE_DATA.get(VDB_MZ_SUMMARY)
     sim_output_df = pd.read_csv(sim.output.filename_csv)
     # Preprocess ARORA simulation output for analysis
     sim_output_df = preprocess_ARORA_sim_output(sim_output_df)
 
     # Step 2: Collect auxin concentrations at specific locations for each tick
-    centroid_y_locations = np.linspace(75, 178, 7)
+    centroid_y_locations = vdb_mz_summary['centroid_y_locations']
     closest_arora_cells_dfs = collect_auxin_data_by_tick(sim_output_df, centroid_y_locations)
 
     # Step 3: Generate summary statistics of auxin concentration per location
     ARORA_summary_df = calculate_auxin_summary(closest_arora_cells_dfs)
     # Step 4: Calculate Pearson correlation between ARORA and VDB data
-    correlation_coefficient = np.corrcoef(vdb_summary_df['auxin_mean'], ARORA_summary_df['auxin_mean'])[0, 1]
+    correlation_coefficient = np.corrcoef(vdb_mz_summary['auxin_mean'], ARORA_summary_df['auxin_mean'])[0, 1]
     chromosome["auxin_corr_with_mz"] = correlation_coefficient
     return correlation_coefficient
 
-def parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(sim: GrowingSim, chromosome: dict) -> float:
-    # Load VDB data
-    vdb_auxins = pd.read_csv('param_est/vdb_auxins_at_56pt5_336pt5.csv')
+def parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(
+    sim: GrowingSim, chromosome: dict, vdb_xpp_boundary: ReferenceDataset = None
+) -> float:
+    # Preloaded VDB data ('auxin' per tick and 'cell_location'), from the registry if not given
+    if vdb_xpp_boundary is None:
+        vdb_xpp_boundary = REFERENCE_DATA.get(VDB_XPP_BOUNDARY)
     sim_output_df = pd.read_csv(sim.output.filename_csv)
     sim_output_df = preprocess_ARORA_sim_output(sim_output_df)
     # Get auxin concentrations of XPP boundary cell at each time point
-    xpp_boundary_cell_loc = [56.5, 336.5]
+    xpp_boundary_cell_loc = vdb_xpp_boundary['cell_location']
     # For every tick in sim_output_df, find the ARORA cell closest to the XPP boundary cell
     closest_cells = []
     for tick in sim_output_df['tick'].unique():
@@ -125,7 +141,7 @@ def parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(sim: GrowingSim,
         closest_cell = find_ARORA_cell_closest_to_centroid(xpp_boundary_cell_loc, sim_output_df_tick)
         closest_cells.append(closest_cell)
     # Calculate Pearson correlation between ARORA and VDB data
-    correlation_coefficient = np.corrcoef(vdb_auxins['auxin'], [cell['Auxin'] for cell in closest_cells])[0, 1]
+    correlation_coefficient = np.corrcoef(vdb_xpp_boundary['auxin'], [cell['Auxin'] for cell in closest_cells])[0, 1]
     chromosome["auxin_corr_with_xpp_boundary"] = correlation_coefficient
     return correlation_coefficient
 
@@ -134,6 +150,10 @@ def collect_auxin_data_by_tick(sim_output_df: pd.DataFrame, centroid_y_locations
     """
     Collects the auxin concentration data for cells closest to the specified centroid locations across ticks.
 
+    For every tick, the meristematic pericycle cell whose adjusted centroid y is closest to
+    each location is selected (the first such cell in row order on ties), and the selected
+    rows of each tick are ordered by adjusted centroid y. All ticks are processed at once.
+
     Parameters
     ----------
     sim_output_df : pd.DataFrame
@@ -144,29 +164,53 @@ def collect_auxin_data_by_tick(sim_output_df: pd.DataFrame, centroid_y_locations
     Returns
     -------
     pd.DataFrame
-        DataFrame with auxin data for closest cells per tick.
+        DataFrame with auxin data for closest cells per tick, including the 'distance' of
+        each cell to its location.
+
+    Raises
+    ------
+    ValueError
+        If a tick has no meristematic pericycle cells.
     """
-    closest_arora_cells_dfs = []
-    unique_ticks = sim_output_df['tick'].unique()
-
-    for tick in unique_ticks:
-        closest_cells_df = pd.DataFrame()
-        sim_output_df_meri_peri = sim_output_df[
-            (sim_output_df['tick'] == tick) &
-            (sim_output_df['dev_zone'] == 'meristematic') &
-            (sim_output_df['cell_type'] == 'peri')
-        ].copy()
-        closest_cells = find_closest_ARORA_pericycle_cell(centroid_y_locations, sim_output_df_meri_peri)
-        closest_cells_df = pd.concat([closest_cells_df, pd.DataFrame(closest_cells)])
-        closest_cells_df = closest_cells_df.sort_values(by='adj_centroid_y')
-        closest_arora_cells_dfs.append(closest_cells_df)
-
-    return pd.concat(closest_arora_cells_dfs)
+    centroid_y_locations = np.asarray(centroid_y_locations, dtype=float)
+    tick_order = pd.unique(sim_output_df['tick'])
+    meri_peri_df = sim_output_df[
+        (sim_output_df['dev_zone'] == 'meristematic') & (sim_output_df['cell_type'] == 'peri')
+    ]
+    # Group rows by tick (in order of first appearance) keeping row order within each tick
+    tick_codes = pd.Categorical(meri_peri_df['tick'], categories=tick_order).codes
+    missing_ticks = np.setdiff1d(np.arange(len(tick_order)), tick_codes)
+    if len(missing_ticks) > 0:
+        raise ValueError(f"No meristematic pericycle cells at tick {tick_order[missing_ticks[0]]}")
+    by_tick = np.argsort(tick_codes, kind='stable')
+    tick_codes = tick_codes[by_tick]
+    adj_centroid_y = meri_peri_df['adj_centroid_y'].to_numpy(dtype=float)[by_tick]
+    tick_starts = np.flatnonzero(np.r_[True, tick_codes[1:] != tick_codes[:-1]])
+
+    # distances[i, j] is the distance of row i to location j
+    distances = np.abs(adj_centroid_y[:, None] - centroid_y_locations[None, :])
+    tick_sizes = np.diff(np.r_[tick_starts, len(distances)])
+    min_distances = np.repeat(np.minimum.reduceat(distances, tick_starts, axis=0), tick_sizes, axis=0)
+    # First row of each tick at the minimum distance, matching idxmin
+    row_numbers = np.where(distances == min_distances, np.arange(len(distances))[:, None], len(distances))
+    closest_rows = np.minimum.reduceat(row_numbers, tick_starts, axis=0)
+
+    # One sort: by tick, then by adjusted centroid y within each tick
+    closest_rows = closest_rows.ravel()
+    location_idx = np.tile(np.arange(len(centroid_y_locations)), len(tick_starts))
+    closest_distances = distances[closest_rows, location_idx]
+    order = np.lexsort((adj_centroid_y[closest_rows], tick_codes[closest_rows]))
+    closest_cells_df = meri_peri_df.iloc[by_tick[closest_rows[order]]].copy()
+    closest_cells_df['distance'] = closest_distances[order]
+    return closest_cells_df
 
 def calculate_auxin_summary(closest_arora_cells_dfs: pd.DataFrame) -> pd.DataFrame:
     """
     Calculates summary statistics (range, mean, median, std deviation) for auxin concentrations.
 
+    Rows of each tick are ranked by centroid y; statistics are calculated across ticks for
+    each rank.
+
     Parameters
     ----------
     closest_arora_cells_dfs : pd.DataFrame
@@ -177,24 +221,13 @@ def calculate_auxin_summary(closest_arora_cells_dfs: pd.DataFrame) -> pd.DataFra
     pd.DataFrame
         Summary statistics of auxin concentrations for each rank.
     """
-    grouped = closest_arora_cells_dfs.groupby('tick')
-    max_rows_per_tick = grouped.size().max()
+    sorted_df = closest_arora_cells_dfs.sort_values(by=['tick', 'centroid_y'], kind='stable')
+    rank = sorted_df.groupby('tick', sort=False).cumcount().to_numpy()
 
     summary_stats = []
-
-    for rank in range(max_rows_per_tick):
-        rows_at_rank = []
-
-        for _, group in grouped:
-            sorted_group = group.sort_values(by='centroid_y')
-            if rank < len(sorted_group):
-                rows_at_rank.append(sorted_group.iloc[rank])
-
-        rank_df = pd.DataFrame(rows_at_rank)
-
-        auxin_values = rank_df['auxin']
+    for rank_idx, auxin_values in sorted_df['auxin'].groupby(rank, sort=True):
         summary_stats.append({
-            'rank': rank + 1,
+            'rank': rank_idx + 1,
             'auxin_range': auxin_values.max() - auxin_values.min(),
             'auxin_mean': auxin_values.mean(),
             'auxin_median': auxin_values.median(),
@@ -227,17 +260,28 @@ def preprocess_ARORA_sim_output(sim_output_df):
 
     
 def find_closest_ARORA_pericycle_cell(centroid_y_locations, arora_df_ONLY_PERI):
-    closest_cells = []
-    # Make a copy of the DataFrame to avoid the SettingWithCopyWarning
-    arora_df_ONLY_PERICYCLE = arora_df_ONLY_PERI.copy()
-    for ylocation in centroid_y_locations:
-        # Calculate the distance between each cell's centroid and the y-location
-        arora_df_ONLY_PERICYCLE.loc[:, 'distance'] = (arora_df_ONLY_PERICYCLE['adj_centroid_y'] - ylocation).abs()
-        closest_cell = arora_df_ONLY_PERICYCLE.loc[arora_df_ONLY_PERICYCLE['distance'].idxmin()]
-        # Drop the 'distance' column after finding the closest cell
-        arora_df_ONLY_PERICYCLE = arora_df_ONLY_PERICYCLE.drop(columns=['distance'])
-        closest_cells.append(closest_cell)
-    return closest_cells
+    """
+    Finds the cell whose adjusted centroid y is closest to each location.
+
+    Parameters
+    ----------
+    centroid_y_locations : np.ndarray
+        Array of centroid y locations.
+    arora_df_ONLY_PERI : pd.DataFrame
+        ARORA cells to choose from.
+
+    Returns
+    -------
+    list[pd.Series]
+        For each location, the row of the closest cell (the first in row order on ties)
+        with a 'distance' entry added.
+    """
+    adj_centroid_y = arora_df_ONLY_PERI['adj_centroid_y'].to_numpy(dtype=float)
+    distances = np.abs(adj_centroid_y[:, None] - np.asarray(centroid_y_locations, dtype=float)[None, :])
+    closest_rows = np.argmin(distances, axis=0)
+    closest_cells_df = arora_df_ONLY_PERI.iloc[closest_rows].copy()
+    closest_cells_df['distance'] = distances[closest_rows, np.arange(len(closest_rows))]
+    return [row for _, row in closest_cells_df.iterrows()]
 
 def find_ARORA_cell_closest_to_centroid(arora_centroid_location, arora_df):
     # Ensure centroids are in the correct format (e.g., list of tuples)
@@ -0,0 +1,114 @@
+import os
+import pickle
+import random
+from typing import Any, Optional
+
+import numpy as np
+
+
+def make_checkpoint(ga_instance: Any, num_generations: int) -> dict:
+    """
+    Captures the state needed to continue a genetic algorithm run.
+
+    Parameters
+    ----------
+    ga_instance : pygad.GA
+        The genetic algorithm instance to capture.
+    num_generations : int
+        Total number of generations the run was configured with.
+
+    Returns
+    -------
+    dict
+        The population, its fitness (None if not yet evaluated), the number of completed
+        generations and the state of every random number generator pygad draws from.
+    """
+    fitness = ga_instance.last_generation_fitness
+    return {
+        "generations_completed": ga_instance.generations_completed,
+        "num_generations": num_generations,
+        "population": np.array(ga_instance.population, copy=True),
+        "last_generation_fitness": None if fitness is None else np.array(fitness, copy=True),
+        "rng_state": get_rng_state(ga_instance),
+    }
+
+
+def get_rng_state(ga_instance: Any) -> dict:
+    """
+    Returns the state of the global random number generators and, if present, the
+    generators owned by the genetic algorithm instance.
+
+    Parameters
+    ----------
+    ga_instance : pygad.GA
+        The genetic algorithm instance.
+
+    Returns
+    -------
+    dict
+        Random number generator states keyed by generator.
+    """
+    state = {"numpy": np.random.get_state(), "python": random.getstate()}
+    if hasattr(ga_instance, "numpy_random_generator"):
+        state["ga_numpy"] = ga_instance.numpy_random_generator.get_state()
+    if hasattr(ga_instance, "python_random_generator"):
+        state["ga_python"] = ga_instance.python_random_generator.getstate()
+    return state
+
+
+def set_rng_state(ga_instance: Any, state: dict) -> None:
+    """
+    Restores random number generator states captured by `get_rng_state`.
+
+    Parameters
+    ----------
+    ga_instance : pygad.GA
+        The genetic algorithm instance whose generators are restored.
+    state : dict
+        Random number generator states keyed by generator.
+    """
+    np.random.set_state(state["numpy"])
+    random.setstate(state["python"])
+    if "ga_numpy" in state and hasattr(ga_instance, "numpy_random_generator"):
+        ga_instance.numpy_random_generator.set_state(state["ga_numpy"])
+    if "ga_python" in state and hasattr(ga_instance, "python_random_generator"):
+        ga_instance.python_random_generator.setstate(state["ga_python"])
+
+
+def save_checkpoint(filename: str, checkpoint: dict) -> None:
+    """
+    Writes a checkpoint atomically, so an interrupted write leaves the previous checkpoint intact.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the checkpoint file.
+    checkpoint : dict
+        The checkpoint to save.
+    """
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "wb") as f:
+        pickle.dump(checkpoint, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+
+def load_checkpoint(filename: str) -> Optional[dict]:
+    """
+    Loads a checkpoint written by `save_checkpoint`.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the checkpoint file.
+
+    Returns
+    -------
+    dict or None
+        The checkpoint, or None if no checkpoint exists.
+    """
+    if not os.path.exists(filename):
+        return None
+    with open(filename, "rb") as f:
+        return pickle.load(f)
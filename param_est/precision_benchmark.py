@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from main import get_simulation_config
+
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 1000
+SCREEN_TITLE = "ARORA"
+
+TRAJECTORY_COLUMNS = ["auxin", "arr", "al", "pin", "pina", "pinb", "pinl", "pinm"]
+
+
+def compare_trajectories(
+    reference: pd.DataFrame, candidate: pd.DataFrame, columns: list[str] = TRAJECTORY_COLUMNS
+) -> pd.DataFrame:
+    """
+    Compares the per-cell trajectories of two simulation outputs.
+
+    `Output` writes every cell twice per tick, so rows are matched by tick, cell ID and their
+    order among the rows with that tick and cell ID. All errors and correlations are computed in
+    float64.
+
+    Parameters
+    ----------
+    reference : pd.DataFrame
+        Output of the reference run, as written by `Output`.
+    candidate : pd.DataFrame
+        Output of the run to validate.
+    columns : list[str], optional
+        The columns to compare. Defaults to the circulation species.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per column with the largest absolute error over matched rows, the same
+        error relative to the column's largest reference value, the lowest Pearson
+        correlation between the two runs' values across cells at any tick, and the number of
+        rows found in only one of the runs.
+    """
+    reference = reference.assign(occurrence=reference.groupby(["tick", "cell"]).cumcount())
+    candidate = candidate.assign(occurrence=candidate.groupby(["tick", "cell"]).cumcount())
+    merged = reference.merge(
+        candidate,
+        on=["tick", "cell", "occurrence"],
+        how="outer",
+        suffixes=("_ref", "_new"),
+        indicator=True,
+    )
+    unmatched = int((merged["_merge"] != "both").sum())
+    merged = merged[merged["_merge"] == "both"]
+    rows = []
+    for column in columns:
+        ref = merged[f"{column}_ref"].to_numpy(dtype=np.float64)
+        new = merged[f"{column}_new"].to_numpy(dtype=np.float64)
+        error = np.abs(new - ref)
+        # Relative to the column's largest value, as species that start at zero have no scale
+        scale = max(np.abs(ref).max(initial=0.0), np.finfo(np.float64).tiny)
+        correlations = []
+        for _, tick in merged.groupby("tick"):
+            ref_tick = tick[f"{column}_ref"].to_numpy(dtype=np.float64)
+            new_tick = tick[f"{column}_new"].to_numpy(dtype=np.float64)
+            if len(ref_tick) > 1 and ref_tick.std() > 0 and new_tick.std() > 0:
+                correlations.append(np.corrcoef(ref_tick, new_tick)[0, 1])
+        rows.append(
+            {
+                "column": column,
+                "max_abs_error": error.max(initial=0.0),
+                "max_rel_error": (error / scale).max(initial=0.0),
+                "min_correlation": min(correlations, default=np.nan),
+                "unmatched_rows": unmatched,
+            }
+        )
+    return pd.DataFrame(rows).set_index("column")
+
+
+def _run_dtype(circ_mod: str, dtype: str, output_file: str, sim_kwargs: dict) -> float:
+    # Runs in a fresh worker process so no state is shared between the runs being compared
+    from src.sim.simulation.sim import GrowingSim
+
+    config = get_simulation_config(circ_mod)
+    start_time = time.time()
+    simulation = GrowingSim(
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+        SCREEN_TITLE,
+        1,
+        False,
+        config["cell_val_file"],
+        config["v_file"],
+        config["gparam_series"],
+        "default",
+        output_file,
+        state_dtype=dtype,
+        **sim_kwargs,
+    )
+    simulation.run_sim()
+    return time.time() - start_time
+
+
+def run_precision_benchmark(
+    circ_mod: str,
+    output_dir: str,
+    dtypes: tuple[str, ...] = ("float64", "float32"),
+    **sim_kwargs,
+) -> tuple[pd.DataFrame, dict[str, float]]:
+    """
+    Runs one default simulation per state dtype and compares each trajectory with the first
+    one's. Each simulation runs in its own process.
+
+    Parameters
+    ----------
+    circ_mod : str
+        The circulation module to run.
+    output_dir : str
+        Directory the output files of each run are written to.
+    dtypes : tuple[str, ...], optional
+        The state dtypes to run, the first being the reference. Defaults to float64 and
+        float32.
+    **sim_kwargs
+        Further keyword arguments passed to `GrowingSim`, such as the transport scheme.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, dict[str, float]]
+        The comparison of every other dtype's trajectories with the reference's, see
+        `compare_trajectories`, indexed by dtype and column, and each dtype's run time in
+        seconds.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = {}
+    run_times = {}
+    for dtype in dtypes:
+        output_file = os.path.join(output_dir, f"precision_{dtype}")
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            run_times[dtype] = executor.submit(
+                _run_dtype, circ_mod, dtype, output_file, sim_kwargs
+            ).result()
+        outputs[dtype] = pd.read_csv(f"{output_file}.csv")
+    comparison = pd.concat(
+        {dtype: compare_trajectories(outputs[dtypes[0]], outputs[dtype]) for dtype in dtypes[1:]},
+        names=["dtype"],
+    )
+    return comparison, run_times
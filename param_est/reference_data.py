@@ -0,0 +1,199 @@
+import hashlib
+import io
+import os
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+VDB_MZ_SUMMARY = "vdb_mz_summary"
+VDB_XPP_BOUNDARY = "vdb_xpp_boundary"
+
+VDB_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vdb_data")
+VDB_MZ_SUMMARY_FILE = os.path.join(
+    VDB_DATA_DIR, "vdb_summary_seven_peri_cells_across_27_ticks.csv"
+)
+VDB_XPP_BOUNDARY_FILE = os.path.join(VDB_DATA_DIR, "vdb_auxins_at_56pt5_336pt5.csv")
+
+# Adjusted centroid y of the seven VDB meristematic zone pericycle cells
+MZ_CENTROID_Y_LOCATIONS = np.linspace(75, 178, 7)
+# Centroid of the VDB XPP boundary cell
+XPP_BOUNDARY_CELL_LOCATION = np.array([56.5, 336.5])
+
+
+class ReferenceDataset:
+    """
+    A reference dataset loaded from file and converted to read-only NumPy arrays.
+
+    Attributes
+    ----------
+    name : str
+        Name the dataset is registered under.
+    filename : str
+        Path of the file the dataset was loaded from.
+    content_hash : str
+        SHA-256 digest of the file contents the arrays were built from.
+    arrays : dict[str, np.ndarray]
+        The dataset's arrays, keyed by name.
+
+    Parameters
+    ----------
+    name : str
+        Name the dataset is registered under.
+    filename : str
+        Path of the file the dataset was loaded from.
+    content_hash : str
+        SHA-256 digest of the file contents the arrays were built from.
+    arrays : dict[str, np.ndarray]
+        The dataset's arrays, keyed by name.
+    """
+
+    def __init__(self, name: str, filename: str, content_hash: str, arrays: dict):
+        self.name = name
+        self.filename = filename
+        self.content_hash = content_hash
+        self.arrays = {}
+        for key, array in arrays.items():
+            array = np.array(array, dtype=float)
+            array.setflags(write=False)
+            self.arrays[key] = array
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+
+class ReferenceDataRegistry:
+    """
+    Loads each registered reference dataset once per process and serves it from memory.
+
+    Every `get` compares the file's size and modification time with those seen at load time.
+    Only if they changed is the file hashed again, and only if its content hash changed is
+    the dataset reloaded.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+        self._filenames = {}
+        self._datasets = {}
+        self._stats = {}
+
+    def register(self, name: str, filename: str, loader: Callable[[pd.DataFrame], dict]) -> None:
+        """
+        Registers a CSV reference dataset.
+
+        Parameters
+        ----------
+        name : str
+            Name to register the dataset under.
+        filename : str
+            Path of the CSV file.
+        loader : Callable[[pd.DataFrame], dict]
+            Validates the parsed CSV and converts it to a dictionary of arrays. Must raise
+            ValueError if the data is invalid.
+        """
+        self._loaders[name] = loader
+        self._filenames[name] = filename
+        self._datasets.pop(name, None)
+        self._stats.pop(name, None)
+
+    def get(self, name: str) -> ReferenceDataset:
+        """
+        Returns a registered dataset, loading it if it has not been loaded or its file changed.
+
+        Parameters
+        ----------
+        name : str
+            Name the dataset is registered under.
+
+        Returns
+        -------
+        ReferenceDataset
+            The dataset.
+
+        Raises
+        ------
+        KeyError
+            If no dataset is registered under `name`.
+        ValueError
+            If the file does not pass the dataset's validation.
+        """
+        if name not in self._loaders:
+            raise KeyError(f"No reference dataset registered as {name}")
+        filename = self._filenames[name]
+        stat = os.stat(filename)
+        stat_key = (stat.st_size, stat.st_mtime_ns)
+        if name in self._datasets and self._stats[name] == stat_key:
+            return self._datasets[name]
+
+        with open(filename, "rb") as f:
+            content = f.read()
+        content_hash = hashlib.sha256(content).hexdigest()
+        if name not in self._datasets or self._datasets[name].content_hash != content_hash:
+            df = pd.read_csv(io.BytesIO(content))
+            try:
+                arrays = self._loaders[name](df)
+            except ValueError as e:
+                raise ValueError(f"Invalid reference dataset {name} in {filename}: {e}")
+            self._datasets[name] = ReferenceDataset(name, filename, content_hash, arrays)
+        self._stats[name] = stat_key
+        return self._datasets[name]
+
+
+def _require_finite_columns(df: pd.DataFrame, columns: list[str]) -> None:
+    missing = [column for column in columns if column not in df.columns]
+    if missing:
+        raise ValueError(f"missing columns {missing}")
+    if len(df) == 0:
+        raise ValueError("no rows")
+    if not np.isfinite(df[columns].to_numpy(dtype=float)).all():
+        raise ValueError(f"non-finite values in columns {columns}")
+
+
+def load_vdb_mz_summary(df: pd.DataFrame) -> dict:
+    """
+    Converts the VDB meristematic zone summary to arrays.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Per-rank auxin summary of the seven VDB meristematic zone pericycle cells.
+
+    Returns
+    -------
+    dict
+        'auxin_mean' per rank and the 'centroid_y_locations' the ranks were sampled at.
+    """
+    _require_finite_columns(df, ["rank", "auxin_mean"])
+    if len(df) != len(MZ_CENTROID_Y_LOCATIONS):
+        raise ValueError(f"expected {len(MZ_CENTROID_Y_LOCATIONS)} ranks, found {len(df)}")
+    df = df.sort_values(by="rank")
+    return {
+        "auxin_mean": df["auxin_mean"].to_numpy(dtype=float),
+        "centroid_y_locations": MZ_CENTROID_Y_LOCATIONS,
+    }
+
+
+def load_vdb_xpp_boundary(df: pd.DataFrame) -> dict:
+    """
+    Converts the VDB XPP boundary cell auxin time series to arrays.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Auxin concentration of the VDB XPP boundary cell at each tick.
+
+    Returns
+    -------
+    dict
+        'auxin' at each tick and the 'cell_location' of the boundary cell.
+    """
+    _require_finite_columns(df, ["auxin"])
+    return {
+        "auxin": df["auxin"].to_numpy(dtype=float),
+        "cell_location": XPP_BOUNDARY_CELL_LOCATION,
+    }
+
+
+REFERENCE_DATA = ReferenceDataRegistry()
+REFERENCE_DATA.register(VDB_MZ_SUMMARY, VDB_MZ_SUMMARY_FILE, load_vdb_mz_summary)
+REFERENCE_DATA.register(VDB_XPP_BOUNDARY, VDB_XPP_BOUNDARY_FILE, load_vdb_xpp_boundary)
@@ -0,0 +1,221 @@
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+
+
+class GaussianProcessSurrogate:
+    """
+    Gaussian-process regressor with a squared-exponential (RBF) kernel, used to predict
+    chromosome fitness from previously simulated chromosomes.
+
+    Inputs are rescaled to the unit hypercube spanned by the training data and targets are
+    standardized. The kernel length scale is picked from `length_scales` by maximizing the
+    log marginal likelihood each time the model is fit.
+
+    Attributes
+    ----------
+    length_scales : tuple[float, ...]
+        Candidate kernel length scales, in normalized input units.
+    noise : float
+        Variance added to the kernel diagonal, relative to the standardized target variance.
+    length_scale : float
+        Length scale selected during the last fit.
+
+    Parameters
+    ----------
+    length_scales : tuple[float, ...], optional
+        Candidate kernel length scales, in normalized input units.
+    noise : float, optional
+        Variance added to the kernel diagonal, relative to the standardized target variance.
+    """
+
+    def __init__(self, length_scales: tuple = (0.05, 0.1, 0.2, 0.5, 1.0), noise: float = 1e-4):
+        self.length_scales = length_scales
+        self.noise = noise
+        self.length_scale = None
+        self._x_min = None
+        self._x_range = None
+        self._y_mean = None
+        self._y_std = None
+        self._x_train = None
+        self._cho = None
+        self._alpha = None
+
+    def _normalize(self, x: np.ndarray) -> np.ndarray:
+        return (np.asarray(x, dtype=float) - self._x_min) / self._x_range
+
+    @staticmethod
+    def _kernel(x1: np.ndarray, x2: np.ndarray, length_scale: float) -> np.ndarray:
+        sq_dists = (
+            np.sum(x1**2, axis=1)[:, None] + np.sum(x2**2, axis=1)[None, :] - 2 * x1 @ x2.T
+        )
+        return np.exp(-0.5 * np.maximum(sq_dists, 0.0) / length_scale**2)
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """
+        Fits the model to simulated chromosomes and their fitness.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Gene values, one row per chromosome.
+        y : np.ndarray
+            Finite fitness of each chromosome.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self._x_min = x.min(axis=0)
+        x_range = x.max(axis=0) - self._x_min
+        self._x_range = np.where(x_range > 0, x_range, 1.0)
+        self._y_mean = y.mean()
+        y_std = y.std()
+        self._y_std = y_std if y_std > 0 else 1.0
+        self._x_train = self._normalize(x)
+        y_norm = (y - self._y_mean) / self._y_std
+
+        best_log_likelihood = -np.inf
+        for length_scale in self.length_scales:
+            k = self._kernel(self._x_train, self._x_train, length_scale)
+            k[np.diag_indices_from(k)] += self.noise
+            try:
+                cho = cho_factor(k, lower=True)
+            except np.linalg.LinAlgError:
+                continue
+            alpha = cho_solve(cho, y_norm)
+            log_likelihood = -0.5 * y_norm @ alpha - np.sum(np.log(np.diag(cho[0])))
+            if log_likelihood > best_log_likelihood:
+                best_log_likelihood = log_likelihood
+                self.length_scale = length_scale
+                self._cho = cho
+                self._alpha = alpha
+        if self._cho is None:
+            raise ValueError("Could not fit surrogate, kernel matrix is not positive definite")
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Predicts the fitness of chromosomes.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Gene values, one row per chromosome.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Predicted mean fitness and its standard deviation for each chromosome.
+        """
+        x_norm = self._normalize(np.atleast_2d(x))
+        k_star = self._kernel(x_norm, self._x_train, self.length_scale)
+        mean = k_star @ self._alpha
+        v = cho_solve(self._cho, k_star.T)
+        var = np.maximum(1.0 - np.sum(k_star * v.T, axis=1), 0.0)
+        return mean * self._y_std + self._y_mean, np.sqrt(var) * self._y_std
+
+
+class SurrogateScreen:
+    """
+    Decides which candidate chromosomes are worth a full ARORA simulation.
+
+    A candidate is simulated if the surrogate's upper confidence bound on its fitness
+    (mean + `kappa` * std) reaches the fitness of the top `promising_fraction` of simulated
+    chromosomes, i.e. if it is either predicted to be good or the prediction is too uncertain
+    to rule it out. Everything else gets the surrogate's predicted fitness. Until
+    `min_training_points` chromosomes have been simulated every candidate is simulated.
+
+    The surrogate is refit at most once per generation, on every simulated chromosome seen so
+    far. Simulations that failed (fitness -inf) are kept as training points with the worst
+    finite fitness observed so the surrogate learns to avoid that region.
+
+    Attributes
+    ----------
+    min_training_points : int
+        Number of simulated chromosomes required before candidates are screened.
+    promising_fraction : float
+        Fraction of the best simulated fitness values that counts as promising.
+    kappa : float
+        Number of standard deviations of optimism in the upper confidence bound.
+    model : GaussianProcessSurrogate
+        The surrogate model.
+
+    Parameters
+    ----------
+    min_training_points : int, optional
+        Number of simulated chromosomes required before candidates are screened.
+    promising_fraction : float, optional
+        Fraction of the best simulated fitness values that counts as promising.
+    kappa : float, optional
+        Number of standard deviations of optimism in the upper confidence bound.
+    model : GaussianProcessSurrogate, optional
+        The surrogate model. A default GaussianProcessSurrogate is used if not given.
+    """
+
+    def __init__(
+        self,
+        min_training_points: int = 20,
+        promising_fraction: float = 0.25,
+        kappa: float = 2.0,
+        model: GaussianProcessSurrogate = None,
+    ):
+        self.min_training_points = min_training_points
+        self.promising_fraction = promising_fraction
+        self.kappa = kappa
+        self.model = model if model is not None else GaussianProcessSurrogate()
+        self._xs = []
+        self._ys = []
+        self._fit_generation = None
+        self._fit_size = 0
+        self._threshold = None
+
+    def get_num_observations(self) -> int:
+        return len(self._ys)
+
+    def add_observation(self, solution, fitness: float) -> None:
+        """
+        Adds a simulated chromosome to the training data.
+
+        Parameters
+        ----------
+        solution : iterable
+            The chromosome's gene values.
+        fitness : float
+            The fitness calculated from the chromosome's simulation.
+        """
+        self._xs.append(np.asarray(solution, dtype=float))
+        self._ys.append(float(fitness))
+
+    def _fit(self) -> bool:
+        ys = np.array(self._ys)
+        finite = np.isfinite(ys)
+        if np.sum(finite) < self.min_training_points:
+            return False
+        ys = np.where(finite, ys, ys[finite].min())
+        self.model.fit(np.array(self._xs), ys)
+        self._threshold = np.quantile(ys[finite], 1.0 - self.promising_fraction)
+        return True
+
+    def screen(self, solution, generation: int) -> tuple[bool, float, float]:
+        """
+        Decides whether a chromosome should be simulated.
+
+        Parameters
+        ----------
+        solution : iterable
+            The chromosome's gene values.
+        generation : int
+            The generation being evaluated; the surrogate is refit when this changes.
+
+        Returns
+        -------
+        tuple[bool, float, float]
+            Whether to simulate the chromosome, and the surrogate's predicted fitness and
+            standard deviation (NaN if the surrogate has not been fit).
+        """
+        if generation != self._fit_generation or self._threshold is None:
+            if self._fit_size != len(self._ys) or self._threshold is None:
+                if not self._fit():
+                    return True, np.nan, np.nan
+                self._fit_size = len(self._ys)
+            self._fit_generation = generation
+        mean, std = self.model.predict(np.asarray(solution, dtype=float))
+        mean, std = float(mean[0]), float(std[0])
+        return mean + self.kappa * std >= self._threshold, mean, std
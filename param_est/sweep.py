@@ -0,0 +1,578 @@
+import multiprocessing
+import os
+import signal
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.stats import qmc
+
+from main import DEFAULT_PARAM_NAMES, INDEP_PARAM_NAMES, get_simulation_config
+
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 1000
+SCREEN_TITLE = "ARORA"
+
+# Parameters that must be whole numbers (tau is the length of the ARR history)
+INTEGER_PARAMS = ["k1", "k2", "k3", "k4", "tau"]
+
+RESULTS_TABLE = "sweep_results"
+PENDING = "pending"
+FINISHED = "finished"
+FAILED = "failed"
+SUMMARY_COLUMNS = [
+    "final_tick",
+    "num_cells",
+    "total_auxin",
+    "mean_auxin",
+    "max_auxin",
+    "total_area",
+    "runtime_s",
+]
+
+
+class ResourceLimitExceeded(Exception):
+    pass
+
+
+def get_param_names(circ_mod: str) -> list[str]:
+    """
+    Returns the names of the parameters a circulation module is run with.
+
+    Parameters
+    ----------
+    circ_mod : str
+        The circulation module, one of 'universal_syndeg', 'indep_syndeg', 'aux_syndegonly'.
+
+    Returns
+    -------
+    list[str]
+        DEFAULT_PARAM_NAMES or INDEP_PARAM_NAMES from main.py.
+    """
+    if circ_mod == "indep_syndeg":
+        return INDEP_PARAM_NAMES
+    if circ_mod in ("universal_syndeg", "aux_syndegonly"):
+        return DEFAULT_PARAM_NAMES
+    raise ValueError(f"Unsupported circ_mod: {circ_mod}")
+
+
+def default_bounds(circ_mod: str, factor: float = 2.0) -> dict[str, tuple[float, float]]:
+    """
+    Makes sweep bounds spanning the default parameter values divided and multiplied by `factor`.
+
+    Parameters
+    ----------
+    circ_mod : str
+        The circulation module whose default parameters are used.
+    factor : float, optional
+        Multiplicative width of the bounds around each default value.
+
+    Returns
+    -------
+    dict[str, tuple[float, float]]
+        Lower and upper bound of each parameter.
+    """
+    baseline = get_simulation_config(circ_mod)["gparam_series"]
+    return {
+        param: (float(baseline[param]) / factor, float(baseline[param]) * factor)
+        for param in get_param_names(circ_mod)
+    }
+
+
+def _scale_to_bounds(unit_points: np.ndarray, bounds: dict) -> pd.DataFrame:
+    lower = np.array([bounds[param][0] for param in bounds], dtype=float)
+    upper = np.array([bounds[param][1] for param in bounds], dtype=float)
+    design = pd.DataFrame(qmc.scale(unit_points, lower, upper), columns=list(bounds))
+    return _round_integer_params(design)
+
+
+def _round_integer_params(design: pd.DataFrame) -> pd.DataFrame:
+    for param in INTEGER_PARAMS:
+        if param in design.columns:
+            design[param] = np.round(design[param]).astype(int)
+    return design
+
+
+def latin_hypercube_design(
+    bounds: dict, num_points: int, seed: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Makes a Latin-hypercube design.
+
+    Parameters
+    ----------
+    bounds : dict[str, tuple[float, float]]
+        Lower and upper bound of each parameter.
+    num_points : int
+        Number of points in the design.
+    seed : int, optional
+        Seed for the sampler.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per point with one column per parameter and a 'block' column.
+    """
+    sampler = qmc.LatinHypercube(d=len(bounds), seed=seed)
+    design = _scale_to_bounds(sampler.random(num_points), bounds)
+    design["block"] = "lhs"
+    return design
+
+
+def sobol_design(bounds: dict, num_base_points: int, seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Makes a Saltelli design for estimating first-order and total Sobol indices.
+
+    Two independent scrambled Sobol matrices A and B are drawn; for each parameter i the
+    design also contains A with column i taken from B (block 'AB_<param>'). The design has
+    `num_base_points` * (number of parameters + 2) points.
+
+    Parameters
+    ----------
+    bounds : dict[str, tuple[float, float]]
+        Lower and upper bound of each parameter.
+    num_base_points : int
+        Number of rows in A and B. Powers of two keep the Sobol sequence balanced.
+    seed : int, optional
+        Seed for the scrambling.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per point with one column per parameter, a 'block' column ('A', 'B' or
+        'AB_<param>') and a 'base_index' column giving the row of A/B the point came from.
+    """
+    num_params = len(bounds)
+    sampler = qmc.Sobol(d=2 * num_params, scramble=True, seed=seed)
+    base = sampler.random(num_base_points)
+    a, b = base[:, :num_params], base[:, num_params:]
+    blocks = [("A", a), ("B", b)]
+    for i, param in enumerate(bounds):
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        blocks.append((f"AB_{param}", ab))
+    designs = []
+    for block, unit_points in blocks:
+        design = _scale_to_bounds(unit_points, bounds)
+        design["block"] = block
+        design["base_index"] = np.arange(num_base_points)
+        designs.append(design)
+    return pd.concat(designs, ignore_index=True)
+
+
+def one_at_a_time_design(baseline: pd.Series, bounds: dict, num_levels: int) -> pd.DataFrame:
+    """
+    Makes a one-at-a-time design, varying each parameter across its bounds while the others
+    stay at their baseline values. The baseline itself is the first point.
+
+    Parameters
+    ----------
+    baseline : pd.Series
+        Baseline value of each parameter.
+    bounds : dict[str, tuple[float, float]]
+        Lower and upper bound of each parameter.
+    num_levels : int
+        Number of evenly spaced values per parameter.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per point with one column per parameter and a 'block' column ('baseline' or
+        the name of the parameter being varied).
+    """
+    rows = [dict(baseline[list(bounds)], block="baseline")]
+    for param, (lower, upper) in bounds.items():
+        for value in np.linspace(lower, upper, num_levels):
+            row = dict(baseline[list(bounds)], block=param)
+            row[param] = value
+            rows.append(row)
+    return _round_integer_params(pd.DataFrame(rows))
+
+
+def sobol_indices(results: pd.DataFrame, param_names: list[str], metric: str) -> pd.DataFrame:
+    """
+    Estimates first-order and total Sobol indices from a finished Saltelli design.
+
+    Uses the Saltelli (2010) first-order and Jansen total-effect estimators. Base points
+    with a failed or missing run in any block are dropped.
+
+    Parameters
+    ----------
+    results : pd.DataFrame
+        Results table of a sweep made with `sobol_design`.
+    param_names : list[str]
+        Names of the swept parameters.
+    metric : str
+        Summary metric to analyze.
+
+    Returns
+    -------
+    pd.DataFrame
+        'first_order' and 'total' index of each parameter.
+    """
+    finished = results[results["status"] == FINISHED]
+    by_block = finished.pivot(index="base_index", columns="block", values=metric).dropna()
+    f_a, f_b = by_block["A"].to_numpy(), by_block["B"].to_numpy()
+    variance = np.var(np.concatenate([f_a, f_b]))
+    indices = {}
+    for param in param_names:
+        f_ab = by_block[f"AB_{param}"].to_numpy()
+        first_order = np.mean(f_b * (f_ab - f_a)) / variance
+        total = 0.5 * np.mean((f_a - f_ab) ** 2) / variance
+        indices[param] = {"first_order": first_order, "total": total}
+    return pd.DataFrame(indices).T
+
+
+class SweepStore:
+    """
+    Results table of a parameter sweep, kept in a single SQLite table.
+
+    Each design point is one row keyed by 'point_id', holding its parameter values, the
+    design block it belongs to, its run status and the summary metrics of its run. Points
+    are inserted as pending when the sweep is created and updated in place as runs finish,
+    so an interrupted sweep resumes by running the points that are still pending.
+
+    Attributes
+    ----------
+    filename : str
+        Path of the SQLite database.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the SQLite database.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.filename)
+
+    def exists(self) -> bool:
+        """Returns True if the results table has been created."""
+        if not os.path.exists(self.filename):
+            return False
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (RESULTS_TABLE,)
+            ).fetchone()
+        return row is not None
+
+    def create(self, design: pd.DataFrame, circ_mod: str) -> None:
+        """
+        Creates the results table and inserts every design point as pending.
+
+        Parameters
+        ----------
+        design : pd.DataFrame
+            The design, one row per point.
+        circ_mod : str
+            The circulation module the design is run with.
+        """
+        if self.exists():
+            raise ValueError(f"{self.filename} already holds a sweep, resume it instead")
+        table = design.reset_index(drop=True).copy()
+        table.insert(0, "point_id", np.arange(len(table)))
+        table["circ_mod"] = circ_mod
+        table["status"] = PENDING
+        for column in SUMMARY_COLUMNS:
+            table[column] = np.nan
+        table["error"] = None
+        with self._connect() as conn:
+            table.head(0).to_sql(RESULTS_TABLE, conn, index=False)
+            conn.execute(f"CREATE UNIQUE INDEX idx_point_id ON {RESULTS_TABLE} (point_id)")
+            conn.execute(f"CREATE INDEX idx_status ON {RESULTS_TABLE} (status)")
+            table.to_sql(RESULTS_TABLE, conn, index=False, if_exists="append")
+
+    def read(self) -> pd.DataFrame:
+        """Returns the whole results table ordered by point_id."""
+        with self._connect() as conn:
+            return pd.read_sql(f"SELECT * FROM {RESULTS_TABLE} ORDER BY point_id", conn)
+
+    def get_pending(self, retry_failed: bool = False) -> pd.DataFrame:
+        """
+        Returns the points that still need to be run.
+
+        Parameters
+        ----------
+        retry_failed : bool, optional
+            If True, points whose run failed are returned as well.
+
+        Returns
+        -------
+        pd.DataFrame
+            The rows of the points to run.
+        """
+        statuses = (PENDING, FAILED) if retry_failed else (PENDING,)
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._connect() as conn:
+            return pd.read_sql(
+                f"SELECT * FROM {RESULTS_TABLE} WHERE status IN ({placeholders}) ORDER BY point_id",
+                conn,
+                params=statuses,
+            )
+
+    def record(self, point_id: int, result: dict) -> None:
+        """
+        Stores the outcome of one run.
+
+        Parameters
+        ----------
+        point_id : int
+            The point that was run.
+        result : dict
+            'status', optional 'error' and any of the summary metrics.
+        """
+        columns = ["status", "error"] + [c for c in SUMMARY_COLUMNS if c in result]
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        values = [result.get(column) for column in columns]
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE {RESULTS_TABLE} SET {assignments} WHERE point_id = ?",
+                values + [int(point_id)],
+            )
+
+
+def _raise_resource_limit(signum, frame):
+    name = "CPU time" if signum == getattr(signal, "SIGXCPU", None) else "wall clock time"
+    raise ResourceLimitExceeded(f"Run exceeded its {name} limit")
+
+
+def apply_resource_limits(
+    max_memory_mb: Optional[int] = None,
+    max_cpu_seconds: Optional[int] = None,
+    max_wall_seconds: Optional[int] = None,
+) -> None:
+    """
+    Limits the resources the current process may use for one run.
+
+    Exceeding the memory limit raises MemoryError; exceeding the CPU or wall clock limit
+    raises ResourceLimitExceeded. The CPU and memory limits are only available on POSIX
+    systems and are ignored elsewhere.
+
+    Parameters
+    ----------
+    max_memory_mb : int, optional
+        Maximum address space in megabytes.
+    max_cpu_seconds : int, optional
+        Maximum CPU time in seconds.
+    max_wall_seconds : int, optional
+        Maximum elapsed time in seconds.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        resource = None
+    if resource is not None and max_memory_mb is not None:
+        limit = int(max_memory_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if resource is not None and max_cpu_seconds is not None:
+        signal.signal(signal.SIGXCPU, _raise_resource_limit)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        used = int(time.process_time())
+        soft = used + int(max_cpu_seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    if max_wall_seconds is not None and hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_resource_limit)
+        signal.alarm(int(max_wall_seconds))
+
+
+def run_simulation_point(params: pd.Series, circ_mod: str, output_file: str) -> dict:
+    """
+    Runs ARORA for one design point and summarizes its final state.
+
+    Parameters
+    ----------
+    params : pd.Series
+        Parameter values of the point.
+    circ_mod : str
+        The circulation module to run.
+    output_file : str
+        Base name of the simulation's output files.
+
+    Returns
+    -------
+    dict
+        The summary metrics in SUMMARY_COLUMNS (except runtime_s).
+    """
+    from src.sim.simulation.sim import GrowingSim
+
+    config = get_simulation_config(circ_mod)
+    simulation = GrowingSim(
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+        SCREEN_TITLE,
+        1,
+        False,
+        config["cell_val_file"],
+        config["v_file"],
+        params,
+        "default",
+        output_file,
+    )
+    simulation.run_sim()
+    auxin = np.array([cell.get_circ_mod().get_auxin() for cell in simulation.get_cell_list()])
+    area = np.array(
+        [cell.get_quad_perimeter().get_area() for cell in simulation.get_cell_list()]
+    )
+    return {
+        "final_tick": simulation.get_tick(),
+        "num_cells": len(auxin),
+        "total_auxin": float(np.sum(auxin)),
+        "mean_auxin": float(np.mean(auxin)),
+        "max_auxin": float(np.max(auxin)),
+        "total_area": float(np.sum(area)),
+    }
+
+
+def _run_point(task: dict) -> tuple[int, dict]:
+    # Runs in a fresh worker process: apply limits, run the point and report status
+    point_id = task["point_id"]
+    start = time.time()
+    try:
+        apply_resource_limits(
+            task["max_memory_mb"], task["max_cpu_seconds"], task["max_wall_seconds"]
+        )
+        output_file = os.path.join(task["output_dir"], f"point_{point_id}")
+        result = task["run_point"](pd.Series(task["params"]), task["circ_mod"], output_file)
+        if not task["keep_output"]:
+            for extension in (".csv", ".json"):
+                if os.path.exists(output_file + extension):
+                    os.remove(output_file + extension)
+        result["status"] = FINISHED
+        result["error"] = None
+    except (Exception, MemoryError) as e:
+        result = {"status": FAILED, "error": f"{type(e).__name__}: {e}"}
+    result["runtime_s"] = time.time() - start
+    return point_id, result
+
+
+def run_sweep(
+    store: SweepStore,
+    param_names: list[str],
+    num_workers: int = 1,
+    output_dir: str = "sweep_output",
+    max_memory_mb: Optional[int] = None,
+    max_cpu_seconds: Optional[int] = None,
+    max_wall_seconds: Optional[int] = None,
+    retry_failed: bool = False,
+    keep_output: bool = False,
+    run_point: Callable[[pd.Series, str, str], dict] = run_simulation_point,
+) -> pd.DataFrame:
+    """
+    Runs every pending point of a sweep over a process pool and records the results.
+
+    On Python 3.11+ each run gets a fresh worker process, so simulation state does not carry
+    over between runs. Results are written to the store as each run finishes, so an
+    interrupted sweep can be resumed by calling this again. If a worker process dies (for
+    example it is killed by the operating system), the runs still in flight are recorded as
+    failed instead of hanging the sweep.
+
+    Parameters
+    ----------
+    store : SweepStore
+        The sweep's results table.
+    param_names : list[str]
+        Names of the swept parameters.
+    num_workers : int, optional
+        Number of runs executed at the same time.
+    output_dir : str, optional
+        Directory simulation output files are written to.
+    max_memory_mb : int, optional
+        Per-run address space limit in megabytes.
+    max_cpu_seconds : int, optional
+        Per-run CPU time limit in seconds.
+    max_wall_seconds : int, optional
+        Per-run elapsed time limit in seconds.
+    retry_failed : bool, optional
+        If True, points whose earlier run failed are run again.
+    keep_output : bool, optional
+        If True, the simulation output files of finished runs are kept.
+    run_point : Callable, optional
+        Function running one point, given its parameters, circ_mod and output file base
+        name, and returning its summary metrics. Must be importable by worker processes.
+
+    Returns
+    -------
+    pd.DataFrame
+        The complete results table.
+    """
+    pending = store.get_pending(retry_failed)
+    if len(pending) == 0:
+        print("No pending sweep points")
+        return store.read()
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [
+        {
+            "point_id": int(row["point_id"]),
+            "params": {param: row[param] for param in param_names},
+            "circ_mod": row["circ_mod"],
+            "output_dir": output_dir,
+            "max_memory_mb": max_memory_mb,
+            "max_cpu_seconds": max_cpu_seconds,
+            "max_wall_seconds": max_wall_seconds,
+            "keep_output": keep_output,
+            "run_point": run_point,
+        }
+        for _, row in pending.iterrows()
+    ]
+    print(f"Running {len(tasks)} sweep points on {num_workers} workers")
+    # spawn gives each run a clean interpreter (no inherited window or OpenGL state)
+    pool_kwargs = {"max_workers": num_workers, "mp_context": multiprocessing.get_context("spawn")}
+    if sys.version_info >= (3, 11):
+        pool_kwargs["max_tasks_per_child"] = 1
+    with ProcessPoolExecutor(**pool_kwargs) as executor:
+        futures = {executor.submit(_run_point, task): task["point_id"] for task in tasks}
+        for future in as_completed(futures):
+            try:
+                point_id, result = future.result()
+            except BrokenProcessPool as e:
+                point_id = futures[future]
+                result = {"status": FAILED, "error": f"Worker process died: {e}"}
+            store.record(point_id, result)
+            print(f"Point {point_id}: {result['status']}")
+    return store.read()
+
+
+def make_design(
+    design_type: str, circ_mod: str, num_points: int, seed: Optional[int] = None, factor: float = 2.0
+) -> pd.DataFrame:
+    """
+    Makes a design over the parameters of a circulation module, bounded around its defaults.
+
+    Parameters
+    ----------
+    design_type : str
+        'lhs', 'sobol' or 'oat'.
+    circ_mod : str
+        The circulation module whose parameters are swept.
+    num_points : int
+        Number of points for 'lhs', base points for 'sobol' and levels per parameter for 'oat'.
+    seed : int, optional
+        Seed for the 'lhs' and 'sobol' samplers.
+    factor : float, optional
+        Multiplicative width of the bounds around each default value.
+
+    Returns
+    -------
+    pd.DataFrame
+        The design.
+    """
+    bounds = default_bounds(circ_mod, factor)
+    if design_type == "lhs":
+        return latin_hypercube_design(bounds, num_points, seed)
+    if design_type == "sobol":
+        return sobol_design(bounds, num_points, seed)
+    if design_type == "oat":
+        baseline = get_simulation_config(circ_mod)["gparam_series"]
+        return one_at_a_time_design(baseline, bounds, num_points)
+    raise ValueError(f"Unsupported design type: {design_type}")
+
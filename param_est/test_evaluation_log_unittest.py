@@ -0,0 +1,86 @@
+import os
+import platform
+import tempfile
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from unittest.mock import MagicMock, patch
+import numpy as np
+from param_est.evaluation_log import (
+    EvaluationLog,
+    read_log,
+    read_population,
+    read_ga_parameters,
+    summarize_best_so_far,
+)
+from param_est.ARORA_genetic_alg import ARORAGeneticAlg, AUX_SYN_DEG_PARAM_NAMES
+
+
+class TestEvaluationLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "log.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_append_is_one_line_per_record(self):
+        log = EvaluationLog(self.filename)
+        log.append_ga_parameters({"num_generations": 20})
+        log.append_evaluation({"sol_idx": 0, "k1": np.int64(10), "fitness": np.float64(0.5)}, 0)
+        log.append_evaluation({"sol_idx": 1, "k1": 12, "fitness": -np.inf}, 0)
+        with open(self.filename) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(read_ga_parameters(self.filename), [{"num_generations": 20}])
+        population = read_population(self.filename)
+        self.assertEqual(population[0], {"generation": 0, "sol_idx": 0, "k1": 10, "fitness": 0.5})
+        self.assertEqual(population[1]["fitness"], -np.inf)
+
+    def test_read_log_skips_truncated_final_record(self):
+        log = EvaluationLog(self.filename)
+        log.append_evaluation({"sol_idx": 0, "fitness": 1.0}, 0)
+        with open(self.filename, "a") as f:
+            f.write('{"record": "evaluation", "generation": 0, "sol_i')
+        self.assertEqual(len(read_log(self.filename)), 1)
+
+    def test_read_log_raises_on_corrupt_middle_record(self):
+        with open(self.filename, "w") as f:
+            f.write('{"record": "evalu\n{"record": "evaluation"}\n')
+        with self.assertRaises(ValueError):
+            read_log(self.filename)
+
+    def test_summarize_best_so_far(self):
+        log = EvaluationLog(self.filename)
+        log.append_evaluation({"sol_idx": 0, "k1": 1, "fitness": 0.2}, 0)
+        log.append_evaluation({"sol_idx": 1, "k1": 2, "fitness": 0.7}, 0)
+        log.append_evaluation({"sol_idx": 0, "k1": 3, "fitness": 0.5}, 1)
+        log.append_evaluation({"sol_idx": 0, "k1": 4, "fitness": 0.9}, 2)
+        summary = summarize_best_so_far(self.filename, ["k1"])
+        self.assertEqual(summary["generation"].tolist(), [0, 1, 2])
+        self.assertEqual(summary["num_evaluations"].tolist(), [2, 1, 1])
+        self.assertEqual(summary["generation_best_fitness"].tolist(), [0.7, 0.5, 0.9])
+        self.assertEqual(summary["best_fitness_so_far"].tolist(), [0.7, 0.7, 0.9])
+        self.assertEqual(summary["k1"].tolist(), [2, 2, 4])
+
+    @patch("param_est.ARORA_genetic_alg.ARORAGeneticAlg._run_ARORA")
+    def test_fitness_function_appends_to_log(self, mock_run_ARORA):
+        mock_run_ARORA.return_value = 1.5
+        ga = ARORAGeneticAlg(self.filename, "auxsyndeg_only")
+        ga_instance = MagicMock()
+        ga_instance.generations_completed = 3
+        solution = np.arange(len(AUX_SYN_DEG_PARAM_NAMES), dtype=float)
+        fitness = ga.fitness_function(ga_instance, solution, 4)
+        self.assertEqual(fitness, 1.5)
+        population = read_population(self.filename)
+        self.assertEqual(len(population), 1)
+        self.assertEqual(population[0]["generation"], 3)
+        self.assertEqual(population[0]["sol_idx"], 4)
+        self.assertEqual(population[0]["fitness"], 1.5)
+        self.assertEqual(population[0]["tau"], solution[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
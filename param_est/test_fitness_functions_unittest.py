@@ -20,6 +20,7 @@ from param_est.fitness_functions import (
     get_min_y,
     parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point,
 )
+from param_est.reference_data import ReferenceDataset
 
 
 class TestFitnessFunctions(unittest.TestCase):
@@ -182,6 +183,36 @@ class TestFitnessFunctions(unittest.TestCase):
         # Check that collected_data contains the necessary columns
         self.assertTrue("auxin" in collected_data.columns)
 
+    def test_collect_auxin_data_by_tick_selects_closest_cells(self):
+        sim_output = pd.DataFrame(
+            {
+                "tick": [1, 1, 1, 1, 2, 2, 2],
+                "dev_zone": ["meristematic"] * 3 + ["elongation"] + ["meristematic"] * 3,
+                "cell_type": ["peri"] * 7,
+                "auxin": [1, 2, 3, 4, 5, 6, 7],
+                "adj_centroid_y": [100, 50, 100, 80, 60, 60, 200],
+                "centroid_y": [100, 50, 100, 80, 60, 60, 200],
+            }
+        )
+        collected_data = collect_auxin_data_by_tick(sim_output, np.array([90, 40]))
+        # Ties go to the first row, rows are ordered by adj_centroid_y within each tick
+        self.assertEqual(collected_data.index.tolist(), [1, 0, 4, 4])
+        self.assertEqual(collected_data["distance"].tolist(), [10, 10, 30, 20])
+
+    def test_collect_auxin_data_by_tick_missing_tick(self):
+        sim_output = self.mock_sim_output.copy()
+        sim_output.loc[sim_output["tick"] == 2, "dev_zone"] = "elongation"
+        with self.assertRaises(ValueError):
+            collect_auxin_data_by_tick(sim_output, self.centroid_y_locations)
+
+    def test_calculate_auxin_summary_values(self):
+        summary_df = calculate_auxin_summary(self.mock_sim_output.iloc[[3, 0, 2, 1]])
+        self.assertEqual(summary_df["rank"].tolist(), [1, 2])
+        self.assertEqual(summary_df["auxin_mean"].tolist(), [12.5, 22.5])
+        self.assertEqual(summary_df["auxin_range"].tolist(), [5, 5])
+        self.assertEqual(summary_df["auxin_median"].tolist(), [12.5, 22.5])
+        self.assertAlmostEqual(summary_df["auxin_standard_deviation"][0], np.std([10, 15], ddof=1))
+
     def test_calculate_auxin_summary(self):
         summary_df = calculate_auxin_summary(self.mock_sim_output)
         # Check if summary DataFrame contains expected statistics
@@ -205,6 +236,7 @@ class TestFitnessFunctions(unittest.TestCase):
         # Optionally, check auxin values for additional confirmation
         self.assertEqual(closest_cells[0]["cell"], 2)
         self.assertEqual(closest_cells[1]["cell"], 4)
+        self.assertEqual(closest_cells[0]["distance"], 20)
 
     @patch("pandas.read_csv")
     @patch("param_est.fitness_functions.preprocess_ARORA_sim_output")
@@ -223,14 +255,17 @@ class TestFitnessFunctions(unittest.TestCase):
 
         chromosome_mock = {}
 
-        # Step 1: Mock reading the VDB and ARORA CSVs
+        # Step 1: Mock the preloaded VDB data and reading the ARORA CSV
         # Adjusted the mock VDB data to have 3 elements (to match ARORA summary data)
-        mock_read_csv.side_effect = [
-            pd.DataFrame({"auxin_mean": [10, 20, 30]}),  # Mock VDB data with 3 elements
-            pd.DataFrame(
-                {"tick": [1, 2, 3], "auxin": [10, 15, 20]}
-            ),  # Mock simulation output data
-        ]
+        vdb_mz_summary = ReferenceDataset(
+            "vdb_mz_summary",
+            "mock_vdb.csv",
+            "",
+            {"auxin_mean": [10, 20, 30], "centroid_y_locations": np.linspace(75, 178, 7)},
+        )
+        mock_read_csv.return_value = pd.DataFrame(
+            {"tick": [1, 2, 3], "auxin": [10, 15, 20]}
+        )  # Mock simulation output data
 
         # Step 2: Mock preprocessing ARORA simulation output
         mock_preprocess_ARORA_sim_output.return_value = pd.DataFrame(
@@ -249,7 +284,7 @@ class TestFitnessFunctions(unittest.TestCase):
 
         # Step 5: Call the function and assert the result
         result = parity_of_mz_auxin_concentrations_with_VDB_data(
-            sim_mock, chromosome_mock
+            sim_mock, chromosome_mock, vdb_mz_summary
         )
 
         # Step 6: Assert that the Pearson correlation coefficient is as expected
@@ -259,7 +294,7 @@ class TestFitnessFunctions(unittest.TestCase):
         self.assertAlmostEqual(result, expected_correlation)
 
         # Optionally, verify the mocks were called correctly
-        mock_read_csv.assert_called()
+        mock_read_csv.assert_called_once_with("mock_sim_output.csv")
         mock_preprocess_ARORA_sim_output.assert_called()
         mock_collect_auxin_data_by_tick.assert_called()
         mock_calculate_auxin_summary.assert_called()
@@ -348,10 +383,13 @@ class TestFitnessFunctions(unittest.TestCase):
     @patch('param_est.fitness_functions.preprocess_ARORA_sim_output')
     @patch('pandas.read_csv')
     def test_parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(self, mock_read_csv, mock_preprocess_ARORA_sim_output, mock_find_closest_cell):
-        # Step 1: Mock the VDB auxin data (what you expect from 'vdb_auxins_at_56pt5_336pt5')
-        mock_vdb_auxins = pd.DataFrame({
-            'auxin': [10, 15, 20]  # Mock auxin values from VDB
-        })
+        # Step 1: Mock the preloaded VDB auxin data (what you expect from 'vdb_auxins_at_56pt5_336pt5')
+        vdb_xpp_boundary = ReferenceDataset(
+            'vdb_xpp_boundary',
+            'mock_vdb.csv',
+            '',
+            {'auxin': [10, 15, 20], 'cell_location': [56.5, 336.5]},  # Mock auxin values from VDB
+        )
 
         # Step 2: Mock the simulation output CSV data
         mock_sim_output_df = pd.DataFrame({
@@ -360,8 +398,8 @@ class TestFitnessFunctions(unittest.TestCase):
             'auxin': [12, 13, 18, 19, 25, 26],  # Mock auxin values for cells
         })
 
-        # Mock read_csv to return VDB auxin data first, then the simulation output CSV
-        mock_read_csv.side_effect = [mock_vdb_auxins, mock_sim_output_df]
+        # Mock read_csv to return the simulation output CSV
+        mock_read_csv.return_value = mock_sim_output_df
 
         # Step 3: Mock the preprocessed simulation data
         mock_preprocess_ARORA_sim_output.return_value = mock_sim_output_df
@@ -378,7 +416,7 @@ class TestFitnessFunctions(unittest.TestCase):
         mock_sim.output.filename_csv = 'mock_sim_output.csv'
 
         # Step 6: Call the function and compute the expected Pearson correlation
-        result = parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(mock_sim, {})
+        result = parity_of_auxin_c_for_xpp_boundary_cell_at_each_time_point(mock_sim, {}, vdb_xpp_boundary)
         
         # Step 7: Calculate the expected correlation coefficient using mock data
         expected_corr = np.corrcoef([10, 15, 20], [12, 18, 25])[0, 1]  # Comparing VDB auxin with simulated auxin
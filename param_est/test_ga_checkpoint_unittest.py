@@ -0,0 +1,103 @@
+import os
+import platform
+import tempfile
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from unittest.mock import patch
+import numpy as np
+from param_est.ARORA_genetic_alg import ARORAGeneticAlg
+from param_est.evaluation_log import read_fitness_cache, read_population
+from param_est.ga_checkpoint import load_checkpoint, save_checkpoint
+
+
+class SimulatedKill(Exception):
+    pass
+
+
+def fake_run_ARORA(params, chromosome):
+    return -float(np.sum((params.to_numpy(dtype=float) - 1.0) ** 2))
+
+
+class TestGACheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _make_ga(self, name):
+        return ARORAGeneticAlg(os.path.join(self.tmpdir.name, f"{name}.jsonl"), "auxsyndeg_only")
+
+    def test_save_and_load_checkpoint(self):
+        filename = os.path.join(self.tmpdir.name, "ckpt.pkl")
+        self.assertIsNone(load_checkpoint(filename))
+        save_checkpoint(filename, {"generations_completed": 3, "population": np.ones((2, 2))})
+        checkpoint = load_checkpoint(filename)
+        self.assertEqual(checkpoint["generations_completed"], 3)
+        np.testing.assert_array_equal(checkpoint["population"], np.ones((2, 2)))
+        self.assertFalse(os.path.exists(f"{filename}.tmp"))
+
+    def test_checkpoint_written_every_generation(self):
+        ga = self._make_ga("full")
+        with patch.object(ga, "_run_ARORA", side_effect=fake_run_ARORA):
+            ga.run_genetic_alg(random_seed=1)
+        checkpoint = load_checkpoint(ga.checkpoint_filename)
+        self.assertEqual(checkpoint["generations_completed"], 20)
+        self.assertEqual(checkpoint["num_generations"], 20)
+        np.testing.assert_array_equal(checkpoint["population"], ga.ga_instance.population)
+        np.testing.assert_array_equal(
+            checkpoint["last_generation_fitness"], ga.ga_instance.last_generation_fitness
+        )
+
+    def test_resume_matches_uninterrupted_run(self):
+        uninterrupted = self._make_ga("uninterrupted")
+        with patch.object(uninterrupted, "_run_ARORA", side_effect=fake_run_ARORA):
+            uninterrupted.run_genetic_alg(random_seed=7)
+
+        interrupted = self._make_ga("interrupted")
+        calls = {"count": 0}
+
+        def run_until_killed(params, chromosome):
+            calls["count"] += 1
+            if calls["count"] > 120:
+                raise SimulatedKill()
+            return fake_run_ARORA(params, chromosome)
+
+        with patch.object(interrupted, "_run_ARORA", side_effect=run_until_killed):
+            with self.assertRaises(SimulatedKill):
+                interrupted.run_genetic_alg(random_seed=7)
+        checkpoint = load_checkpoint(interrupted.checkpoint_filename)
+        self.assertGreater(checkpoint["generations_completed"], 0)
+        self.assertLess(checkpoint["generations_completed"], 20)
+        evaluated_before_kill = read_fitness_cache(interrupted.filename, interrupted.param_names)
+
+        resumed = self._make_ga("interrupted")
+        with patch.object(resumed, "_run_ARORA", side_effect=fake_run_ARORA) as mock_run:
+            resumed.run_genetic_alg(resume=True)
+            rerun = [
+                tuple(float(v) for v in call.args[0].to_numpy()) for call in mock_run.call_args_list
+            ]
+        self.assertTrue(all(key not in evaluated_before_kill for key in rerun))
+        self.assertEqual(resumed.ga_instance.generations_completed, 20)
+        np.testing.assert_array_equal(
+            resumed.ga_instance.population, uninterrupted.ga_instance.population
+        )
+        np.testing.assert_array_equal(
+            resumed.ga_instance.last_generation_fitness,
+            uninterrupted.ga_instance.last_generation_fitness,
+        )
+        generations = {c["generation"] for c in read_population(interrupted.filename)}
+        self.assertEqual(generations, set(range(21)))
+
+    def test_resume_without_checkpoint_starts_new_run(self):
+        ga = self._make_ga("fresh")
+        with patch.object(ga, "_run_ARORA", side_effect=fake_run_ARORA):
+            ga.run_genetic_alg(resume=True, random_seed=3)
+        self.assertEqual(ga.ga_instance.generations_completed, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+import pandas as pd
+from param_est.precision_benchmark import compare_trajectories
+
+
+class TestPrecisionBenchmark(unittest.TestCase):
+
+    def test_compare_trajectories(self):
+        reference = pd.DataFrame(
+            {
+                "tick": [0, 0, 0, 1, 1, 1],
+                "cell": [0, 1, 2, 0, 1, 2],
+                "auxin": [1.0, 2.0, 4.0, 1.0, 2.0, 3.0],
+                "arr": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+            }
+        )
+        candidate = reference.copy()
+        candidate.loc[5, "auxin"] = 3.3
+        candidate = pd.concat([candidate, pd.DataFrame({"tick": [1], "cell": [3]})])
+        comparison = compare_trajectories(reference, candidate, ["auxin", "arr"])
+        self.assertAlmostEqual(comparison.loc["auxin", "max_abs_error"], 0.3)
+        self.assertAlmostEqual(comparison.loc["auxin", "max_rel_error"], 0.075)
+        self.assertAlmostEqual(
+            comparison.loc["auxin", "min_correlation"],
+            np.corrcoef([1.0, 2.0, 3.0], [1.0, 2.0, 3.3])[0, 1],
+        )
+        self.assertEqual(comparison.loc["arr", "max_abs_error"], 0)
+        self.assertTrue(np.isnan(comparison.loc["arr", "min_correlation"]))
+        self.assertEqual(comparison.loc["auxin", "unmatched_rows"], 1)
+
+    def test_compare_trajectories_duplicate_rows(self):
+        # Output writes every cell twice per tick, with different values
+        output = pd.DataFrame(
+            {
+                "tick": [0, 0, 0, 0, 1, 1, 1, 1],
+                "cell": [0, 1, 0, 1, 0, 1, 0, 1],
+                "auxin": [1.0, 2.0, 1.5, 2.5, 1.5, 2.5, 9.0, 0.5],
+            }
+        )
+        comparison = compare_trajectories(output, output.copy(), ["auxin"])
+        self.assertEqual(comparison.loc["auxin", "max_abs_error"], 0)
+        self.assertEqual(comparison.loc["auxin", "max_rel_error"], 0)
+        self.assertAlmostEqual(comparison.loc["auxin", "min_correlation"], 1.0)
+        self.assertEqual(comparison.loc["auxin", "unmatched_rows"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
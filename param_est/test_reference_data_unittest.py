@@ -0,0 +1,88 @@
+import os
+import platform
+import tempfile
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+from param_est.reference_data import (
+    REFERENCE_DATA,
+    VDB_MZ_SUMMARY,
+    VDB_XPP_BOUNDARY,
+    ReferenceDataRegistry,
+    load_vdb_mz_summary,
+    load_vdb_xpp_boundary,
+)
+
+
+class TestReferenceData(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "auxins.csv")
+        with open(self.filename, "w") as f:
+            f.write("auxin\n1.0\n2.0\n")
+        self.registry = ReferenceDataRegistry()
+        self.registry.register("xpp", self.filename, load_vdb_xpp_boundary)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_vdb_datasets_load(self):
+        mz_summary = REFERENCE_DATA.get(VDB_MZ_SUMMARY)
+        self.assertEqual(len(mz_summary["auxin_mean"]), 7)
+        np.testing.assert_array_equal(
+            mz_summary["centroid_y_locations"], np.linspace(75, 178, 7)
+        )
+        xpp_boundary = REFERENCE_DATA.get(VDB_XPP_BOUNDARY)
+        self.assertEqual(len(xpp_boundary["auxin"]), 28)
+        np.testing.assert_array_equal(xpp_boundary["cell_location"], [56.5, 336.5])
+
+    def test_loaded_once(self):
+        with patch("param_est.reference_data.pd.read_csv", wraps=pd.read_csv) as mock_read_csv:
+            first = self.registry.get("xpp")
+            second = self.registry.get("xpp")
+        self.assertIs(first, second)
+        self.assertEqual(mock_read_csv.call_count, 1)
+        np.testing.assert_array_equal(first["auxin"], [1.0, 2.0])
+
+    def test_arrays_are_read_only(self):
+        dataset = self.registry.get("xpp")
+        with self.assertRaises(ValueError):
+            dataset["auxin"][0] = 5.0
+
+    def test_reloaded_when_content_changes(self):
+        first = self.registry.get("xpp")
+        with open(self.filename, "w") as f:
+            f.write("auxin\n3.0\n4.0\n5.0\n")
+        second = self.registry.get("xpp")
+        self.assertNotEqual(first.content_hash, second.content_hash)
+        np.testing.assert_array_equal(second["auxin"], [3.0, 4.0, 5.0])
+
+    def test_not_reloaded_when_only_mtime_changes(self):
+        first = self.registry.get("xpp")
+        stat = os.stat(self.filename)
+        os.utime(self.filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch("param_est.reference_data.pd.read_csv", wraps=pd.read_csv) as mock_read_csv:
+            second = self.registry.get("xpp")
+        self.assertIs(first, second)
+        mock_read_csv.assert_not_called()
+
+    def test_invalid_dataset(self):
+        with open(self.filename, "w") as f:
+            f.write("auxin\n1.0\nnan\n")
+        with self.assertRaises(ValueError):
+            self.registry.get("xpp")
+        with self.assertRaises(ValueError):
+            load_vdb_mz_summary(pd.DataFrame({"rank": [1, 2], "auxin_mean": [1.0, 2.0]}))
+
+    def test_unregistered_dataset(self):
+        with self.assertRaises(KeyError):
+            self.registry.get("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
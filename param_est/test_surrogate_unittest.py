@@ -0,0 +1,120 @@
+import os
+import platform
+import tempfile
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from unittest.mock import patch
+import numpy as np
+from param_est.ARORA_genetic_alg import ARORAGeneticAlg
+from param_est.evaluation_log import read_fitness_cache, read_population
+from param_est.surrogate import GaussianProcessSurrogate, SurrogateScreen
+
+
+def smooth_fitness(x):
+    x = np.atleast_2d(x)
+    return -np.sum((x - 0.3) ** 2, axis=1)
+
+
+class TestGaussianProcessSurrogate(unittest.TestCase):
+
+    def test_predicts_smooth_function(self):
+        rng = np.random.default_rng(0)
+        x_train = rng.uniform(0, 1, size=(60, 3))
+        model = GaussianProcessSurrogate()
+        model.fit(x_train, smooth_fitness(x_train))
+        x_test = rng.uniform(0.1, 0.9, size=(20, 3))
+        mean, std = model.predict(x_test)
+        np.testing.assert_allclose(mean, smooth_fitness(x_test), atol=0.02)
+        self.assertEqual(std.shape, (20,))
+
+    def test_uncertainty_grows_away_from_data(self):
+        x_train = np.linspace(0, 1, 10)[:, None]
+        model = GaussianProcessSurrogate(length_scales=(0.1,))
+        model.fit(x_train, smooth_fitness(x_train))
+        _, std_near = model.predict(np.array([[0.5]]))
+        _, std_far = model.predict(np.array([[3.0]]))
+        self.assertLess(std_near[0], std_far[0])
+
+    def test_constant_inputs_and_targets(self):
+        model = GaussianProcessSurrogate()
+        model.fit(np.ones((5, 2)), np.full(5, 2.0))
+        mean, _ = model.predict(np.ones((1, 2)))
+        self.assertAlmostEqual(mean[0], 2.0)
+
+
+class TestSurrogateScreen(unittest.TestCase):
+
+    def test_simulates_everything_until_enough_points(self):
+        screen = SurrogateScreen(min_training_points=5)
+        for x in np.linspace(0, 1, 4):
+            screen.add_observation([x], smooth_fitness([x])[0])
+        simulate, mean, std = screen.screen([0.9], 0)
+        self.assertTrue(simulate)
+        self.assertTrue(np.isnan(mean))
+        self.assertTrue(np.isnan(std))
+
+    def test_screens_out_poor_candidates(self):
+        screen = SurrogateScreen(min_training_points=5, kappa=1.0)
+        for x in np.linspace(0, 1, 21):
+            screen.add_observation([x], smooth_fitness([x])[0])
+        screen.add_observation([0.95], -np.inf)
+        self.assertTrue(screen.screen([0.3], 1)[0])
+        simulate, mean, _ = screen.screen([1.0], 1)
+        self.assertFalse(simulate)
+        self.assertAlmostEqual(mean, smooth_fitness([1.0])[0], delta=0.1)
+
+    def test_refits_once_per_generation(self):
+        screen = SurrogateScreen(min_training_points=5)
+        for x in np.linspace(0, 1, 10):
+            screen.add_observation([x], smooth_fitness([x])[0])
+        with patch.object(screen.model, "fit", wraps=screen.model.fit) as mock_fit:
+            screen.screen([0.5], 0)
+            screen.add_observation([0.55], smooth_fitness([0.55])[0])
+            screen.screen([0.6], 0)
+            self.assertEqual(mock_fit.call_count, 1)
+            screen.screen([0.6], 1)
+            self.assertEqual(mock_fit.call_count, 2)
+            screen.screen([0.6], 2)
+            self.assertEqual(mock_fit.call_count, 2)
+
+
+class TestGASurrogateScreening(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_surrogate_reduces_simulations(self):
+        scale = np.array([0.3, 0.03, 160, 100, 75, 100, 1, 1, 24])
+
+        def fake_run_ARORA(params, chromosome):
+            return -float(np.sum((params.to_numpy(dtype=float) / scale - 0.5) ** 2))
+
+        ga = ARORAGeneticAlg(
+            os.path.join(self.tmpdir.name, "log.jsonl"),
+            "auxsyndeg_only",
+            surrogate=SurrogateScreen(min_training_points=30),
+        )
+        with patch.object(ga, "_run_ARORA", side_effect=fake_run_ARORA) as mock_run:
+            ga.run_genetic_alg(random_seed=2)
+            num_simulations = mock_run.call_count
+        population = read_population(ga.filename)
+        estimated = [c for c in population if c.get("surrogate_estimate", False)]
+        simulated = [c for c in population if not c.get("surrogate_estimate", False)]
+        self.assertGreater(len(estimated), 0)
+        self.assertEqual(
+            num_simulations, len([c for c in simulated if not c.get("reused_fitness", False)])
+        )
+        self.assertTrue(all(c["fitness"] == c["surrogate_mean"] for c in estimated))
+        cache = read_fitness_cache(ga.filename, ga.param_names)
+        self.assertEqual(
+            len(cache), len({tuple(c[p] for p in ga.param_names) for c in simulated})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
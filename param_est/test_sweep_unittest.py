@@ -0,0 +1,156 @@
+import os
+import platform
+import tempfile
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+import pandas as pd
+from main import DEFAULT_PARAM_NAMES, make_default_param_series
+from param_est.sweep import (
+    FAILED,
+    FINISHED,
+    PENDING,
+    SweepStore,
+    default_bounds,
+    latin_hypercube_design,
+    make_design,
+    one_at_a_time_design,
+    run_sweep,
+    sobol_design,
+    sobol_indices,
+)
+
+
+def fake_run_point(params, circ_mod, output_file):
+    if params["k1"] > 100:
+        raise ValueError("Negative Auxin")
+    return {"final_tick": 27, "total_auxin": float(params["k_s"] * 10 + params["k1"])}
+
+
+def crashing_run_point(params, circ_mod, output_file):
+    os._exit(1)
+
+
+def memory_hungry_run_point(params, circ_mod, output_file):
+    np.empty(16 * 1024**3, dtype=np.uint8)
+    return {}
+
+
+class TestSweepDesigns(unittest.TestCase):
+
+    BOUNDS = {"k_s": (0.01, 0.1), "k1": (10, 160), "tau": (1, 24)}
+
+    def test_latin_hypercube_design(self):
+        design = latin_hypercube_design({"a": (0.0, 1.0), "b": (5.0, 10.0)}, 10, seed=0)
+        self.assertEqual(len(design), 10)
+        # Exactly one point in each tenth of every parameter's range
+        self.assertEqual(sorted(np.floor(design["a"] * 10).astype(int)), list(range(10)))
+        self.assertEqual(sorted(np.floor((design["b"] - 5) * 2).astype(int)), list(range(10)))
+
+    def test_integer_params_are_rounded(self):
+        design = latin_hypercube_design(self.BOUNDS, 8, seed=1)
+        self.assertTrue(pd.api.types.is_integer_dtype(design["k1"]))
+        self.assertTrue(pd.api.types.is_integer_dtype(design["tau"]))
+        self.assertTrue(((design["k_s"] >= 0.01) & (design["k_s"] <= 0.1)).all())
+
+    def test_sobol_design_blocks(self):
+        design = sobol_design(self.BOUNDS, 8, seed=2)
+        self.assertEqual(len(design), 8 * (3 + 2))
+        a = design[design["block"] == "A"].reset_index(drop=True)
+        b = design[design["block"] == "B"].reset_index(drop=True)
+        ab = design[design["block"] == "AB_k1"].reset_index(drop=True)
+        pd.testing.assert_series_equal(ab["k1"], b["k1"])
+        pd.testing.assert_series_equal(ab["k_s"], a["k_s"])
+        pd.testing.assert_series_equal(ab["tau"], a["tau"])
+
+    def test_one_at_a_time_design(self):
+        baseline = make_default_param_series()
+        bounds = default_bounds("universal_syndeg")
+        design = one_at_a_time_design(baseline, bounds, 3)
+        self.assertEqual(len(design), 1 + 3 * len(DEFAULT_PARAM_NAMES))
+        for param in DEFAULT_PARAM_NAMES:
+            varied = design[design["block"] == param]
+            others = [p for p in DEFAULT_PARAM_NAMES if p != param]
+            self.assertTrue((varied[others] == design.loc[0, others]).all().all())
+            self.assertAlmostEqual(varied[param].min(), round(bounds[param][0], 10), delta=0.5)
+
+    def test_make_design_rejects_unknown_type(self):
+        with self.assertRaises(ValueError):
+            make_design("grid", "universal_syndeg", 4)
+
+    def test_sobol_indices_of_additive_function(self):
+        design = sobol_design({"x1": (0, 1), "x2": (0, 1)}, 1024, seed=3)
+        design["status"] = FINISHED
+        design["y"] = 4 * design["x1"] + design["x2"]
+        indices = sobol_indices(design, ["x1", "x2"], "y")
+        self.assertAlmostEqual(indices.loc["x1", "first_order"], 16 / 17, delta=0.05)
+        self.assertAlmostEqual(indices.loc["x2", "total"], 1 / 17, delta=0.05)
+
+
+class TestSweepRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = SweepStore(os.path.join(self.tmpdir.name, "results.db"))
+        self.output_dir = os.path.join(self.tmpdir.name, "out")
+        self.design = pd.DataFrame(
+            {"k_s": [0.1, 0.2, 0.3, 0.4], "k1": [50, 60, 150, 70], "block": "lhs"}
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_create_inserts_pending_points(self):
+        self.store.create(self.design, "universal_syndeg")
+        self.assertTrue(self.store.exists())
+        results = self.store.read()
+        self.assertEqual(results["point_id"].tolist(), [0, 1, 2, 3])
+        self.assertTrue((results["status"] == PENDING).all())
+        with self.assertRaises(ValueError):
+            self.store.create(self.design, "universal_syndeg")
+
+    def test_run_and_resume(self):
+        self.store.create(self.design, "universal_syndeg")
+        # Simulate an interrupted sweep where point 0 already finished
+        self.store.record(0, {"status": FINISHED, "total_auxin": -1.0})
+        results = run_sweep(
+            self.store,
+            ["k_s", "k1"],
+            num_workers=2,
+            output_dir=self.output_dir,
+            run_point=fake_run_point,
+        )
+        self.assertEqual(results["status"].tolist(), [FINISHED, FINISHED, FAILED, FINISHED])
+        self.assertEqual(results.loc[0, "total_auxin"], -1.0)
+        self.assertAlmostEqual(results.loc[1, "total_auxin"], 62.0)
+        self.assertIn("Negative Auxin", results.loc[2, "error"])
+        self.assertTrue(results.loc[1:, "runtime_s"].notna().all())
+        self.assertEqual(len(self.store.get_pending()), 0)
+        self.assertEqual(self.store.get_pending(retry_failed=True)["point_id"].tolist(), [2])
+
+    @unittest.skipUnless(platform.system() == "Linux", "address space limits need Linux")
+    def test_memory_limit_fails_run(self):
+        self.store.create(self.design.head(1), "universal_syndeg")
+        results = run_sweep(
+            self.store,
+            ["k_s", "k1"],
+            output_dir=self.output_dir,
+            max_memory_mb=2048,
+            run_point=memory_hungry_run_point,
+        )
+        self.assertEqual(results.loc[0, "status"], FAILED)
+        self.assertIn("MemoryError", results.loc[0, "error"])
+
+    def test_dead_worker_fails_run(self):
+        self.store.create(self.design.head(1), "universal_syndeg")
+        results = run_sweep(
+            self.store, ["k_s", "k1"], output_dir=self.output_dir, run_point=crashing_run_point
+        )
+        self.assertEqual(results.loc[0, "status"], FAILED)
+        self.assertIn("Worker process died", results.loc[0, "error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,18 @@
+import argparse
 from param_est.ARORA_genetic_alg import ARORAGeneticAlg
+from param_est.surrogate import SurrogateScreen
 
 if __name__ == "__main__":
-    ga = ARORAGeneticAlg("param_est/pe_2024110701.json", "auxsyndeg_only")
-    ga.run_genetic_alg()
+    parser = argparse.ArgumentParser(description="Run ARORA parameter estimation")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from the last checkpointed generation, reusing logged fitness values")
+    parser.add_argument("--random_seed", type=int, default=None,
+                        help="Seed for the genetic algorithm's random number generators")
+    parser.add_argument("--surrogate", action="store_true",
+                        help="Only simulate chromosomes a surrogate model predicts are promising or is unsure about")
+    args = parser.parse_args()
+    surrogate = SurrogateScreen() if args.surrogate else None
+    ga = ARORAGeneticAlg("param_est/pe_2024110701.jsonl", "auxsyndeg_only", surrogate=surrogate)
+    ga.run_genetic_alg(resume=args.resume, random_seed=args.random_seed)
     ga.analyze_results()
     exit(0)
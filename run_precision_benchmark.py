@@ -0,0 +1,24 @@
+import argparse
+from param_est.precision_benchmark import run_precision_benchmark
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare ARORA trajectories run with float32 and float64 state arrays"
+    )
+    parser.add_argument("--circ_mod", type=str, default="universal_syndeg",
+                        choices=["universal_syndeg", "indep_syndeg", "aux_syndegonly"],
+                        help="Which circulation module to use")
+    parser.add_argument("--transport_scheme", type=str, default="implicit",
+                        choices=["explicit", "implicit", "subcycled"],
+                        help="How the circulator integrates auxin transport")
+    parser.add_argument("--output_dir", type=str, default="precision_output",
+                        help="Directory for simulation output files")
+    args = parser.parse_args()
+
+    comparison, run_times = run_precision_benchmark(
+        args.circ_mod, args.output_dir, transport_scheme=args.transport_scheme
+    )
+    for dtype, run_time in run_times.items():
+        print(f"{dtype}: {run_time:.1f} s")
+    print(comparison.to_string())
+    exit(0)
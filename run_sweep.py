@@ -0,0 +1,54 @@
+import argparse
+from param_est.sweep import SweepStore, get_param_names, make_design, run_sweep
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run an ARORA parameter sweep")
+    parser.add_argument("--circ_mod", type=str, default="universal_syndeg",
+                        choices=["universal_syndeg", "indep_syndeg", "aux_syndegonly"],
+                        help="Which circulation module to use")
+    parser.add_argument("--design", type=str, default="lhs", choices=["lhs", "sobol", "oat"],
+                        help="Latin hypercube, Saltelli/Sobol or one-at-a-time design")
+    parser.add_argument("--num_points", type=int, default=64,
+                        help="Points (lhs), base points (sobol) or levels per parameter (oat)")
+    parser.add_argument("--factor", type=float, default=2.0,
+                        help="Sweep each parameter from default/factor to default*factor")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the design sampler")
+    parser.add_argument("--results", type=str, default="sweep_results.db",
+                        help="SQLite file holding the results table")
+    parser.add_argument("--output_dir", type=str, default="sweep_output",
+                        help="Directory for simulation output files")
+    parser.add_argument("--workers", type=int, default=1, help="Number of parallel runs")
+    parser.add_argument("--max_memory_mb", type=int, default=None, help="Per-run memory limit")
+    parser.add_argument("--max_cpu_seconds", type=int, default=None, help="Per-run CPU time limit")
+    parser.add_argument("--max_wall_seconds", type=int, default=None,
+                        help="Per-run elapsed time limit")
+    parser.add_argument("--resume", action="store_true",
+                        help="Run the pending points of an existing results table")
+    parser.add_argument("--retry_failed", action="store_true",
+                        help="When resuming, also rerun points whose run failed")
+    parser.add_argument("--keep_output", action="store_true",
+                        help="Keep the simulation output files of every run")
+    args = parser.parse_args()
+
+    store = SweepStore(args.results)
+    if args.resume:
+        if not store.exists():
+            raise ValueError(f"No sweep to resume in {args.results}")
+    else:
+        store.create(
+            make_design(args.design, args.circ_mod, args.num_points, args.seed, args.factor),
+            args.circ_mod,
+        )
+    results = run_sweep(
+        store,
+        get_param_names(args.circ_mod),
+        num_workers=args.workers,
+        output_dir=args.output_dir,
+        max_memory_mb=args.max_memory_mb,
+        max_cpu_seconds=args.max_cpu_seconds,
+        max_wall_seconds=args.max_wall_seconds,
+        retry_failed=args.retry_failed,
+        keep_output=args.keep_output,
+    )
+    print(results["status"].value_counts())
+    exit(0)
@@ -0,0 +1,203 @@
+import heapq
+import math
+from fractions import Fraction
+from typing import TYPE_CHECKING, Hashable, Optional
+
+if TYPE_CHECKING:
+    from src.agent.cell import Cell
+
+
+def find_edge_contacts(edges: list[tuple]) -> list[tuple]:
+    """
+    Finds every pair of facing edges that share a segment of positive length.
+
+    Edges are hashed by the line they lie on. Along each line the edges are sorted by their
+    start and swept once, keeping the edges of each side that are still open in a heap ordered
+    by their end, so T-junctions, where one edge meets several shorter edges, are found without
+    comparing every pair of edges on the line.
+
+    Parameters
+    ----------
+    edges : list[tuple]
+        One (line, side, start, end, owner) tuple per edge, where line is any hashable key of
+        the line the edge lies on, side is 0 or 1 for the two sides of the line the edge's cell
+        lies on, start < end are the edge's endpoints along the line and owner is an orderable
+        identifier of the edge.
+
+    Returns
+    -------
+    list[tuple]
+        One (side 0 owner, side 1 owner, start, end) tuple per pair of facing edges, where start
+        and end bound the segment they share, in the order they are found.
+    """
+    lines: dict[Hashable, list[tuple]] = {}
+    for line, side, start, end, owner in edges:
+        lines.setdefault(line, []).append((start, end, side, owner))
+    contacts = []
+    for line_edges in lines.values():
+        line_edges.sort()
+        open_edges: tuple[list[tuple], list[tuple]] = ([], [])
+        for start, end, side, owner in line_edges:
+            for side_open_edges in open_edges:
+                while side_open_edges and side_open_edges[0][0] <= start:
+                    heapq.heappop(side_open_edges)
+            for other_end, other_owner in open_edges[1 - side]:
+                if side == 0:
+                    contacts.append((owner, other_owner, start, min(end, other_end)))
+                else:
+                    contacts.append((other_owner, owner, start, min(end, other_end)))
+            heapq.heappush(open_edges[side], (end, owner))
+    return contacts
+
+
+def get_cell_edges(cells: list["Cell"]) -> list[tuple]:
+    """
+    Returns the edges of cells in the form used by `find_edge_contacts`.
+
+    Lines are keyed exactly with rational coordinates, by their slope and intercept, or by
+    their x-coordinate if vertical, and positions along a line are x-coordinates, or
+    y-coordinates if the line is vertical. Each edge is owned by the (cell index, edge) pair it
+    belongs to, where the edge is 'a', 'b', 'left' or 'right' for the cell's top, bottom, left
+    and right edges.
+
+    Parameters
+    ----------
+    cells : list[Cell]
+        The cells whose edges are returned.
+
+    Returns
+    -------
+    list[tuple]
+        One (line, side, start, end, owner) tuple per cell edge.
+    """
+    edges = []
+    for index, cell in enumerate(cells):
+        corners = [
+            (Fraction(vertex.get_x()), Fraction(vertex.get_y()))
+            for vertex in cell.get_quad_perimeter().get_vs()
+        ]
+        top_left, top_right, bottom_right, bottom_left = corners
+        centroid_x = sum(x for x, _ in corners) / 4
+        centroid_y = sum(y for _, y in corners) / 4
+        line: tuple[Optional[Fraction], Fraction]
+        for edge, (x1, y1), (x2, y2) in [
+            ("a", top_left, top_right),
+            ("b", bottom_left, bottom_right),
+            ("left", bottom_left, top_left),
+            ("right", bottom_right, top_right),
+        ]:
+            if x1 != x2:
+                slope = (y2 - y1) / (x2 - x1)
+                line = (slope, y1 - slope * x1)
+                side = 0 if centroid_y > slope * centroid_x + line[1] else 1
+                start, end = min(x1, x2), max(x1, x2)
+            elif y1 != y2:
+                line = (None, x1)
+                side = 0 if centroid_x > x1 else 1
+                start, end = min(y1, y2), max(y1, y2)
+            else:
+                continue
+            edges.append((line, side, start, end, (index, edge)))
+    return edges
+
+
+def build_adjacency(
+    cells: list["Cell"], root_midpointx: float
+) -> dict["Cell", list[tuple["Cell", str, float]]]:
+    """
+    Derives every cell's neighbors, their directions and the length of membrane shared with
+    them from the cells' vertices.
+
+    Two cells are neighbors if an edge of one and an edge of the other overlap along a segment
+    of positive length; cells touching only at a corner are not neighbors. A neighbor across a
+    cell's top edge is apical, across its bottom edge basal, and across a side edge lateral or
+    medial depending on which side of the root midpoint that edge faces.
+
+    Parameters
+    ----------
+    cells : list[Cell]
+        The cells to build the adjacency of.
+    root_midpointx : float
+        The x-coordinate of the root midpoint.
+
+    Returns
+    -------
+    dict[Cell, list[tuple[Cell, str, float]]]
+        For each cell, a (neighbor, direction, shared length) tuple per neighbor, ordered as the
+        neighbors are in `cells`.
+    """
+    neighbors: dict[int, dict[int, tuple[str, float]]] = {index: {} for index in range(len(cells))}
+    for owner, other_owner, start, end in find_edge_contacts(get_cell_edges(cells)):
+        shared_length = get_shared_length(cells[owner[0]], owner[1], start, end)
+        for (index, edge), (other_index, _) in [(owner, other_owner), (other_owner, owner)]:
+            direction = get_edge_direction(cells[index], edge, root_midpointx)
+            _, previous_length = neighbors[index].get(other_index, (direction, 0.0))
+            neighbors[index][other_index] = (direction, previous_length + shared_length)
+    return {
+        cells[index]: [
+            (cells[other_index], direction, shared_length)
+            for other_index, (direction, shared_length) in sorted(cell_neighbors.items())
+        ]
+        for index, cell_neighbors in neighbors.items()
+    }
+
+
+def get_edge_direction(cell: "Cell", edge: str, root_midpointx: float) -> str:
+    """
+    Returns the direction of the neighbors across one of a cell's edges.
+
+    Parameters
+    ----------
+    cell : Cell
+        The cell the edge belongs to.
+    edge : str
+        'a', 'b', 'left' or 'right' for the cell's top, bottom, left or right edge.
+    root_midpointx : float
+        The x-coordinate of the root midpoint.
+
+    Returns
+    -------
+    str
+        The direction ('a', 'b', 'l' or 'm') of neighbors across the edge.
+    """
+    if edge == "left":
+        side = cell.get_quad_perimeter().get_left_lateral_or_medial(root_midpointx)
+    elif edge == "right":
+        side = cell.get_quad_perimeter().get_right_lateral_or_medial(root_midpointx)
+    else:
+        return edge
+    return "l" if side == "lateral" else "m"
+
+
+def get_shared_length(cell: "Cell", edge: str, start: Fraction, end: Fraction) -> float:
+    """
+    Returns the length of the part of a cell edge between two positions along its line.
+
+    Parameters
+    ----------
+    cell : Cell
+        The cell the edge belongs to.
+    edge : str
+        'a', 'b', 'left' or 'right' for the cell's top, bottom, left or right edge.
+    start : Fraction
+        Start of the segment along the edge's line, as returned by `find_edge_contacts`.
+    end : Fraction
+        End of the segment along the edge's line.
+
+    Returns
+    -------
+    float
+        The segment's length.
+    """
+    qp = cell.get_quad_perimeter()
+    first, second = {
+        "a": (qp.get_top_left(), qp.get_top_right()),
+        "b": (qp.get_bottom_left(), qp.get_bottom_right()),
+        "left": (qp.get_bottom_left(), qp.get_top_left()),
+        "right": (qp.get_bottom_right(), qp.get_top_right()),
+    }[edge]
+    dx = second.get_x() - first.get_x()
+    dy = second.get_y() - first.get_y()
+    if dx == 0:
+        return float(end - start)
+    return float(end - start) * math.hypot(dx, dy) / abs(dx)
@@ -0,0 +1,200 @@
+import numpy as np
+from src.sim.util.math_helpers import get_state_dtype
+
+
+class ArrDelayLine:
+    """
+    Stores the ARR histories of every cell whose history has a given length in one ring
+    buffer.
+
+    Each cell owns a row of the buffer. All rows share one head, the column holding every
+    row's oldest value, so reading a cell's delayed ARR is a single lookup and recording a tick
+    is one column write for all cells followed by moving the head on by one column. Values
+    pushed during a tick are held per row until `advance` writes them, and every read of a
+    row takes its pending value into account. Values are stored in the state dtype, see
+    `set_state_dtype`, and read back as floats.
+
+    Attributes
+    ----------
+    length : int
+        The number of time points in each history.
+    values : ndarray
+        The ring buffer, one row per allocated cell.
+    newest : ndarray
+        The value pushed to each row since the last `advance`.
+    pushed : ndarray
+        Whether a value was pushed to each row since the last `advance`.
+    live : ndarray
+        Whether each row belongs to a cell.
+    head : int
+        The column of each row's oldest value.
+    free_rows : list[int]
+        Rows released by removed cells, reused before the buffer is grown.
+    n_rows : int
+        The number of rows ever allocated.
+
+    Parameters
+    ----------
+    length : int
+        The number of time points in each history.
+    capacity : int, optional
+        The number of rows allocated up front. Default is 64.
+    """
+
+    length: int
+    values: np.ndarray
+    newest: np.ndarray
+    pushed: np.ndarray
+    live: np.ndarray
+    head: int
+    free_rows: list[int]
+    n_rows: int
+
+    def __init__(self, length: int, capacity: int = 64):
+        if length < 1:
+            raise ValueError("ARR history must hold at least one time point")
+        self.length = length
+        self.values = np.zeros((capacity, length), dtype=get_state_dtype())
+        self.newest = np.zeros(capacity, dtype=get_state_dtype())
+        self.pushed = np.zeros(capacity, dtype=bool)
+        self.live = np.zeros(capacity, dtype=bool)
+        self.head = 0
+        self.free_rows = []
+        self.n_rows = 0
+
+    def add_row(self, history: list[float]) -> int:
+        """
+        Allocates a row for a cell and fills it with the cell's history.
+
+        Parameters
+        ----------
+        history : list[float]
+            The cell's ARR history, oldest first.
+
+        Returns
+        -------
+        int
+            The cell's row.
+        """
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.n_rows == len(self.values):
+                capacity = 2 * len(self.values)
+                self.values = np.resize(self.values, (capacity, self.length))
+                self.newest = np.resize(self.newest, capacity)
+                self.pushed = np.concatenate([self.pushed, np.zeros_like(self.pushed)])
+                self.live = np.concatenate([self.live, np.zeros_like(self.live)])
+            row = self.n_rows
+            self.n_rows += 1
+        self.live[row] = True
+        self.set_history(row, history)
+        return row
+
+    def remove_row(self, row: int) -> None:
+        """
+        Releases a row for reuse by a later cell.
+
+        Parameters
+        ----------
+        row : int
+            The row to release.
+        """
+        self.live[row] = False
+        self.pushed[row] = False
+        self.free_rows.append(row)
+
+    def set_history(self, row: int, history: list[float]) -> None:
+        """
+        Overwrites a row with a history, discarding any pending value.
+
+        Parameters
+        ----------
+        row : int
+            The row to overwrite.
+        history : list[float]
+            The ARR history, oldest first.
+
+        Raises
+        ------
+        ValueError
+            If the history is not `length` long.
+        """
+        if len(history) != self.length:
+            raise ValueError(f"Expected an ARR history of length {self.length}")
+        columns = (self.head + np.arange(self.length)) % self.length
+        self.values[row, columns] = history
+        self.pushed[row] = False
+
+    def get_history(self, row: int) -> list[float]:
+        """
+        Returns a row's history, including its pending value.
+
+        Parameters
+        ----------
+        row : int
+            The row to read.
+
+        Returns
+        -------
+        list[float]
+            The ARR history, oldest first.
+        """
+        columns = (self.head + np.arange(self.length)) % self.length
+        history = self.values[row, columns].tolist()
+        if self.pushed[row]:
+            history = history[1:] + [float(self.newest[row])]
+        return history
+
+    def get_delayed(self, row: int) -> float:
+        """
+        Returns the oldest value of a row's history, including its pending value.
+
+        Parameters
+        ----------
+        row : int
+            The row to read.
+
+        Returns
+        -------
+        float
+            The oldest ARR concentration in the history.
+        """
+        if self.pushed[row]:
+            return self.get_history(row)[0]
+        return float(self.values[row, self.head])
+
+    def push(self, row: int, value: float) -> None:
+        """
+        Records the newest value of a row's history, dropping its oldest value once the tick
+        is advanced. Pushing twice to a row in one tick records both values.
+
+        Parameters
+        ----------
+        row : int
+            The row to push to.
+        value : float
+            The newest ARR concentration.
+        """
+        if self.pushed[row]:
+            self.set_history(row, self.get_history(row))
+        self.newest[row] = value
+        self.pushed[row] = True
+
+    def advance(self) -> None:
+        """
+        Writes the values pushed during the tick into the buffer and moves the head on.
+
+        The pending values overwrite the oldest column, which becomes the newest once the
+        head moves. Live rows without a pending value are rotated so their history is
+        unchanged.
+        """
+        rows = slice(0, self.n_rows)
+        pushed = self.pushed[rows]
+        unpushed = np.flatnonzero(self.live[rows] & ~pushed)
+        self.values[unpushed] = np.roll(self.values[unpushed], 1, axis=1)
+        self.values[rows, self.head] = np.where(
+            pushed, self.newest[rows], self.values[rows, self.head]
+        )
+        self.pushed[rows] = False
+        self.head = (self.head + 1) % self.length
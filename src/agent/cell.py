@@ -87,14 +87,10 @@ class Cell(Sprite):
     ----------
     c_id : int
         The ID of the cell.
-    a_neighbors : list
-        List of apical neighbors.
-    b_neighbors : list
-        List of basal neighbors.
-    l_neighbors : list
-        List of lateral neighbors.
-    m_neighbors : list
-        List of medial neighbors.
+    neighbor_dirs : dict of Cell to str
+        Direction ('a', 'b', 'l' or 'm') of each neighbor, in the order neighbors were added.
+    neighbors_by_dir : dict of str to dict of Cell to None
+        Insertion-ordered neighbors in each direction, used as ordered sets.
     sim : GrowingSim
         The simulation object that calls this cell.
     quad_perimeter : QuadPerimeter
@@ -138,10 +134,13 @@ class Cell(Sprite):
         """
         self.c_id = c_id
         super().__init__()
-        self.a_neighbors: list["Cell"] = []
-        self.b_neighbors: list["Cell"] = []
-        self.l_neighbors: list["Cell"] = []
-        self.m_neighbors: list["Cell"] = []
+        self.neighbor_dirs: dict["Cell", str] = {}
+        self.neighbors_by_dir: dict[str, dict["Cell", None]] = {
+            "a": {},
+            "b": {},
+            "l": {},
+            "m": {},
+        }
         self.sim: "GrowingSim" = simulation
         simulation.increment_next_cell_id()
         self.quad_perimeter = QuadPerimeter(corners)
@@ -310,14 +309,8 @@ class Cell(Sprite):
         """
         if not self.check_if_neighbor(neighbor):
             neighbor_location = self.find_new_neighbor_relative_location(neighbor)
-            if neighbor_location == "a":
-                self.a_neighbors.append(neighbor)
-            elif neighbor_location == "b":
-                self.b_neighbors.append(neighbor)
-            elif neighbor_location == "l":
-                self.l_neighbors.append(neighbor)
-            elif neighbor_location == "m":
-                self.m_neighbors.append(neighbor)
+            if neighbor_location in self.neighbors_by_dir:
+                self._add_neighbor_in_dir(neighbor, neighbor_location)
             elif neighbor_location == "cell no longer root cap cell neighbor":
                 pass
             elif neighbor_location is None:
@@ -375,7 +368,7 @@ class Cell(Sprite):
         list
             The list of apical neighbors.
         """
-        return self.a_neighbors
+        return list(self.neighbors_by_dir["a"])
 
     def get_b_neighbors(self) -> list["Cell"]:
         """
@@ -386,7 +379,7 @@ class Cell(Sprite):
         list
             The list of basal neighbors.
         """
-        return self.b_neighbors
+        return list(self.neighbors_by_dir["b"])
 
     def get_m_neighbors(self) -> list["Cell"]:
         """
@@ -397,7 +390,7 @@ class Cell(Sprite):
         list
             The list of medial neighbors.
         """
-        return self.m_neighbors
+        return list(self.neighbors_by_dir["m"])
 
     def get_l_neighbors(self) -> list["Cell"]:
         """
@@ -408,7 +401,7 @@ class Cell(Sprite):
         list
             The list of lateral neighbors.
         """
-        return self.l_neighbors
+        return list(self.neighbors_by_dir["l"])
 
     def get_all_neighbors(self) -> list["Cell"]:
         """
@@ -419,12 +412,61 @@ class Cell(Sprite):
         list of Cell
             The list of all neighbors.
         """
-        return (
-            self.get_a_neighbors()
-            + self.get_b_neighbors()
-            + self.get_m_neighbors()
-            + self.get_l_neighbors()
-        )
+        return [
+            neighbor
+            for neighbor_dir in ["a", "b", "m", "l"]
+            for neighbor in self.neighbors_by_dir[neighbor_dir]
+        ]
+
+    def get_neighbor_dir(self, cell: "Cell") -> Union[str, None]:
+        """
+        Returns the direction of a neighbor relative to the cell.
+
+        Parameters
+        ----------
+        cell : Cell
+            The neighbor to find the direction of.
+
+        Returns
+        -------
+        str or None
+            The direction of the neighbor ('a', 'b', 'l' or 'm'), or None if the cell is not a
+            neighbor.
+        """
+        return self.neighbor_dirs.get(cell)
+
+    def add_neighbor_in_dir(self, neighbor: "Cell", neighbor_dir: str) -> None:
+        """
+        Adds a neighbor whose direction is already known to the cell's neighbor list for that
+        direction.
+
+        Parameters
+        ----------
+        neighbor : Cell
+            The neighbor to add.
+        neighbor_dir : str
+            The direction of the neighbor ('a', 'b', 'l' or 'm').
+
+        Raises
+        ------
+        ValueError
+            If the direction is not recognized or the neighbor is already a neighbor.
+        """
+        if neighbor_dir not in self.neighbors_by_dir:
+            raise ValueError(f"Neighbor direction {neighbor_dir} not recognized")
+        self._add_neighbor_in_dir(neighbor, neighbor_dir)
+
+    def _add_neighbor_in_dir(self, neighbor: "Cell", neighbor_dir: str) -> None:
+        if neighbor in self.neighbor_dirs:
+            raise ValueError("Neighbor being added twice")
+        self.neighbor_dirs[neighbor] = neighbor_dir
+        self.neighbors_by_dir[neighbor_dir][neighbor] = None
+
+    def _remove_neighbor_in_dir(self, neighbor: "Cell", neighbor_dir: str) -> None:
+        if self.neighbor_dirs.get(neighbor) != neighbor_dir:
+            raise ValueError(f"Cell is not a neighbor in direction {neighbor_dir}")
+        del self.neighbor_dirs[neighbor]
+        del self.neighbors_by_dir[neighbor_dir][neighbor]
 
     def get_sim(self) -> "GrowingSim":
         """
@@ -477,7 +519,7 @@ class Cell(Sprite):
             225,
             311,
         ]
-        self.l_neighbors.append(neighbor)
+        self._add_neighbor_in_dir(neighbor, "l")
 
     def add_m_neighbor(self, neighbor: "Cell") -> None:
         """
@@ -508,7 +550,7 @@ class Cell(Sprite):
             225,
             311,
         ]
-        self.m_neighbors.append(neighbor)
+        self._add_neighbor_in_dir(neighbor, "m")
 
     def remove_m_neighbor(self, neighbor: "Cell") -> None:
         """
@@ -539,7 +581,7 @@ class Cell(Sprite):
             225,
             311,
         ]
-        self.m_neighbors.remove(neighbor)
+        self._remove_neighbor_in_dir(neighbor, "m")
 
     def remove_l_neighbor(self, neighbor: "Cell") -> None:
         """
@@ -570,7 +612,7 @@ class Cell(Sprite):
             225,
             311,
         ]
-        self.l_neighbors.remove(neighbor)
+        self._remove_neighbor_in_dir(neighbor, "l")
 
     def remove_neighbor(self, cell: "Cell") -> None:
         """
@@ -581,16 +623,9 @@ class Cell(Sprite):
         cell : Cell
             The neighbor to remove from the cell's neighbor list.
         """
-        if cell in self.a_neighbors:
-            self.a_neighbors.remove(cell)
-        elif cell in self.b_neighbors:
-            self.b_neighbors.remove(cell)
-        elif cell in self.l_neighbors:
-            self.l_neighbors.remove(cell)
-        elif cell in self.m_neighbors:
-            self.m_neighbors.remove(cell)
-        else:
+        if cell not in self.neighbor_dirs:
             raise ValueError("Non neighbor cell being removed from neighbor list")
+        self._remove_neighbor_in_dir(cell, self.neighbor_dirs[cell])
 
     def check_if_neighbor(self, cell: "Cell") -> bool:
         """
@@ -606,15 +641,7 @@ class Cell(Sprite):
         bool
             True if the cell is a neighbor (in the neighbor lists), False if not.
         """
-        if cell in self.a_neighbors:
-            return True
-        if cell in self.b_neighbors:
-            return True
-        if cell in self.l_neighbors:
-            return True
-        if cell in self.m_neighbors:
-            return True
-        return False
+        return cell in self.neighbor_dirs
 
     def get_area(self) -> float:
         """
@@ -0,0 +1,604 @@
+from typing import Any, Callable, Optional, TYPE_CHECKING, cast
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.agent.circ_module import CirculateModule
+
+FACTOR_KINDS = ("linear", "activation", "inhibition")
+
+
+class Factor:
+    """
+    One factor of a rate law term: a variable itself, or the saturating activation
+    v / (v + K) or inhibition K / (v + K) of a variable v with constant K.
+
+    Attributes
+    ----------
+    kind : str
+        One of `FACTOR_KINDS`.
+    variable : str
+        The species, parameter or input the factor depends on.
+    constant : str | None
+        The parameter K of an activation or inhibition, None for a linear factor.
+    """
+
+    kind: str
+    variable: str
+    constant: Optional[str]
+
+    def __init__(self, kind: str, variable: str, constant: Optional[str] = None):
+        if kind not in FACTOR_KINDS:
+            raise ValueError(f"Unknown factor kind '{kind}', expected one of {FACTOR_KINDS}")
+        if (constant is None) != (kind == "linear"):
+            raise ValueError(f"A {kind} factor takes a constant only if it saturates")
+        self.kind = kind
+        self.variable = variable
+        self.constant = constant
+
+
+def linear(variable: str) -> Factor:
+    """
+    Make a factor equal to a variable.
+    """
+    return Factor("linear", variable)
+
+
+def activation(variable: str, constant: str) -> Factor:
+    """
+    Make a factor variable / (variable + constant), rising from 0 to 1 with the variable.
+    """
+    return Factor("activation", variable, constant)
+
+
+def inhibition(variable: str, constant: str) -> Factor:
+    """
+    Make a factor constant / (variable + constant), falling from 1 to 0 with the variable.
+    """
+    return Factor("inhibition", variable, constant)
+
+
+class Term:
+    """
+    One term of a rate law: a rate parameter times a product of factors, added or subtracted.
+
+    Attributes
+    ----------
+    rate : str | None
+        The rate parameter, or None if the factors alone make up the term.
+    factors : list[Factor]
+        The factors multiplied by the rate, in the order they are evaluated.
+    sign : int
+        1 for a term that is added, such as synthesis, and -1 for one that is subtracted,
+        such as degradation.
+    """
+
+    rate: Optional[str]
+    factors: list[Factor]
+    sign: int
+
+    def __init__(self, rate: Optional[str], factors: list[Factor], sign: int = 1):
+        if sign not in (1, -1):
+            raise ValueError("A term's sign must be 1 or -1")
+        self.rate = rate
+        self.factors = factors
+        self.sign = sign
+
+
+class Transport:
+    """
+    How a species is carried between neighboring cells, see
+    `CirculateModule.get_transport_rates`.
+
+    A cell takes up influx rate times the substrate of each neighbor, where the influx rate is
+    the neighbor's membrane fraction times the influx carrier times the cell's membrane
+    fraction times `influx_rate`, and exports efflux rate times its own substrate, where the
+    efflux rate is its membrane fraction times the efflux carrier on that membrane times
+    `efflux_rate`.
+
+    Attributes
+    ----------
+    substrate : str
+        The species transported.
+    influx_carrier : str
+        The species importing the substrate.
+    influx_rate : str
+        The parameter scaling influx.
+    efflux_carriers : tuple[str, str, str, str]
+        The species exporting the substrate through the apical, basal, lateral and medial
+        membranes.
+    efflux_rate : str
+        The parameter scaling efflux.
+    """
+
+    substrate: str
+    influx_carrier: str
+    influx_rate: str
+    efflux_carriers: tuple[str, str, str, str]
+    efflux_rate: str
+
+    def __init__(
+        self,
+        substrate: str,
+        influx_carrier: str,
+        influx_rate: str,
+        efflux_carriers: tuple[str, str, str, str],
+        efflux_rate: str,
+    ):
+        self.substrate = substrate
+        self.influx_carrier = influx_carrier
+        self.influx_rate = influx_rate
+        self.efflux_carriers = efflux_carriers
+        self.efflux_rate = efflux_rate
+
+
+class CircModelSpec:
+    """
+    A declarative description of a circulation model, compiled by `compile_model`.
+
+    Species, parameters and extra state entries are given as (state key, attribute) pairs:
+    the key names the value in `init_vals` and `get_state`, the attribute the circulation
+    module attribute holding it. Inputs are per-cell values held fixed over a solve, read from
+    the module's `get_model_inputs`.
+
+    Attributes
+    ----------
+    name : str
+        The circulation module name recorded in `get_state`.
+    species : list[tuple[str, str]]
+        The species, in the order of the ODE state.
+    params : list[tuple[str, str]]
+        The parameters, in the order of `get_state`.
+    inputs : list[str]
+        The inputs the rate laws read.
+    rates : dict[str, list[Term]]
+        The terms of each species' rate of change. Species without terms do not change.
+    transport : Transport
+        How the species are carried between cells.
+    extra_state : list[tuple[str, str]]
+        Entries of `get_state` after the parameters that are neither species nor parameters.
+
+    Parameters
+    ----------
+    name : str
+        The circulation module name recorded in `get_state`.
+    species : list[tuple[str, str]]
+        The species, in the order of the ODE state.
+    params : list[tuple[str, str]]
+        The parameters, in the order of `get_state`.
+    inputs : list[str]
+        The inputs the rate laws read.
+    rates : dict[str, list[Term]]
+        The terms of each species' rate of change.
+    transport : Transport
+        How the species are carried between cells.
+    extra_state : list[tuple[str, str]], optional
+        Further entries of `get_state`. Default is the auxin weight and the ARR history.
+    """
+
+    name: str
+    species: list[tuple[str, str]]
+    params: list[tuple[str, str]]
+    inputs: list[str]
+    rates: dict[str, list[Term]]
+    transport: Transport
+    extra_state: list[tuple[str, str]]
+
+    def __init__(
+        self,
+        name: str,
+        species: list[tuple[str, str]],
+        params: list[tuple[str, str]],
+        inputs: list[str],
+        rates: dict[str, list[Term]],
+        transport: Transport,
+        extra_state: Optional[list[tuple[str, str]]] = None,
+    ):
+        self.name = name
+        self.species = species
+        self.params = params
+        self.inputs = inputs
+        self.rates = rates
+        self.transport = transport
+        if extra_state is None:
+            extra_state = [("auxin_w", "auxin_w"), ("arr_hist", "arr_hist")]
+        self.extra_state = extra_state
+
+
+class CompiledCircModel:
+    """
+    A circulation model compiled from a `CircModelSpec`.
+
+    `rhs` and `jacobian` are generated Python functions with the signature `(y, t, p, u)`
+    taken by odeint, where `y` is the state, `p` the parameters from `get_params` and `u`
+    the inputs from `get_inputs`. Each rate law is a single expression, so both functions
+    are vectorized: passed a state of shape (species, cells) and parameters and inputs of
+    shape (cells,), they evaluate every cell at once. `get_rates` stacks such a batch of
+    rates into one (species, cells) array; the Jacobian already has shape
+    (species, species, cells).
+
+    Attributes
+    ----------
+    spec : CircModelSpec
+        The model's specification.
+    species : list[str]
+        The species' state keys, in the order of the ODE state.
+    index : dict[str, int]
+        The position of each species in the ODE state.
+    params : list[str]
+        The parameters' state keys, in the order of `get_params`.
+    inputs : list[str]
+        The inputs, in the order of `get_inputs`.
+    rhs : Callable
+        The rate of change of every species.
+    jacobian : Callable
+        The derivative of every rate with respect to every species.
+    jacobian_pattern : list[tuple[int, int]]
+        The (rate, species) positions of the Jacobian that are not always zero.
+    rhs_source : str
+        The generated source of `rhs`.
+    jacobian_source : str
+        The generated source of `jacobian`.
+    """
+
+    spec: CircModelSpec
+    species: list[str]
+    index: dict[str, int]
+    params: list[str]
+    inputs: list[str]
+    rhs: Callable[..., list]
+    jacobian: Callable[..., np.ndarray]
+    jacobian_pattern: list[tuple[int, int]]
+    rhs_source: str
+    jacobian_source: str
+
+    def __init__(
+        self,
+        spec: CircModelSpec,
+        rhs_source: str,
+        jacobian_source: str,
+        jacobian_pattern: list[tuple[int, int]],
+    ):
+        self.spec = spec
+        self.species = [key for key, _ in spec.species]
+        self.index = {key: index for index, key in enumerate(self.species)}
+        self.params = [key for key, _ in spec.params]
+        self.inputs = list(spec.inputs)
+        self.jacobian_pattern = jacobian_pattern
+        self.rhs_source = rhs_source
+        self.jacobian_source = jacobian_source
+        namespace: dict[str, Any] = {"zeros": np.zeros, "shape": np.shape}
+        exec(compile(rhs_source, f"<{spec.name} rhs>", "exec"), namespace)
+        exec(compile(jacobian_source, f"<{spec.name} jacobian>", "exec"), namespace)
+        self.rhs = namespace["rhs"]
+        self.jacobian = namespace["jacobian"]
+
+    def get_rates(self, y: np.ndarray, p: Any, u: Any) -> np.ndarray:
+        """
+        Evaluate the rates of a batch of cells at once.
+
+        Parameters
+        ----------
+        y : ndarray
+            The state of each cell, of shape (species, cells).
+        p : array_like
+            Each parameter, a float or an array of shape (cells,).
+        u : array_like
+            Each input, a float or an array of shape (cells,).
+
+        Returns
+        -------
+        ndarray
+            The rate of change of each species in each cell, of shape (species, cells).
+        """
+        return np.array(np.broadcast_arrays(*self.rhs(y, 0.0, p, u), y[0]))[:-1]
+
+    def get_state_vector(self, module: "CirculateModule") -> list[float]:
+        """
+        Read a circulation module's species in the order of the ODE state.
+
+        Parameters
+        ----------
+        module : CirculateModule
+            The circulation module.
+
+        Returns
+        -------
+        list[float]
+            The module's species concentrations.
+        """
+        return [getattr(module, attribute) for _, attribute in self.spec.species]
+
+    def get_params(self, module: "CirculateModule") -> tuple[float, ...]:
+        """
+        Read a circulation module's parameters in the order `rhs` and `jacobian` take them.
+
+        Parameters
+        ----------
+        module : CirculateModule
+            The circulation module.
+
+        Returns
+        -------
+        tuple[float, ...]
+            The module's parameters.
+        """
+        return tuple(getattr(module, attribute) for _, attribute in self.spec.params)
+
+    def get_inputs(self, module: "CirculateModule") -> tuple[float, ...]:
+        """
+        Read a circulation module's inputs in the order `rhs` and `jacobian` take them.
+
+        Parameters
+        ----------
+        module : CirculateModule
+            The circulation module.
+
+        Returns
+        -------
+        tuple[float, ...]
+            The module's inputs, see `CirculateModule.get_model_inputs`.
+        """
+        inputs = module.get_model_inputs()
+        return tuple(inputs[name] for name in self.inputs)
+
+    def get_state(self, module: "CirculateModule") -> dict[str, Any]:
+        """
+        Collect a circulation module's state: its species, parameters and extra state, keyed
+        as in `init_vals`, followed by the model's name.
+
+        Parameters
+        ----------
+        module : CirculateModule
+            The circulation module.
+
+        Returns
+        -------
+        dict[str, Any]
+            The module's state.
+        """
+        state = {}
+        for key, attribute in self.spec.species + self.spec.params + self.spec.extra_state:
+            state[key] = getattr(module, attribute)
+        state["circ_mod"] = self.spec.name
+        return state
+
+    def transport_rates(
+        self,
+        y: Any,
+        p: Any,
+        membranes: np.ndarray,
+        memfracs: np.ndarray,
+        neighbor_memfracs: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the influx and efflux rates of the model's `Transport` across a batch of
+        membranes.
+
+        Parameters
+        ----------
+        y : array_like
+            The state of the cell, or of one cell per membrane.
+        p : array_like
+            The parameters of the cell, or of one cell per membrane.
+        membranes : ndarray
+            The membrane of each transport, 0, 1, 2 or 3 for apical, basal, lateral and medial.
+        memfracs : ndarray
+            The fraction of the cell's membrane shared with each neighbor.
+        neighbor_memfracs : ndarray
+            The fraction of each neighbor's membrane shared with the cell.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray]
+            The influx and efflux rate of each transport.
+        """
+        transport = self.spec.transport
+        influx_carrier = y[self.index[transport.influx_carrier]]
+        efflux_carriers = np.array([y[self.index[key]] for key in transport.efflux_carriers])
+        influx_rate = p[self.params.index(transport.influx_rate)]
+        efflux_rate = p[self.params.index(transport.efflux_rate)]
+        if efflux_carriers.ndim == 1:
+            efflux_carrier = efflux_carriers[membranes]
+        else:
+            efflux_carrier = efflux_carriers[membranes, np.arange(len(membranes))]
+        influx = neighbor_memfracs * (influx_carrier * memfracs) * influx_rate
+        efflux = memfracs * (efflux_carrier * efflux_rate)
+        return influx, efflux
+
+
+def _get_symbols(spec: CircModelSpec) -> dict[str, str]:
+    # Map every name a rate law may read to the expression that reads it
+    symbols = {}
+    groups = [
+        ("y", [key for key, _ in spec.species]),
+        ("p", [key for key, _ in spec.params]),
+        ("u", spec.inputs),
+    ]
+    for array, names in groups:
+        for index, name in enumerate(names):
+            if name in symbols:
+                raise ValueError(f"'{name}' is declared more than once")
+            symbols[name] = f"{array}[{index}]"
+    return symbols
+
+
+def _factor_source(factor: Factor, symbols: dict[str, str]) -> str:
+    variable = symbols[factor.variable]
+    if factor.kind == "linear":
+        return variable
+    constant = symbols[cast(str, factor.constant)]
+    if factor.kind == "activation":
+        return f"({variable} / ({variable} + {constant}))"
+    return f"({constant} / ({variable} + {constant}))"
+
+
+def _derivative_source(factor: Factor, symbols: dict[str, str]) -> tuple[int, Optional[str]]:
+    # The sign and source of a factor's derivative with respect to its variable, the source
+    # left unparenthesized so it multiplies into the term left to right. None stands for 1.
+    if factor.kind == "linear":
+        return 1, None
+    variable = symbols[factor.variable]
+    constant = symbols[cast(str, factor.constant)]
+    sign = 1 if factor.kind == "activation" else -1
+    return sign, f"{constant} / ({variable} + {constant}) ** 2"
+
+
+def _product_source(sign: int, parts: list[str]) -> tuple[int, str]:
+    return sign, " * ".join(parts) if parts else "1.0"
+
+
+def _sum_source(products: list[tuple[int, str]]) -> str:
+    if not products:
+        return "0.0"
+    sign, source = products[0]
+    total = f"-{source}" if sign < 0 else source
+    for sign, source in products[1:]:
+        total += f" - {source}" if sign < 0 else f" + {source}"
+    return total
+
+
+def _check_spec(spec: CircModelSpec, symbols: dict[str, str]) -> None:
+    species = [key for key, _ in spec.species]
+    params = [key for key, _ in spec.params]
+    for key in spec.rates:
+        if key not in species:
+            raise ValueError(f"Rate given for unknown species '{key}'")
+    for key, terms in spec.rates.items():
+        for term in terms:
+            if term.rate is not None and term.rate not in params:
+                raise ValueError(f"Rate of '{key}' uses unknown parameter '{term.rate}'")
+            for factor in term.factors:
+                if factor.variable not in symbols:
+                    raise ValueError(f"Rate of '{key}' uses unknown variable '{factor.variable}'")
+                if factor.constant is not None and factor.constant not in params:
+                    raise ValueError(f"Rate of '{key}' uses unknown parameter '{factor.constant}'")
+    transport = spec.transport
+    for key in (transport.substrate, transport.influx_carrier, *transport.efflux_carriers):
+        if key not in species:
+            raise ValueError(f"Transport uses unknown species '{key}'")
+    for key in (transport.influx_rate, transport.efflux_rate):
+        if key not in params:
+            raise ValueError(f"Transport uses unknown parameter '{key}'")
+
+
+def compile_model(spec: CircModelSpec) -> CompiledCircModel:
+    """
+    Compile a circulation model specification into vectorized rate and Jacobian functions.
+
+    Each species' rate is generated as one expression, its terms evaluated in the order they
+    are declared and each term's factors left to right after its rate. The Jacobian is
+    generated from the same terms by the product rule, with one assignment per entry that is
+    not always zero.
+
+    Parameters
+    ----------
+    spec : CircModelSpec
+        The model to compile.
+
+    Returns
+    -------
+    CompiledCircModel
+        The compiled model.
+
+    Raises
+    ------
+    ValueError
+        If the specification declares a name twice or uses one it does not declare.
+    """
+    symbols = _get_symbols(spec)
+    _check_spec(spec, symbols)
+    species = [key for key, _ in spec.species]
+
+    rates = []
+    derivatives: dict[tuple[int, int], list[tuple[int, str]]] = {}
+    for row, key in enumerate(species):
+        products = []
+        for term in spec.rates.get(key, []):
+            rate = [symbols[term.rate]] if term.rate is not None else []
+            factors = [_factor_source(factor, symbols) for factor in term.factors]
+            products.append(_product_source(term.sign, rate + factors))
+            for position, factor in enumerate(term.factors):
+                if factor.variable not in species:
+                    continue
+                sign, derivative = _derivative_source(factor, symbols)
+                others = factors[:position] + factors[position + 1 :]
+                if derivative is not None:
+                    others.insert(position, derivative)
+                column = species.index(factor.variable)
+                derivatives.setdefault((row, column), []).append(
+                    _product_source(term.sign * sign, rate + others)
+                )
+        rates.append(_sum_source(products))
+
+    rhs_lines = ["def rhs(y, t, p, u):", "    return ["]
+    rhs_lines += [f"        {rate}," for rate in rates]
+    rhs_lines += ["    ]", ""]
+    n_species = len(species)
+    jacobian_lines = [
+        "def jacobian(y, t, p, u):",
+        f"    jac = zeros(({n_species}, {n_species}) + shape(y[0]))",
+    ]
+    pattern = sorted(derivatives)
+    for row, column in pattern:
+        jacobian_lines.append(f"    jac[{row}, {column}] = {_sum_source(derivatives[row, column])}")
+    jacobian_lines += ["    return jac", ""]
+    return CompiledCircModel(spec, "\n".join(rhs_lines), "\n".join(jacobian_lines), pattern)
+
+
+# The species, parameters, inputs and transport shared by the circulation modules
+
+CIRC_SPECIES = [
+    ("auxin", "auxin"),
+    ("arr", "arr"),
+    ("al", "auxlax"),
+    ("pin", "pin"),
+    ("pina", "pina"),
+    ("pinb", "pinb"),
+    ("pinl", "pinl"),
+    ("pinm", "pinm"),
+]
+
+CIRC_PARAMS = [
+    ("k1", "k_arr_arr"),
+    ("k2", "k_auxin_auxlax"),
+    ("k3", "k_auxin_pin"),
+    ("k4", "k_arr_pin"),
+    ("k5", "k_al"),
+    ("k6", "k_pin"),
+]
+
+CIRC_INPUTS = [
+    "auxin_w",
+    "arr_delayed",
+    "pin_start",
+    "pin_weight_a",
+    "pin_weight_b",
+    "pin_weight_l",
+    "pin_weight_m",
+]
+
+PIN_TRANSPORT = Transport("auxin", "al", "k5", ("pina", "pinb", "pinl", "pinm"), "k6")
+
+
+def membrane_pin_rates(kd_pinloc: str) -> dict[str, list[Term]]:
+    """
+    Make the rate laws of the membrane PINs: each membrane takes its PIN weight of the
+    unlocalized PIN and degrades its own PIN at rate `kd_pinloc`.
+
+    Parameters
+    ----------
+    kd_pinloc : str
+        The degradation rate parameter of localized PIN.
+
+    Returns
+    -------
+    dict[str, list[Term]]
+        The terms of the apical, basal, lateral and medial PIN rates.
+    """
+    return {
+        key: [
+            Term(None, [linear(f"pin_weight_{direction}"), linear("pin")]),
+            Term(kd_pinloc, [linear(key)], sign=-1),
+        ]
+        for key, direction in zip(["pina", "pinb", "pinl", "pinm"], ["a", "b", "l", "m"])
+    }
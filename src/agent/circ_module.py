@@ -3,12 +3,20 @@ from abc import ABC, abstractmethod
 import numpy as np
 from typing import TYPE_CHECKING
 from scipy.integrate import odeint
-from src.sim.util.math_helpers import round_to_sf
+from src.sim.util.math_helpers import round_geometry, round_in_stage, round_stage_output
 from src.loc.quad_perimeter.quad_perimeter import get_len_perimeter_in_common
+from src.sim.circulator.circulator import RATE_TRANSPORT_SCHEMES
 
 if TYPE_CHECKING:
+    from src.agent.arr_delay_line import ArrDelayLine
+    from src.agent.circ_model import CompiledCircModel
     from src.agent.cell import Cell
 
+# Fraction of the last step of a cell's solve that its next solve starts from under warm
+# starts. LSODA restarts every solve at order one, which needs a much smaller step than the
+# higher order steps a solve ends with.
+WARM_START_STEP_FRACTION = 0.01
+
 
 class CirculateModule(ABC):
 
@@ -31,8 +39,21 @@ class CirculateModule(ABC):
     k_al: float
     k_pin: float
     auxin_w: float
-    arr_hist: List[float]
+    # The ARR history is stored in a row of a delay line shared with the simulation's other
+    # cells, see the `arr_hist` property
+    arr_delay_line: "ArrDelayLine | None" = None
+    arr_row: int
     output_list: List[str] = []
+    # The module's kinetics, compiled from its declarative specification, see circ_model.py
+    model: "CompiledCircModel"
+    # Relative and absolute error tolerances of the ODE solver, odeint's defaults unless a
+    # module overrides them
+    ode_rtol: float = 1.49012e-8
+    ode_atol: float = 1.49012e-8
+    # Whether each solve starts from the step size the cell's last solve ended with, see
+    # `set_ode_warm_start`, and that step size, 0 before the cell's first solve
+    ode_warm_start: bool = False
+    ode_step: float = 0.0
 
     @abstractmethod
     def __init__(self, cell: "Cell", init_vals: Dict[str, Any]) -> None:
@@ -118,9 +139,10 @@ class CirculateModule(ABC):
                 pin_weights_dict[direction] = val / pin_sum
             return pin_weights_dict
 
-    def f(self, y: list[float], t: float) -> list[float]:
+    def rates(self, y: list[float], t: float) -> list[float]:
         """
-        Define the model's differential equations.
+        Calculate the rates of change of the model variables, as generated by the module's
+        compiled `model`.
 
         Parameters
         ----------
@@ -136,63 +158,66 @@ class CirculateModule(ABC):
             The derivatives of the model variables, representing the rate of change
             of each variable at time `t`.
         """
-
-        # Variable unpacking for clarity
-        auxini = y[0]
-        arri = y[1]
-        ali = y[2]
-        pini = y[3]
-        pinai = y[4]
-        pinbi = y[5]
-        pinli = y[6]
-        pinmi = y[7]
-
-        # the model equations
-        # auxin
-        f0 = self.calculate_auxin(auxini)
-        # arr
-        f1 = self.calculate_arr(arri)
-        # al
-        f2 = self.calculate_auxlax(auxini, ali)
-        # pin
-        f3 = self.calculate_pin(auxini, arri)
-        # neighbor pin
-        f4 = self.calculate_membrane_pin(pini, pinai, "a", cast(float, self.pin_weights.get("a")))
-        f5 = self.calculate_membrane_pin(pini, pinbi, "b", cast(float, self.pin_weights.get("b")))
-        f6 = self.calculate_membrane_pin(pini, pinli, "l", cast(float, self.pin_weights.get("l")))
-        f7 = self.calculate_membrane_pin(pini, pinmi, "m", cast(float, self.pin_weights.get("m")))
-
-        return [f0, f1, f2, f3, f4, f5, f6, f7]
+        return self.model.rhs(y, t, self.model.get_params(self), self.model.get_inputs(self))
 
     def solve_equations(self, time_step: float = 0.001, duration: float = 1.0) -> np.ndarray:
         """
-        Solve the model's differential equations over a given time span with a specified time step.
+        Solve the model's differential equations for the first time step of a given time span.
+
+        This module's updates read the state one time step into the span, so only that point
+        is requested from the solver instead of every time step of the span. The solver still
+        chooses its own internal steps within the module's `ode_rtol` and `ode_atol`. It
+        evaluates the rates and, when it switches to its stiff method, the analytic Jacobian
+        through the module's compiled `model`.
 
         Parameters
         ----------
         time_step : float
             The time step for the ODE solver. Default is 0.001 hours.
         duration : float
-            The total duration for the simulation. Default is 1.0 hours.
+            The total duration of the time span. Default is 1.0 hours.
 
         Returns
         -------
         ndarray
-            An array containing the solution of the differential equations at each time step.
-            Each row corresponds to a time step, and each column corresponds to one of the model variables.
-        """
-        y0 = [
-            self.get_auxin(),
-            self.get_arr(),
-            self.get_auxlax(),
-            self.get_pin(),
-            self.get_apical_pin(),
-            self.get_basal_pin(),
-            self.get_lateral_pin(),
-            self.get_medial_pin(),
-        ]
-        t = np.linspace(0, duration, int(duration / time_step) + 1)
-        soln = odeint(self.f, y0, t)
+            A 2 x 8 array holding the initial state and the state after `time_step`. Each
+            column corresponds to one of the model variables.
+        """
+        t = [0.0, min(time_step, duration)]
+        return self.integrate(t)
+
+    def integrate(self, t: list[float]) -> np.ndarray:
+        """
+        Integrate the compiled `model` from the module's current state, recording the last
+        step size the solver accepted in `ode_step`.
+
+        Under warm starts the solve's first step is `WARM_START_STEP_FRACTION` of the step
+        the cell's last solve ended with, rather than the step the solver sizes from the
+        state's derivatives.
+
+        Parameters
+        ----------
+        t : list[float]
+            The times to return the state at, starting with the initial time.
+
+        Returns
+        -------
+        ndarray
+            The state at each time in `t`, one row per time.
+        """
+        h0 = self.ode_step * WARM_START_STEP_FRACTION if self.ode_warm_start else 0.0
+        soln, info = odeint(
+            self.model.rhs,
+            self.model.get_state_vector(self),
+            t,
+            args=(self.model.get_params(self), self.model.get_inputs(self)),
+            Dfun=self.model.jacobian,
+            rtol=self.ode_rtol,
+            atol=self.ode_atol,
+            h0=h0,
+            full_output=True,
+        )
+        self.ode_step = float(info["hu"][-1])
         return soln
 
     def update(self) -> None:
@@ -220,26 +245,49 @@ class CirculateModule(ABC):
         self.update_circ_contents(soln)
 
     @abstractmethod
-    def calculate_auxin(self, auxin: float) -> float:
+    def calculate_steady_state(self, auxin: float) -> tuple[np.ndarray, np.ndarray]:
         pass
 
-    @abstractmethod
-    def calculate_arr(self, arr: float) -> float:
-        pass
+    def jacobian(self, y: list[float], t: float) -> np.ndarray:
+        """
+        Calculate the Jacobian of the model's differential equations, as generated by the
+        module's compiled `model`.
 
-    @abstractmethod
-    def calculate_auxlax(self, auxin: float, auxlax: float) -> float:
-        pass
+        Parameters
+        ----------
+        y : list[float]
+            The current values of the model variables, ordered as in `rates`.
+        t : float
+            The current simulation time.
 
-    @abstractmethod
-    def calculate_pin(self, auxin: float, arr: float) -> float:
-        pass
+        Returns
+        -------
+        ndarray
+            An 8 x 8 array whose element [i, j] is the derivative of `rates(y, t)[i]` with
+            respect to `y[j]`.
+        """
+        return self.model.jacobian(y, t, self.model.get_params(self), self.model.get_inputs(self))
 
-    @abstractmethod
-    def calculate_membrane_pin(
-        self, pin: float, membrane_pin: float, direction: str, weight: float
-    ) -> float:
-        pass
+    def get_model_inputs(self) -> Dict[str, float]:
+        """
+        Get the values the rate laws read that are held fixed over a solve.
+
+        Returns
+        -------
+        dict[str, float]
+            The auxin weight, the delayed ARR concentration regulating ARR synthesis, the
+            unlocalized PIN level at the start of the solve, which PIN degradation uses, and
+            the PIN weight of each membrane, keyed as in `CIRC_INPUTS` of circ_model.py.
+        """
+        return {
+            "auxin_w": self.auxin_w,
+            "arr_delayed": self.get_delayed_arr(),
+            "pin_start": self.pin,
+            "pin_weight_a": cast(float, self.pin_weights.get("a")),
+            "pin_weight_b": cast(float, self.pin_weights.get("b")),
+            "pin_weight_l": cast(float, self.pin_weights.get("l")),
+            "pin_weight_m": cast(float, self.pin_weights.get("m")),
+        }
 
     def calculate_neighbor_memfrac(self, neighbor: "Cell") -> float:
         """
@@ -269,7 +317,7 @@ class CirculateModule(ABC):
             )
             raise e
         memfrac = common_perimeter / cell_perimeter
-        return round_to_sf(memfrac, 6)
+        return round_geometry(memfrac, 6)
 
     def get_aux_exchange_across_membrane(
         self, al: float, pindi: float, neighbors: list
@@ -321,9 +369,65 @@ class CirculateModule(ABC):
                 print(
                     f"HERE cell {self.cell.get_c_id()} neighbor {neighbor.get_c_id()} auxin exchange {neighbor_aux_exchange}"
                 )
-            neighbor_dict[neighbor] = round_to_sf(neighbor_aux_exchange, 5)
+            neighbor_dict[neighbor] = round_in_stage(neighbor_aux_exchange, 5)
         return neighbor_dict
 
+    def get_transport_rates(self) -> list[tuple["Cell", float, float]]:
+        """
+        Calculate the rates at which auxin is transported between the current cell and each
+        of its neighbors, as used by `get_aux_exchange_across_membrane`.
+
+        Returns
+        -------
+        list[tuple[Cell, float, float]]
+            One (neighbor, influx rate, efflux rate) tuple per neighbor. Each tick the cell
+            takes up influx rate times the neighbor's auxin from the neighbor and exports
+            efflux rate times its own auxin to it.
+        """
+        all_neighbors = []
+        membranes = []
+        memfracs = []
+        neighbor_memfracs = []
+        for membrane, neighbors in enumerate(self.get_neighbors()):
+            for neighbor in neighbors:
+                all_neighbors.append(neighbor)
+                membranes.append(membrane)
+                memfracs.append(self.calculate_neighbor_memfrac(neighbor))
+                neighbor_memfracs.append(
+                    neighbor.get_circ_mod().calculate_neighbor_memfrac(self.cell)
+                )
+        influx_rates, efflux_rates = self.model.transport_rates(
+            self.model.get_state_vector(self),
+            self.model.get_params(self),
+            np.array(membranes, dtype=int),
+            np.array(memfracs, dtype=float),
+            np.array(neighbor_memfracs, dtype=float),
+        )
+        return list(zip(all_neighbors, influx_rates.tolist(), efflux_rates.tolist()))
+
+    def get_transport_coefficients(self) -> list[tuple["Cell", int, float, float]]:
+        """
+        Calculate the parts of the transport rates of `get_transport_rates` that depend only
+        on the geometry of the current cell and its neighbors.
+
+        Returns
+        -------
+        list[tuple[Cell, int, float, float]]
+            One (neighbor, membrane, influx coefficient, efflux coefficient) tuple per
+            neighbor, where membrane is 0, 1, 2 or 3 for the apical, basal, lateral and medial
+            membranes. The influx rate is the influx coefficient times the cell's AUX/LAX and
+            the efflux rate the efflux coefficient times its PIN on that membrane.
+        """
+        coefficients = []
+        for membrane, neighbors in enumerate(self.get_neighbors()):
+            for neighbor in neighbors:
+                memfrac = self.calculate_neighbor_memfrac(neighbor)
+                neighbor_memfrac = neighbor.get_circ_mod().calculate_neighbor_memfrac(self.cell)
+                influx_coefficient = neighbor_memfrac * memfrac * self.k_al
+                efflux_coefficient = memfrac * self.k_pin
+                coefficients.append((neighbor, membrane, influx_coefficient, efflux_coefficient))
+        return coefficients
+
     def calculate_delta_auxin(self, syn_deg_auxin: float, neighbors_auxin: list) -> float:
         """
         Calculate the total amount of change in auxin concentration for the current
@@ -359,16 +463,11 @@ class CirculateModule(ABC):
 
     def update_arr_hist(self) -> None:
         """
-        Update the history of ARR concentrations in the cell. This method shifts
-        each element in the ARR history list one position to the left and updates
-        the last element with the current ARR concentration, effectively recording
-        the most recent state of ARR concentration.
+        Update the history of ARR concentrations in the cell. This method drops the
+        oldest ARR concentration from the history and appends the current ARR
+        concentration, effectively recording the most recent state of ARR concentration.
         """
-        for i, elem in enumerate(self.arr_hist):
-            if i != 0:
-                self.arr_hist[i - 1] = elem
-            if i == (len(self.arr_hist) - 1):
-                self.arr_hist[i] = self.arr
+        cast("ArrDelayLine", self.arr_delay_line).push(self.arr_row, self.arr)
 
     def update_circ_contents(self, soln: np.ndarray) -> None:
         """
@@ -381,15 +480,16 @@ class CirculateModule(ABC):
         soln : ndarray
             The solution of the differential equations, where each row represents a
             different time point and columns represent the concentrations of different
-            substances at that time point.
-        """
-        self.arr = round_to_sf(soln[1, 1], 5)
-        self.auxlax = round_to_sf(soln[1, 2], 5)
-        self.pin = round_to_sf(soln[1, 3], 5) - self.pin
-        self.pina = round_to_sf(soln[1, 4], 5)
-        self.pinb = round_to_sf(soln[1, 5], 5)
-        self.pinl = round_to_sf(soln[1, 6], 5)
-        self.pinm = round_to_sf(soln[1, 7], 5)
+            substances at that time point. The last row is taken as the cell's new state.
+        """
+        arr, auxlax, pin, pina, pinb, pinl, pinm = round_stage_output(soln[-1, 1:8], 5)
+        self.arr = arr
+        self.auxlax = auxlax
+        self.pin = pin - self.pin
+        self.pina = pina
+        self.pinb = pinb
+        self.pinl = pinl
+        self.pinm = pinm
         self.update_arr_hist()
 
     def update_neighbor_auxin(self, neighbors_auxin: list[dict]) -> None:
@@ -436,7 +536,8 @@ class CirculateModule(ABC):
         ----------
         soln : np.ndarray
             The solution to the differential equations, providing the dynamic state of the system
-            including auxin levels at the current time step.
+            including auxin levels at the current time step. The last row is taken as the
+            state at the end of the time step.
 
         Raises
         ------
@@ -445,6 +546,13 @@ class CirculateModule(ABC):
             parameters or the numerical solution.
         """
         curr_cell = self.cell
+        circulator = curr_cell.get_sim().get_circulator()
+
+        # Unless transport is explicit the circulator integrates it from the transport rates
+        if circulator.get_transport_scheme() in RATE_TRANSPORT_SCHEMES:
+            circulator.add_delta(curr_cell, round_in_stage(soln[-1, 0] - self.auxin, 5))
+            circulator.add_transport_rates(curr_cell, self.get_transport_rates())
+            return
 
         # Retrieve neighbors for auxin exchange
         neighborsa, neighborsb, neighborsl, neighborsm = self.get_neighbors()
@@ -462,14 +570,14 @@ class CirculateModule(ABC):
         ]
 
         # Compute net auxin synthesized and degraded at this time step
-        auxin_synthesized_and_degraded_this_timestep = soln[1, 0] - self.auxin
+        auxin_synthesized_and_degraded_this_timestep = soln[-1, 0] - self.auxin
 
         delta_auxin = self.calculate_delta_auxin(
             auxin_synthesized_and_degraded_this_timestep, neighbors_auxin_exchange
         )
 
         # Update current cell auxin
-        curr_cell.get_sim().get_circulator().add_delta(curr_cell, round_to_sf(delta_auxin, 5))
+        circulator.add_delta(curr_cell, round_in_stage(delta_auxin, 5))
 
         # Update auxin levels in neighbor cells
         self.update_neighbor_auxin(neighbors_auxin_exchange)
@@ -508,6 +616,38 @@ class CirculateModule(ABC):
         """
         return self.auxlax
 
+    def get_al(self) -> float:
+        """
+        Get the AUX/LAX expression in the cell.
+
+        Returns
+        -------
+        float
+            The AUX/LAX expression in the cell.
+        """
+        return self.auxlax
+
+    @property
+    def arr_hist(self) -> List[float]:
+        """
+        The history of ARR concentrations in the cell, oldest first.
+
+        The history is kept in the row `arr_row` of the simulation's delay line for histories
+        of its length. Setting it overwrites that row, moving the cell to another delay line
+        if the length changes.
+        """
+        return cast("ArrDelayLine", self.arr_delay_line).get_history(self.arr_row)
+
+    @arr_hist.setter
+    def arr_hist(self, arr_hist: List[float]) -> None:
+        if self.arr_delay_line is not None:
+            if self.arr_delay_line.length == len(arr_hist):
+                self.arr_delay_line.set_history(self.arr_row, arr_hist)
+                return
+            self.arr_delay_line.remove_row(self.arr_row)
+        self.arr_delay_line = self.cell.get_sim().get_arr_delay_line(len(arr_hist))
+        self.arr_row = self.arr_delay_line.add_row(arr_hist)
+
     def get_arr_hist(self) -> list[float]:
         """
         Get the ARR history list.
@@ -519,6 +659,26 @@ class CirculateModule(ABC):
         """
         return self.arr_hist
 
+    def get_delayed_arr(self) -> float:
+        """
+        Get the oldest ARR concentration in the ARR history, which regulates ARR synthesis.
+
+        Returns
+        -------
+        float
+            The oldest ARR concentration in the ARR history.
+        """
+        return cast("ArrDelayLine", self.arr_delay_line).get_delayed(self.arr_row)
+
+    def remove_arr_hist(self) -> None:
+        """
+        Release the cell's row of the ARR delay line, once the cell is removed from the
+        simulation.
+        """
+        if self.arr_delay_line is not None:
+            self.arr_delay_line.remove_row(self.arr_row)
+            self.arr_delay_line = None
+
     def get_auxin_w(self) -> float:
         """
         Get the weight of auxin synthesis.
@@ -611,9 +771,21 @@ class CirculateModule(ABC):
             return self.pinm
         return self.pinl
 
-    @abstractmethod
     def get_state(self) -> Dict[str, Any]:
-        pass
+        """
+        Retrieve the current state of the circulate module.
+
+        The entries are laid out by the module's compiled `model`: the concentrations of the
+        species, the kinetic parameters, the auxin weight, the history of ARR concentrations
+        and the module's name.
+
+        Returns
+        -------
+        dict[str, Any]
+            A dictionary containing key-value pairs of attribute names and their
+            current values, keyed as in `init_vals`.
+        """
+        return self.model.get_state(self)
 
     def set_auxin(self, new_aux: float) -> None:
         """
@@ -626,6 +798,28 @@ class CirculateModule(ABC):
         """
         self.auxin = new_aux
 
+    def set_steady_state(self, state: np.ndarray) -> None:
+        """
+        Set every species in the cell to a steady state, as returned by
+        `calculate_steady_state`, filling the ARR history with the steady ARR concentration.
+
+        Parameters
+        ----------
+        state : ndarray
+            The steady concentrations of auxin, ARR, AUX/LAX, unlocalized PIN and apical,
+            basal, lateral and medial PIN, in that order.
+        """
+        auxin, arr, auxlax, pin, pina, pinb, pinl, pinm = (float(value) for value in state)
+        self.auxin = auxin
+        self.arr = arr
+        self.auxlax = auxlax
+        self.pin = pin
+        self.pina = pina
+        self.pinb = pinb
+        self.pinl = pinl
+        self.pinm = pinm
+        self.arr_hist = [arr] * len(self.arr_hist)
+
     def get_pin_weights(self) -> dict[str, float]:
         """
         Get the weights of PIN localized in each membrane direction.
@@ -651,3 +845,16 @@ class CirculateModule(ABC):
         self.right = self.cell.get_quad_perimeter().get_right_lateral_or_medial(
             self.cell.get_sim().get_root_midpointx()
         )
+
+
+def set_ode_warm_start(enabled: bool) -> None:
+    """
+    Set whether every cell's ODE solve starts from the step size its previous solve ended
+    with, instead of sizing its first step from scratch.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether solves are warm started.
+    """
+    CirculateModule.ode_warm_start = enabled
@@ -1,13 +1,42 @@
 from typing import Any, TYPE_CHECKING
+import numpy as np
 from src.agent.circ_module import CirculateModule
+from src.agent.circ_model import (
+    CIRC_INPUTS,
+    CIRC_PARAMS,
+    CIRC_SPECIES,
+    PIN_TRANSPORT,
+    CircModelSpec,
+    Term,
+    compile_model,
+    linear,
+)
 
 if TYPE_CHECKING:
     from src.agent.cell import Cell
 
+# Only auxin is synthesized and degraded, every other species stays at zero
+AUX_SYNDEGONLY_MODEL = compile_model(
+    CircModelSpec(
+        "aux_syndegonly",
+        CIRC_SPECIES,
+        CIRC_PARAMS + [("ks_aux", "ks_aux"), ("kd_aux", "kd_aux")],
+        CIRC_INPUTS,
+        {
+            "auxin": [
+                Term("ks_aux", [linear("auxin_w")]),
+                Term("kd_aux", [linear("auxin")], sign=-1),
+            ],
+        },
+        PIN_TRANSPORT,
+    )
+)
+
 
 class CirculateModuleAuxinSynDegOnly(CirculateModule):
     ks_aux: float
     kd_aux: float
+    model = AUX_SYNDEGONLY_MODEL
 
     def __init__(self, cell: "Cell", init_vals: dict[str, Any]):
         super().__init__(cell, init_vals)
@@ -32,44 +61,9 @@ class CirculateModuleAuxinSynDegOnly(CirculateModule):
         self.pinl = 0
         self.pinm = 0
 
-    def calculate_auxin(self, auxini: float) -> float:
-        auxin = (self.ks_aux * self.auxin_w) - (self.kd_aux * auxini)
-        return auxin
-
-    def calculate_arr(self, arri: float) -> float:
-        return 0
-
-    def calculate_auxlax(self, auxin: float, auxlax: float) -> float:
-        return 0
-
-    def calculate_pin(self, auxin: float, arr: float) -> float:
-        return 0
-
-    def calculate_membrane_pin(
-        self, pin: float, membrane_pin: float, direction: str, weight: float
-    ) -> float:
-        return 0
-
-    def get_state(self) -> dict[str, Any]:
-        state = {
-            "auxin": self.auxin,
-            "arr": self.arr,
-            "al": self.auxlax,
-            "pin": self.pin,
-            "pina": self.pina,
-            "pinb": self.pinb,
-            "pinl": self.pinl,
-            "pinm": self.pinm,
-            "k1": self.k_arr_arr,
-            "k2": self.k_auxin_auxlax,
-            "k3": self.k_auxin_pin,
-            "k4": self.k_arr_pin,
-            "k5": self.k_al,
-            "k6": self.k_pin,
-            "ks_aux": self.ks_aux,
-            "kd_aux": self.kd_aux,
-            "auxin_w": self.auxin_w,
-            "arr_hist": self.arr_hist,
-            "circ_mod": "aux_syndegonly",
-        }
-        return state
+    def calculate_steady_state(self, auxin: float) -> tuple[np.ndarray, np.ndarray]:
+        state = np.zeros(8)
+        state[0] = auxin
+        dstate = np.zeros(8)
+        dstate[0] = 1.0
+        return state, dstate
@@ -1,12 +1,63 @@
 import numpy as np
-from typing import TYPE_CHECKING, cast, Any, List
-from scipy.integrate import odeint
-from src.sim.util.math_helpers import round_to_sf
+from typing import TYPE_CHECKING, Any
 from src.agent.circ_module import CirculateModule
+from src.agent.circ_model import (
+    CIRC_INPUTS,
+    CIRC_PARAMS,
+    CIRC_SPECIES,
+    PIN_TRANSPORT,
+    CircModelSpec,
+    Term,
+    activation,
+    compile_model,
+    inhibition,
+    linear,
+    membrane_pin_rates,
+)
 
 if TYPE_CHECKING:
     from src.agent.cell import Cell
 
+INDEP_SYNDEG_MODEL = compile_model(
+    CircModelSpec(
+        "indep_syndeg",
+        CIRC_SPECIES,
+        CIRC_PARAMS
+        + [
+            ("ks_aux", "ks_aux"),
+            ("kd_aux", "kd_aux"),
+            ("ks_arr", "ks_arr"),
+            ("kd_arr", "kd_arr"),
+            ("ks_pinu", "ks_pinu"),
+            ("kd_pinu", "kd_pinu"),
+            ("kd_pinloc", "kd_pinloc"),
+            ("ks_auxlax", "ks_auxlax"),
+            ("kd_auxlax", "kd_auxlax"),
+        ],
+        CIRC_INPUTS,
+        {
+            "auxin": [
+                Term("ks_aux", [linear("auxin_w")]),
+                Term("kd_aux", [linear("auxin")], sign=-1),
+            ],
+            "arr": [
+                Term("ks_arr", [inhibition("arr_delayed", "k1")]),
+                Term("kd_arr", [linear("arr")], sign=-1),
+            ],
+            "al": [
+                Term("ks_auxlax", [activation("auxin", "k2")]),
+                Term("kd_auxlax", [linear("al")], sign=-1),
+            ],
+            "pin": [
+                Term("ks_pinu", [inhibition("arr", "k4"), activation("auxin", "k3")]),
+                Term("kd_pinu", [linear("pin_start")], sign=-1),
+            ],
+            **membrane_pin_rates("kd_pinloc"),
+        },
+        PIN_TRANSPORT,
+    )
+)
+
 
 class CirculateModuleIndSynDeg(CirculateModule):
 
@@ -19,6 +70,7 @@ class CirculateModuleIndSynDeg(CirculateModule):
     kd_pinloc: float  # localized pin
     ks_auxlax: float
     kd_auxlax: float
+    model = INDEP_SYNDEG_MODEL
 
     def __init__(self, cell: "Cell", init_vals: dict[str, Any]):
         """
@@ -96,166 +148,35 @@ class CirculateModuleIndSynDeg(CirculateModule):
         self.kd_auxlax = get_float("kd_auxlax")
         self.output_list.append("kd_auxlax")
 
-    def calculate_auxin(self, auxini: float) -> float:
-        """
-        Calculate the auxin synthesis and degradation of the current cell.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated auxin concentration after accounting for synthesis and
-            degradation.
-        """
-        auxin = (self.ks_aux * self.auxin_w) - (self.kd_aux * auxini)
-        return auxin
-
-    def calculate_arr(self, arri: float) -> float:
-        """
-        Calculate the ARR concentration of the current cell based on initial
-        concentration and historical data.
-
-        Parameters
-        ----------
-        arri : float
-            The initial (current) ARR concentration in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated ARR concentration after accounting for synthesis and
-            degradation dynamics.
-        """
-        arr = (self.ks_arr * (self.k_arr_arr / (self.arr_hist[0] + self.k_arr_arr))) - (
-            self.kd_arr * arri
-        )
-        return arr
-
-    def calculate_auxlax(self, auxini: float, ali: float) -> float:
-        """
-        Calculate the AUX/LAX expression of the current cell based on initial
-        auxin concentration and AUX/LAX expression.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in
-            au/um^2.
-        ali : float
-            The initial (current) AUX/LAX expression in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated AUX/LAX expression after synthesis and degradation.
-        """
-        al = self.ks_auxlax * (auxini / (auxini + self.k_auxin_auxlax)) - self.kd_auxlax * ali
-        return al
-
-    def calculate_pin(self, auxini: float, arri: float) -> float:
-        """
-        Calculate the PIN expression of the current cell based on initial auxin
-        and ARR concentrations.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in
-            au/um^2.
-        arri : float
-            The initial (current) ARR expression in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated PIN expression considering both synthesis and
-            degradation factors.
+    def calculate_steady_state(self, auxin: float) -> tuple[np.ndarray, np.ndarray]:
         """
-        pin = (
-            self.ks_pinu
-            * (self.k_arr_pin / (arri + self.k_arr_pin))
-            * (auxini / (auxini + self.k_auxin_pin))
-            - self.kd_pinu * self.pin
-        )
-        return pin
+        Calculate the steady state the cell's species other than auxin settle to if its auxin
+        concentration is held fixed, and how that state changes with the auxin concentration.
 
-    def calculate_membrane_pin(
-        self, pini: float, pindi: float, direction: str, pin_weight: float
-    ) -> float:
-        """
-        Calculate the PIN expression on one membrane based on the current cell's
-        unlocalized and localized PIN expressions, the membrane direction, and
-        the proportion of membrane-localized PIN in this membrane.
+        ARR is regulated only by its own delayed concentration, so its steady state does not
+        depend on auxin.
 
         Parameters
         ----------
-        pini : float
-            The current cell's unlocalized PIN expression.
-        pindi : float
-            The current cell's localized PIN expression in the specified direction.
-        direction : str
-            The direction of the membrane.
-        pin_weight : float
-            The proportion of membrane-localized PIN in this membrane.
-
-        Returns
-        -------
-        float
-            The calculated PIN expression on the membrane, taking into account
-            localization and degradation.
-        """
-        weight = pin_weight
-        memfrac = self.cell.get_quad_perimeter().get_memfrac(direction, self.left)
-        membrane_pin = pin_weight * pini - (self.kd_pinloc * pindi)
-        return membrane_pin
-
-    def get_state(self) -> dict[str, Any]:
-        """
-        Retrieve the current state of the circulate module.
-
-        This method compiles the current state of the circulate module, encapsulating
-        all relevant attributes and their values into a dictionary. This includes
-        concentrations of various species, kinetic parameters, and historical data
-        related to the module's operation.
+        auxin : float
+            The auxin concentration of the current cell in au/um^2.
 
         Returns
         -------
-        dict[str, Any]
-            A dictionary containing key-value pairs of attribute names and their
-            current values. Includes concentrations (auxin, ARR, etc.), kinetic
-            parameters (`k1` to `k6`, ks_aux, kd_aux, ks_arr, kd_arr, ks_pinu, kd_pinu, kd_pinloc, ks_auxlax, kd_auxlax`),
-            auxin weight, and the history of ARR concentrations.
+        tuple[ndarray, ndarray]
+            The steady state, ordered as in `rates`, with `auxin` as its first element, and its
+            derivative with respect to `auxin`.
         """
-        state = {
-            "auxin": self.auxin,
-            "arr": self.arr,
-            "al": self.auxlax,
-            "pin": self.pin,
-            "pina": self.pina,
-            "pinb": self.pinb,
-            "pinl": self.pinl,
-            "pinm": self.pinm,
-            "k1": self.k_arr_arr,
-            "k2": self.k_auxin_auxlax,
-            "k3": self.k_auxin_pin,
-            "k4": self.k_arr_pin,
-            "k5": self.k_al,
-            "k6": self.k_pin,
-            "ks_aux": self.ks_aux,
-            "kd_aux": self.kd_aux,
-            "ks_arr": self.ks_arr,
-            "kd_arr": self.kd_arr,
-            "ks_pinu": self.ks_pinu,
-            "kd_pinu": self.kd_pinu,
-            "kd_pinloc": self.kd_pinloc,
-            "ks_auxlax": self.ks_auxlax,
-            "kd_auxlax": self.kd_auxlax,
-            "auxin_w": self.auxin_w,
-            "arr_hist": self.arr_hist,
-            "circ_mod": "indep_syndeg",
-        }
-        return state
+        arr_production = 4 * self.ks_arr * self.k_arr_arr / self.kd_arr
+        arr = (-self.k_arr_arr + np.sqrt(self.k_arr_arr**2 + arr_production)) / 2
+        arr_inhibition = self.k_arr_pin / (arr + self.k_arr_pin)
+        auxlax = self.ks_auxlax * (auxin / (auxin + self.k_auxin_auxlax)) / self.kd_auxlax
+        dauxlax = self.ks_auxlax * self.k_auxin_auxlax / (auxin + self.k_auxin_auxlax) ** 2
+        dauxlax /= self.kd_auxlax
+        pin = self.ks_pinu * arr_inhibition * (auxin / (auxin + self.k_auxin_pin)) / self.kd_pinu
+        dpin = self.ks_pinu * arr_inhibition * self.k_auxin_pin / (auxin + self.k_auxin_pin) ** 2
+        dpin /= self.kd_pinu
+        weights = np.array([self.pin_weights[direction] for direction in ["a", "b", "l", "m"]])
+        state = np.concatenate(([auxin, arr, auxlax, pin], weights * pin / self.kd_pinloc))
+        dstate = np.concatenate(([1.0, 0.0, dauxlax, dpin], weights * dpin / self.kd_pinloc))
+        return state, dstate
@@ -1,13 +1,54 @@
 import numpy as np
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
-from scipy.integrate import odeint
-from src.sim.util.math_helpers import round_to_sf
+from typing import Any, TYPE_CHECKING, cast
+from src.sim.util.math_helpers import round_in_stage, round_to_sf
 from src.agent.circ_module import CirculateModule
-from src.loc.quad_perimeter.quad_perimeter import get_len_perimeter_in_common
+from src.agent.circ_model import (
+    CIRC_INPUTS,
+    CIRC_PARAMS,
+    CIRC_SPECIES,
+    PIN_TRANSPORT,
+    CircModelSpec,
+    Term,
+    activation,
+    compile_model,
+    inhibition,
+    linear,
+    membrane_pin_rates,
+)
 
 if TYPE_CHECKING:
     from src.agent.cell import Cell
 
+# Every species is synthesized at rate k_s and degraded at rate k_d
+UNIVERSAL_SYNDEG_MODEL = compile_model(
+    CircModelSpec(
+        "universal_syndeg",
+        CIRC_SPECIES,
+        CIRC_PARAMS + [("k_s", "ks"), ("k_d", "kd")],
+        CIRC_INPUTS,
+        {
+            "auxin": [
+                Term("k_s", [linear("auxin_w")]),
+                Term("k_d", [linear("auxin")], sign=-1),
+            ],
+            "arr": [
+                Term("k_s", [inhibition("arr_delayed", "k1")]),
+                Term("k_d", [linear("arr")], sign=-1),
+            ],
+            "al": [
+                Term("k_s", [activation("auxin", "k2")]),
+                Term("k_d", [linear("al")], sign=-1),
+            ],
+            "pin": [
+                Term("k_s", [inhibition("arr", "k4"), activation("auxin", "k3")]),
+                Term("k_d", [linear("pin_start")], sign=-1),
+            ],
+            **membrane_pin_rates("k_d"),
+        },
+        PIN_TRANSPORT,
+    )
+)
+
 
 class CirculateModuleUniversalSynDeg(CirculateModule):
     """
@@ -63,10 +104,15 @@ class CirculateModuleUniversalSynDeg(CirculateModule):
         Rate of degradation of the species.
     auxin_w : float
         Weight of auxin in the synthesis process.
+    ode_rtol : float
+        Relative error tolerance of the ODE solver.
+    ode_atol : float
+        Absolute error tolerance of the ODE solver.
     """
 
     ks: float
     kd: float
+    model = UNIVERSAL_SYNDEG_MODEL
 
     def __init__(self, cell: "Cell", init_vals: dict[str, Any]):
         """
@@ -191,76 +237,34 @@ class CirculateModuleUniversalSynDeg(CirculateModule):
             pin_weights_dict[direction] = val / pin_sum
         return pin_weights_dict
 
-    def f(self, y: list[float], t: float) -> list[float]:
+    def solve_equations(self, time_step: float = 0.001, duration: float = 1.0) -> np.ndarray:
         """
-        Define the model's differential equations.
+        Solve the model's differential equations over a given time span.
+
+        Only the final state is used, so the solver is not asked for the state at every time
+        step. The first time step is still requested because LSODA sizes its first internal
+        step from the first requested time unless solves are warm started; keeping it leaves
+        the internal steps, and so the final state, exactly as they are when every time step
+        is requested. The rates and, when the solver switches to its stiff method, the
+        analytic Jacobian are evaluated through the module's compiled `model`.
 
         Parameters
         ----------
-        y : list[float]
-            The current values of the model variables, ordered as [auxin, ARR, AUX/LAX,
-            unlocalized PIN, apical PIN, basal PIN, lateral PIN, medial PIN].
-        t : float
-            The current simulation time.
-
-        Returns
-        -------
-        list[float]
-            The derivatives of the model variables, representing the rate of change
-            of each variable at time `t`.
-        """
-
-        # Variable unpacking for clarity
-        auxini = y[0]
-        arri = y[1]
-        ali = y[2]
-        pini = y[3]
-        pinai = y[4]
-        pinbi = y[5]
-        pinli = y[6]
-        pinmi = y[7]
-
-        # the model equations
-        # auxin
-        f0 = self.calculate_auxin(auxini)
-        # arr
-        f1 = self.calculate_arr(arri)
-        # al
-        f2 = self.calculate_auxlax(auxini, ali)
-        # pin
-        f3 = self.calculate_pin(auxini, arri)
-        # neighbor pin
-        f4 = self.calculate_membrane_pin(pini, pinai, "a", cast(float, self.pin_weights.get("a")))
-        f5 = self.calculate_membrane_pin(pini, pinbi, "b", cast(float, self.pin_weights.get("b")))
-        f6 = self.calculate_membrane_pin(pini, pinli, "l", cast(float, self.pin_weights.get("l")))
-        f7 = self.calculate_membrane_pin(pini, pinmi, "m", cast(float, self.pin_weights.get("m")))
-
-        return [f0, f1, f2, f3, f4, f5, f6, f7]
-
-    def solve_equations(self, time_step: float = 0.001, duration: float = 1.0) -> np.ndarray:
-        """
-        Solve the model's differential equations over a given time span.
+        time_step : float
+            The time step the solver's first internal step is sized from. Default is 0.001
+            hours.
+        duration : float
+            The total duration of the time span. Default is 1.0 hours.
 
         Returns
         -------
         ndarray
-            An array containing the solution of the differential equations at each
-            time step. Each row corresponds to a time step, and each column corresponds
-            to one of the model variables.
+            A 2 x 8 array holding the initial state and the state after `duration`. Each
+            column corresponds to one of the model variables.
         """
-        y0 = [
-            self.auxin,
-            self.arr,
-            self.auxlax,
-            self.pin,
-            self.pina,
-            self.pinb,
-            self.pinl,
-            self.pinm,
-        ]
-        t = np.linspace(0, duration, int(duration / time_step) + 1)
-        soln = odeint(self.f, y0, t)
-        return soln
+        t = [0.0, min(time_step, duration), duration]
+        soln = self.integrate(t)
+        return soln[[0, -1]]
 
     def update(self) -> None:
         """
@@ -285,151 +289,37 @@ class CirculateModuleUniversalSynDeg(CirculateModule):
         self.update_auxin(soln)
         self.update_circ_contents(soln)
 
-    def calculate_auxin(self, auxini: float) -> float:
-        """
-        Calculate the auxin synthesis and degradation of the current cell.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated auxin concentration after accounting for synthesis and
-            degradation.
-        """
-        auxin = (self.ks * self.auxin_w) - (self.kd * auxini)
-        return auxin
-
-    def calculate_arr(self, arri: float) -> float:
-        """
-        Calculate the ARR concentration of the current cell based on initial
-        concentration and historical data.
-
-        Parameters
-        ----------
-        arri : float
-            The initial (current) ARR concentration in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated ARR concentration after accounting for synthesis and
-            degradation dynamics.
-        """
-        arr = (self.ks * (self.k_arr_arr / (self.arr_hist[0] + self.k_arr_arr))) - (self.kd * arri)
-        return arr
-
-    def calculate_auxlax(self, auxini: float, ali: float) -> float:
-        """
-        Calculate the AUX/LAX expression of the current cell based on initial
-        auxin concentration and AUX/LAX expression.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in
-            au/um^2.
-        ali : float
-            The initial (current) AUX/LAX expression in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated AUX/LAX expression after synthesis and degradation.
-        """
-        al = self.ks * (auxini / (auxini + self.k_auxin_auxlax)) - self.kd * ali
-        return al
-
-    def calculate_pin(self, auxini: float, arri: float) -> float:
-        """
-        Calculate the PIN expression of the current cell based on initial auxin
-        and ARR concentrations.
-
-        Parameters
-        ----------
-        auxini : float
-            The initial (current) auxin concentration of the current cell in
-            au/um^2.
-        arri : float
-            The initial (current) ARR expression in au/um^2.
-
-        Returns
-        -------
-        float
-            The calculated PIN expression considering both synthesis and
-            degradation factors.
-        """
-        pin = (
-            self.ks
-            * (self.k_arr_pin / (arri + self.k_arr_pin))
-            * (auxini / (auxini + self.k_auxin_pin))
-            - self.kd * self.pin
-        )
-        return pin
-
-    def calculate_membrane_pin(
-        self, pini: float, pindi: float, direction: str, pin_weight: float
-    ) -> float:
-        """
-        Calculate the PIN expression on one membrane based on the current cell's
-        unlocalized and localized PIN expressions, the membrane direction, and
-        the proportion of membrane-localized PIN in this membrane.
-
-        Parameters
-        ----------
-        pini : float
-            The current cell's unlocalized PIN expression.
-        pindi : float
-            The current cell's localized PIN expression in the specified direction.
-        direction : str
-            The direction of the membrane.
-        pin_weight : float
-            The proportion of membrane-localized PIN in this membrane.
-
-        Returns
-        -------
-        float
-            The calculated PIN expression on the membrane, taking into account
-            localization and degradation.
+    def calculate_steady_state(self, auxin: float) -> tuple[np.ndarray, np.ndarray]:
         """
-        self.update_left_right()
-        weight = pin_weight
-        memfrac = self.cell.get_quad_perimeter().get_memfrac(direction, self.left)
-        membrane_pin = pin_weight * pini - (self.kd * pindi)
-        return membrane_pin
+        Calculate the steady state the cell's species other than auxin settle to if its auxin
+        concentration is held fixed, and how that state changes with the auxin concentration.
 
-    def calculate_neighbor_memfrac(self, neighbor: "Cell") -> float:
-        """
-        Calculate the fraction of the total cell membrane that is shared with a
-        specified neighbor cell.
+        ARR is regulated only by its own delayed concentration, so its steady state does not
+        depend on auxin.
 
         Parameters
         ----------
-        neighbor : Cell
-            The neighbor cell.
+        auxin : float
+            The auxin concentration of the current cell in au/um^2.
 
         Returns
         -------
-        float
-            The fraction of the total cell membrane shared with the neighbor,
-            rounded to six significant figures.
-        """
-        cell_perimeter = self.cell.quad_perimeter.get_perimeter_len()
-        try:
-            common_perimeter = get_len_perimeter_in_common(self.cell, neighbor)
-        except Exception as e:
-            print(
-                "cell",
-                self.cell.get_c_id(),
-                " does not neighbor cell",
-                neighbor.get_c_id(),
-            )
-            raise e
-        memfrac = common_perimeter / cell_perimeter
-        return round_to_sf(memfrac, 6)
+        tuple[ndarray, ndarray]
+            The steady state, ordered as in `rates`, with `auxin` as its first element, and its
+            derivative with respect to `auxin`.
+        """
+        arr_production = 4 * self.ks * self.k_arr_arr / self.kd
+        arr = (-self.k_arr_arr + np.sqrt(self.k_arr_arr**2 + arr_production)) / 2
+        arr_inhibition = self.k_arr_pin / (arr + self.k_arr_pin)
+        auxlax = self.ks * (auxin / (auxin + self.k_auxin_auxlax)) / self.kd
+        dauxlax = self.ks * self.k_auxin_auxlax / (auxin + self.k_auxin_auxlax) ** 2 / self.kd
+        pin = self.ks * arr_inhibition * (auxin / (auxin + self.k_auxin_pin)) / self.kd
+        dpin = self.ks * arr_inhibition * self.k_auxin_pin / (auxin + self.k_auxin_pin) ** 2
+        dpin /= self.kd
+        weights = np.array([self.pin_weights[direction] for direction in ["a", "b", "l", "m"]])
+        state = np.concatenate(([auxin, arr, auxlax, pin], weights * pin / self.kd))
+        dstate = np.concatenate(([1.0, 0.0, dauxlax, dpin], weights * dpin / self.kd))
+        return state, dstate
 
     def get_aux_exchange_across_membrane(
         self, al: float, pindi: float, neighbors: list
@@ -477,270 +367,10 @@ class CirculateModuleUniversalSynDeg(CirculateModule):
                 print(f"cell {self.cell.get_c_id()} neighbor {neighbor.get_c_id()}")
                 print(f"neighbor's auxin {auxin_influx}, self aux out {auxin_efflux}")
             neighbor_aux_exchange = auxin_influx - auxin_efflux
-            neighbor_dict[neighbor] = round_to_sf(neighbor_aux_exchange, 5)
+            neighbor_dict[neighbor] = round_in_stage(neighbor_aux_exchange, 5)
         return neighbor_dict
 
-    def calculate_delta_auxin(self, syn_deg_auxin: float, neighbors_auxin: list) -> float:
-        """
-        Calculate the total amount of change in auxin concentration for the current
-        cell, considering both synthesized/degraded auxin and auxin exchanged with
-        neighbors.
-
-        Parameters
-        ----------
-        syn_deg_auxin : float
-            The amount of auxin synthesized and degraded in the current cell.
-        neighbors_auxin : list
-            The list of dictionaries containing the amount of auxin transported
-            across each membrane for each neighbor cell.
-
-        Returns
-        -------
-        float
-            The total amount of change in auxin concentration for the current cell.
-        """
-        total_auxin = syn_deg_auxin
-        for neighbors in neighbors_auxin:
-            auxin = sum(neighbors.values())
-            if (
-                auxin == float("inf")
-                or total_auxin == float("inf")
-                or auxin == float("-inf")
-                or total_auxin == float("-inf")
-            ):
-                print(f"cell {self.cell.get_c_id()} auxin {auxin}, total auxin {total_auxin}")
-            else:
-                total_auxin += auxin
-        return total_auxin
-
-    def update_arr_hist(self) -> None:
-        """
-        Update the history of ARR concentrations in the cell. This method shifts
-        each element in the ARR history list one position to the left and updates
-        the last element with the current ARR concentration, effectively recording
-        the most recent state of ARR concentration.
-        """
-        for i, elem in enumerate(self.arr_hist):
-            if i != 0:
-                self.arr_hist[i - 1] = elem
-            if i == (len(self.arr_hist) - 1):
-                self.arr_hist[i] = self.arr
-
-    def update_circ_contents(self, soln: np.ndarray) -> None:
-        """
-        Update the circulation contents of the cell, except for auxin, based on the
-        solution of the differential equations. This includes updating the concentrations
-        of ARR, AUX/LAX, unlocalized PIN and membrane bound PINs.
-
-        Parameters
-        ----------
-        soln : ndarray
-            The solution of the differential equations, where each row represents a
-            different time point and columns represent the concentrations of different
-            substances at that time point.
-        """
-        self.arr = round_to_sf(soln[-1, 1], 5)
-        self.auxlax = round_to_sf(soln[-1, 2], 5)
-        self.pin = round_to_sf(soln[-1, 3], 5) - self.pin
-        self.pina = round_to_sf(soln[-1, 4], 5)
-        self.pinb = round_to_sf(soln[-1, 5], 5)
-        self.pinl = round_to_sf(soln[-1, 6], 5)
-        self.pinm = round_to_sf(soln[-1, 7], 5)
-        self.update_arr_hist()
-
-    def update_neighbor_auxin(self, neighbors_auxin: list[dict]) -> None:
-        """
-        Update the change in auxin concentrations for neighbor cells in the circulator.
-        This method processes each directional exchange of auxin with neighbors and
-        applies the changes to the respective neighbor cells.
-
-        Parameters
-        ----------
-        neighbors_auxin : list[dict]
-            The list of dictionaries containing the amount of auxin transported across
-            each membrane for each neighbor cell. Each dictionary corresponds to auxin
-            exchanges in one direction.
-        """
-        for each_dirct in neighbors_auxin:
-            for neighbor in each_dirct:
-                self.cell.get_sim().get_circulator().add_delta(neighbor, -each_dirct[neighbor])
-
-    def get_neighbors(self) -> tuple:
-        """
-        Get the neighbors of the current cell.
-
-        Returns
-        -------
-        tuple:
-            A tuple containing the list of neighbors for each membrane.
-        """
-        neighborsa = self.cell.get_a_neighbors()
-        neighborsb = self.cell.get_b_neighbors()
-        neighborsl = self.cell.get_l_neighbors()
-        neighborsm = self.cell.get_m_neighbors()
-        return neighborsa, neighborsb, neighborsl, neighborsm
-
-    def update_auxin(self, soln: np.ndarray) -> None:
-        """
-        Update auxin levels for the current cell and its neighbors based on differential equation solutions.
-
-        This function calculates the exchange of auxin between the current cell and its neighbors based on
-        the auxin transport mechanisms modeled by the differential equations. It updates the auxin levels
-        by considering auxin synthesis, degradation, and exchange with neighbors.
-
-        Parameters
-        ----------
-        soln : np.ndarray
-            The solution to the differential equations, providing the dynamic state of the system
-            including auxin levels at the current time step.
-
-        Raises
-        ------
-        ValueError
-            If the update results in negative auxin levels, indicating an issue with the model's
-            parameters or the numerical solution.
-        """
-        curr_cell = self.cell
-
-        # Retrieve neighbors for auxin exchange
-        neighborsa, neighborsb, neighborsl, neighborsm = self.get_neighbors()
-
-        # Calculate auxin exchange across membranes
-        auxina_exchange = self.get_aux_exchange_across_membrane(self.auxlax, self.pina, neighborsa)
-        auxinb_exchange = self.get_aux_exchange_across_membrane(self.auxlax, self.pinb, neighborsb)
-        auxinl_exchange = self.get_aux_exchange_across_membrane(self.auxlax, self.pinl, neighborsl)
-        auxinm_exchange = self.get_aux_exchange_across_membrane(self.auxlax, self.pinm, neighborsm)
-        neighbors_auxin_exchange = [
-            auxina_exchange,
-            auxinb_exchange,
-            auxinl_exchange,
-            auxinm_exchange,
-        ]
-
-        # Compute net auxin synthesized and degraded at this time step
-        auxin_synthesized_and_degraded_this_timestep = soln[-1, 0] - self.auxin
-
-        delta_auxin = self.calculate_delta_auxin(
-            auxin_synthesized_and_degraded_this_timestep, neighbors_auxin_exchange
-        )
-
-        # Update current cell auxin
-        curr_cell.get_sim().get_circulator().add_delta(curr_cell, round_to_sf(delta_auxin, 5))
-
-        # Update auxin levels in neighbor cells
-        self.update_neighbor_auxin(neighbors_auxin_exchange)
-
     # getter functions
-    def get_auxin(self) -> float:
-        """
-        Get the auxin concentration in the cell.
-
-        Returns
-        -------
-        float
-            The auxin concentration in the cell.
-        """
-        return self.auxin
-
-    def get_arr(self) -> float:
-        """
-        Get the ARR concentration in the cell.
-
-        Returns
-        -------
-        float
-            The ARR concentration in the cell.
-        """
-        return self.arr
-
-    def get_al(self) -> float:
-        """
-        Get the AUX/LAX expression in the cell.
-
-        Returns
-        -------
-        float
-            The AUX/LAX expression in the cell.
-        """
-        return self.auxlax
-
-    def get_arr_hist(self) -> list[float]:
-        """
-        Get the ARR history list.
-
-        Returns
-        -------
-        list
-            The ARR history list.
-        """
-        return self.arr_hist
-
-    def get_auxin_w(self) -> float:
-        """
-        Get the weight of auxin synthesis.
-
-        Returns
-        -------
-        float
-            The weight of auxin synthesis.
-        """
-        return self.auxin_w
-
-    def get_pin(self) -> float:
-        """
-        Get the unlocalized PIN expression in the cell.
-
-        Returns
-        -------
-        float
-            The unlocalized PIN expression in the cell.
-        """
-        return self.pin
-
-    def get_apical_pin(self) -> float:
-        """
-        Get the PIN localized in the apical direction.
-
-        Returns
-        -------
-        float
-            The PIN localized in the apical direction.
-        """
-        return self.pina
-
-    def get_basal_pin(self) -> float:
-        """
-        Get the PIN localized in the basal direction.
-
-        Returns
-        -------
-        float
-            The PIN localized in the basal direction.
-        """
-        return self.pinb
-
-    def get_lateral_pin(self) -> float:
-        """
-        Get the PIN localized in the lateral direction.
-
-        Returns
-        -------
-        float
-            The PIN localized in the lateral direction.
-        """
-        return self.pinl
-
-    def get_medial_pin(self) -> float:
-        """
-        Get the PIN localized in the medial direction.
-
-        Returns
-        -------
-        float
-            The PIN localized in the medial direction.
-        """
-        return self.pinm
-
     def get_left_pin(self) -> float:
         """
         Get the PIN localized in the left direction.
@@ -768,43 +398,3 @@ class CirculateModuleUniversalSynDeg(CirculateModule):
         if self.right == "medial":
             return self.pinm
         return self.pinl
-
-    def get_state(self) -> dict[str, Any]:
-        """
-        Retrieve the current state of the circulate module.
-
-        This method compiles the current state of the circulate module, encapsulating
-        all relevant attributes and their values into a dictionary. This includes
-        concentrations of various species, kinetic parameters, and historical data
-        related to the module's operation.
-
-        Returns
-        -------
-        dict[str, Any]
-            A dictionary containing key-value pairs of attribute names and their
-            current values. Includes concentrations (auxin, ARR, etc.), kinetic
-            parameters (`k1` to `k6`, `k_s`, `k_d`), auxin weight, and the history
-            of ARR concentrations.
-        """
-        state = {
-            "auxin": self.auxin,
-            "arr": self.arr,
-            "al": self.auxlax,
-            "pin": self.pin,
-            "pina": self.pina,
-            "pinb": self.pinb,
-            "pinl": self.pinl,
-            "pinm": self.pinm,
-            "k1": self.k_arr_arr,
-            "k2": self.k_auxin_auxlax,
-            "k3": self.k_auxin_pin,
-            "k4": self.k_arr_pin,
-            "k5": self.k_al,
-            "k6": self.k_pin,
-            "k_s": self.ks,
-            "k_d": self.kd,
-            "auxin_w": self.auxin_w,
-            "arr_hist": self.arr_hist,
-            "circ_mod": "universal_syndeg",
-        }
-        return state
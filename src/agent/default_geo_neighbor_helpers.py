@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Optional, cast
 
 if TYPE_CHECKING:
     from src.agent.cell import Cell
@@ -162,25 +163,34 @@ class NeighborHelpers:
         return neighbor_direct
 
     @staticmethod
-    def check_if_neighbors_with_new_root_cap_cell(cell: "Cell", sim: "GrowingSim") -> None:
+    def check_if_neighbors_with_new_root_cap_cell(
+        cell: "Cell", sim: "GrowingSim", lrc_index: Optional["RootCapIndex"] = None
+    ) -> None:
         """
-        Checks if the neighbor is the next root cap cell.
+        Adds any root cap cell the cell now borders, and is not yet neighbors with, as a
+        lateral neighbor of the cell.
 
-        Args:
-            cell (Cell): The current cell.
-            neighbor (Cell): The neighboring cell.
-
-        Returns:
-            str: The direction of the neighbor ('a', 'b', 'l', 'm')
-                or None if no direction is found.
+        Parameters
+        ----------
+        cell : Cell
+            The cell whose root cap neighbors are checked.
+        sim : GrowingSim
+            The simulation the cell belongs to.
+        lrc_index : RootCapIndex, optional
+            Index of the root cap cells' current positions. If not given, every cell in the
+            simulation is checked.
         """
-        all_lrc_cells = [
-            cell
-            for cell in sim.get_cell_list()
-            if cell.get_c_id() in NeighborHelpers.ROOTCAP_CELL_IDs
-        ]
+        candidate_lrc_cells: list["Cell"]
+        if lrc_index is None:
+            candidate_lrc_cells = [
+                cell
+                for cell in cast(list["Cell"], sim.get_cell_list())
+                if cell.get_c_id() in NeighborHelpers.ROOTCAP_CELL_IDs
+            ]
+        else:
+            candidate_lrc_cells = lrc_index.get_overlapping_lrc_cells(cell)
         non_current_neighbor_lrc_cells = [
-            lrc_cell for lrc_cell in all_lrc_cells if lrc_cell not in cell.get_l_neighbors()
+            lrc_cell for lrc_cell in candidate_lrc_cells if lrc_cell not in cell.get_l_neighbors()
         ]
         for lrc_cell in non_current_neighbor_lrc_cells:
             if NeighborHelpers.cell_and_lrc_cell_are_neighbors(cell, lrc_cell):
@@ -249,14 +259,17 @@ class NeighborHelpers:
 
     @staticmethod  # This relies on the assumption that only cells that were previously neighbors with root cap cells will ever be neighbors with root cap cells
     def fix_lrc_neighbors_after_growth(sim: "GrowingSim") -> None:
-        non_root_tip_cells = [
-            cell for cell in sim.get_cell_list() if cell.get_cell_type() != "roottip"
-        ]
+        cell_list = cast(list["Cell"], sim.get_cell_list())
+        lrc_index = RootCapIndex(
+            [cell for cell in cell_list if cell.get_c_id() in NeighborHelpers.ROOTCAP_CELL_IDs],
+            sim.get_root_midpointx(),
+        )
+        non_root_tip_cells = [cell for cell in cell_list if cell.get_cell_type() != "roottip"]
         for non_root_tip_cell in non_root_tip_cells:
             for l_neighbor in non_root_tip_cell.get_l_neighbors():
                 if l_neighbor.get_c_id() in NeighborHelpers.ROOTCAP_CELL_IDs:
                     NeighborHelpers.check_if_neighbors_with_new_root_cap_cell(
-                        non_root_tip_cell, sim
+                        non_root_tip_cell, sim, lrc_index=lrc_index
                     )
                     NeighborHelpers.check_if_no_longer_neighbors_with_root_cap_cell(
                         non_root_tip_cell, l_neighbor
@@ -302,3 +315,93 @@ class NeighborHelpers:
             return True
         else:
             return False
+
+
+class RootCapIndex:
+    """
+    Index of lateral root cap cells by y-interval, one sorted interval list per root side.
+
+    Root cap cells on a side of the root are stacked along y, so the list of their intervals
+    sorted by min y is also sorted by max y and the root cap cells overlapping a y-range can be
+    found by bisection. A running maximum of max y keeps queries correct if intervals overlap.
+
+    The index holds the positions the root cap cells had when it was built, so it must be
+    rebuilt after vertices move.
+
+    Parameters
+    ----------
+    lrc_cells : list[Cell]
+        The lateral root cap cells to index.
+    root_midpointx : float
+        The x-coordinate of the root's midpoint, used to determine each cell's root side.
+    """
+
+    def __init__(self, lrc_cells: list["Cell"], root_midpointx: float):
+        self.root_midpointx = root_midpointx
+        entries_by_side: dict[str, list[tuple[float, float, int, "Cell"]]] = {}
+        for order, lrc_cell in enumerate(lrc_cells):
+            quad_perimeter = lrc_cell.get_quad_perimeter()
+            side = quad_perimeter.get_left_lateral_or_medial(root_midpointx)
+            entries_by_side.setdefault(side, []).append(
+                (quad_perimeter.get_min_y(), quad_perimeter.get_max_y(), order, lrc_cell)
+            )
+        self.sides = {}
+        for side, entries in entries_by_side.items():
+            entries.sort(key=lambda entry: (entry[0], entry[2]))
+            min_ys = [entry[0] for entry in entries]
+            running_max_ys = []
+            running_max_y = -float("inf")
+            for entry in entries:
+                running_max_y = max(running_max_y, entry[1])
+                running_max_ys.append(running_max_y)
+            self.sides[side] = (min_ys, running_max_ys, entries)
+
+    def get_overlapping(self, side: str, min_y: float, max_y: float) -> list["Cell"]:
+        """
+        Returns the root cap cells on a side of the root whose closed y-interval overlaps
+        [min_y, max_y].
+
+        Parameters
+        ----------
+        side : str
+            Whether "left" is 'lateral' or 'medial' for the root cap cells.
+        min_y : float
+            The lower end of the y-range.
+        max_y : float
+            The upper end of the y-range.
+
+        Returns
+        -------
+        list[Cell]
+            The overlapping root cap cells, in the order they were given to the index.
+        """
+        if side not in self.sides:
+            return []
+        min_ys, running_max_ys, entries = self.sides[side]
+        start = bisect_left(running_max_ys, min_y)
+        end = bisect_right(min_ys, max_y)
+        hits = [entry for entry in entries[start:end] if entry[1] >= min_y]
+        hits.sort(key=lambda entry: entry[2])
+        return [entry[3] for entry in hits]
+
+    def get_overlapping_lrc_cells(self, cell: "Cell") -> list["Cell"]:
+        """
+        Returns the root cap cells on the cell's side of the root whose y-interval overlaps
+        the cell's.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell to find overlapping root cap cells for.
+
+        Returns
+        -------
+        list[Cell]
+            The overlapping root cap cells, in the order they were given to the index.
+        """
+        quad_perimeter = cell.get_quad_perimeter()
+        return self.get_overlapping(
+            quad_perimeter.get_left_lateral_or_medial(self.root_midpointx),
+            quad_perimeter.get_min_y(),
+            quad_perimeter.get_max_y(),
+        )
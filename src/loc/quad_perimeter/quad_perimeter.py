@@ -1,6 +1,6 @@
 import math
 from typing import TYPE_CHECKING
-from src.sim.util.math_helpers import round_to_sf
+from src.sim.util.math_helpers import round_geometry
 from src.loc.vertex.vertex import Vertex
 from src.loc.quad_perimeter.default_perimeter_geo_neighor_helper import PerimeterNeighborHelpers
 
@@ -211,6 +211,14 @@ class QuadPerimeter:
     _init_area : float
         The initial area of the cell, calculated using the vertices of the perimeter. This
         value is important for simulations that track cell growth or deformation over time.
+    _cache : dict[str, float]
+        Membrane lengths, perimeter length, area, bounds and y-midpoint of the perimeter,
+        computed from the vertex positions at `_cache_version`.
+    _cache_version : int or None
+        Sum of the corner vertices' versions when `_cache` was filled. Vertex versions only
+        increase, so the sum changes whenever any corner moves.
+    _memfrac_cache : dict[tuple[str, str], float]
+        Membrane fractions computed since `_cache` was filled, keyed by direction and side.
     """
 
     def __init__(self, vertex_list: list["Vertex"]):
@@ -224,6 +232,9 @@ class QuadPerimeter:
         """
         self._perimeter_vs = vertex_list
         self.__assign_corners()
+        self._cache: dict[str, float] = {}
+        self._cache_version: int | None = None
+        self._memfrac_cache: dict[tuple[str, str], float] = {}
         self._midpointx = self.__calc_midpointx()
         self._init_area = self.get_area()
 
@@ -251,6 +262,49 @@ class QuadPerimeter:
         sumy = sum(corner.get_y() for corner in self._perimeter_vs)
         return sumy / len(self._perimeter_vs)
 
+    def __get_cache(self) -> dict[str, float]:
+        """
+        Returns the derived quantities of the perimeter, recomputing them if a corner moved.
+
+        Returns
+        -------
+        dict[str, float]
+            Membrane lengths, perimeter length, area, bounds and y-midpoint of the perimeter.
+        """
+        version = (
+            self._top_left.version
+            + self._top_right.version
+            + self._bottom_left.version
+            + self._bottom_right.version
+        )
+        if version == self._cache_version:
+            return self._cache
+        left = math.dist(self._top_left.get_xy(), self._bottom_left.get_xy())
+        right = math.dist(self._top_right.get_xy(), self._bottom_right.get_xy())
+        apical = math.dist(self._top_left.get_xy(), self._top_right.get_xy())
+        basal = math.dist(self._bottom_left.get_xy(), self._bottom_right.get_xy())
+        perimeter = left + right + apical + basal
+        s = perimeter / 2
+        area = math.sqrt((s - left) * (s - right) * (s - apical) * (s - basal))
+        ys = [corner.get_y() for corner in self._perimeter_vs]
+        xs = [corner.get_x() for corner in self._perimeter_vs]
+        self._cache = {
+            "left_memlen": left,
+            "right_memlen": right,
+            "apical_memlen": apical,
+            "basal_memlen": basal,
+            "perimeter_len": perimeter,
+            "area": round_geometry(area, 6),
+            "min_x": min(xs),
+            "max_x": max(xs),
+            "min_y": min(ys),
+            "max_y": max(ys),
+            "midpointy": self.__calc_midpointy(),
+        }
+        self._memfrac_cache = {}
+        self._cache_version = version
+        return self._cache
+
     def get_max_y(self) -> float:
         """
         Gets the maximum y-coordinate of the perimeter.
@@ -260,7 +314,7 @@ class QuadPerimeter:
         float
             The maximum y-coordinate of the perimeter.
         """
-        return max(corner.get_y() for corner in self._perimeter_vs)
+        return self.__get_cache()["max_y"]
 
     def get_min_y(self) -> float:
         """
@@ -271,7 +325,7 @@ class QuadPerimeter:
         float
             The minimum y-coordinate of the perimeter.
         """
-        return min(corner.get_y() for corner in self._perimeter_vs)
+        return self.__get_cache()["min_y"]
 
     def get_max_x(self) -> float:
         """
@@ -282,7 +336,7 @@ class QuadPerimeter:
         float
             The maximum x-coordinate of the perimeter.
         """
-        return max(corner.get_x() for corner in self._perimeter_vs)
+        return self.__get_cache()["max_x"]
 
     def get_min_x(self) -> float:
         """
@@ -293,7 +347,7 @@ class QuadPerimeter:
         float
             The minimum x-coordinate of the perimeter.
         """
-        return min(corner.get_x() for corner in self._perimeter_vs)
+        return self.__get_cache()["min_x"]
 
     def get_midpointx(self) -> float:
         """
@@ -315,7 +369,7 @@ class QuadPerimeter:
         float
             The y-coordinate of the perimeter's midpoint.
         """
-        return self.__calc_midpointy()
+        return self.__get_cache()["midpointy"]
 
     def point_inside(self, x: int, y: int) -> bool:
         """
@@ -347,12 +401,7 @@ class QuadPerimeter:
         float
             The length of the perimeter.
         """
-        return (
-            self.get_left_memlen()
-            + self.get_right_memlen()
-            + self.get_apical_memlen()
-            + self.get_basal_memlen()
-        )
+        return self.__get_cache()["perimeter_len"]
 
     def get_left_memlen(self) -> float:
         """
@@ -363,7 +412,7 @@ class QuadPerimeter:
         float
             The length of the left membrane.
         """
-        return math.dist(self._top_left.get_xy(), self._bottom_left.get_xy())
+        return self.__get_cache()["left_memlen"]
 
     def get_right_memlen(self) -> float:
         """
@@ -374,7 +423,7 @@ class QuadPerimeter:
         float
             The length of the right membrane.
         """
-        return math.dist(self._top_right.get_xy(), self._bottom_right.get_xy())
+        return self.__get_cache()["right_memlen"]
 
     def get_apical_memlen(self) -> float:
         """
@@ -385,7 +434,7 @@ class QuadPerimeter:
         float
             The length of the apical membrane.
         """
-        return math.dist(self._top_left.get_xy(), self._top_right.get_xy())
+        return self.__get_cache()["apical_memlen"]
 
     def get_basal_memlen(self) -> float:
         """
@@ -396,7 +445,7 @@ class QuadPerimeter:
         float
             The length of the basal membrane.
         """
-        return math.dist(self._bottom_left.get_xy(), self._bottom_right.get_xy())
+        return self.__get_cache()["basal_memlen"]
 
     def __assign_corners(self) -> None:
         """
@@ -436,6 +485,7 @@ class QuadPerimeter:
         """
         self._perimeter_vs = vertex_list
         self.__assign_corners()
+        self._cache_version = None
 
     def get_top_left(self) -> Vertex:
         """
@@ -506,13 +556,7 @@ class QuadPerimeter:
         float
             The area of the quadrilateral.
         """
-        s = self.get_perimeter_len() / 2
-        a = math.dist(self._top_left.get_xy(), self._bottom_left.get_xy())
-        b = math.dist(self._top_right.get_xy(), self._bottom_right.get_xy())
-        c = math.dist(self._top_left.get_xy(), self._top_right.get_xy())
-        d = math.dist(self._bottom_left.get_xy(), self._bottom_right.get_xy())
-        area = math.sqrt((s - a) * (s - b) * (s - c) * (s - d))
-        return round_to_sf(area, 6)
+        return self.__get_cache()["area"]
 
     def get_init_area(self) -> float:
         """
@@ -606,7 +650,10 @@ class QuadPerimeter:
         float
             The fraction of the total membrane that the direction's membrane represents.
         """
-        cell_perimeter = self.get_perimeter_len()
+        cache = self.__get_cache()
+        if (direction, left) in self._memfrac_cache:
+            return self._memfrac_cache[(direction, left)]
+        cell_perimeter = cache["perimeter_len"]
         if direction == "a":
             memfrac = self.get_apical_memlen() / cell_perimeter
         elif direction == "b":
@@ -621,4 +668,6 @@ class QuadPerimeter:
                 memfrac = self.get_left_memlen() / cell_perimeter
             else:
                 memfrac = self.get_right_memlen() / cell_perimeter
-        return round_to_sf(memfrac, 6)
+        memfrac = round_geometry(memfrac, 6)
+        self._memfrac_cache[(direction, left)] = memfrac
+        return memfrac
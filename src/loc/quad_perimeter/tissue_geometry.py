@@ -0,0 +1,140 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.sim.util.math_helpers import get_state_dtype, round_geometry
+
+if TYPE_CHECKING:
+    from src.agent.cell import Cell
+    from src.loc.vertex.vertex import Vertex
+
+# Columns of the corner index table, in the order QuadPerimeter.get_vs returns corners
+TOP_LEFT, TOP_RIGHT, BOTTOM_RIGHT, BOTTOM_LEFT = 0, 1, 2, 3
+
+
+def compute_tissue_geometry(coords: np.ndarray, corner_indices: np.ndarray) -> dict:
+    """
+    Computes the geometry of every cell at once.
+
+    Membrane lengths, perimeter length, area and bounds are computed with the same operations,
+    in the same order, as the corresponding QuadPerimeter methods, so they match them exactly.
+    Centroids are the mean of the four current corner positions. Everything is computed in
+    the state dtype, see `set_state_dtype`.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        (n_vertices, 2) array of vertex x and y coordinates.
+    corner_indices : np.ndarray
+        (n_cells, 4) array of the rows of `coords` holding each cell's top left, top right,
+        bottom right and bottom left corners.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Per-cell arrays 'apical_memlen', 'basal_memlen', 'left_memlen', 'right_memlen',
+        'perimeter_len', 'area' (rounded to 6 significant figures like
+        QuadPerimeter.get_area), 'centroid_x', 'centroid_y', 'min_x', 'max_x', 'min_y' and
+        'max_y'.
+    """
+    coords = np.asarray(coords, dtype=get_state_dtype())
+    corner_indices = np.asarray(corner_indices, dtype=int).reshape(-1, 4)
+    corners = coords[corner_indices]
+    top_left = corners[:, TOP_LEFT]
+    top_right = corners[:, TOP_RIGHT]
+    bottom_right = corners[:, BOTTOM_RIGHT]
+    bottom_left = corners[:, BOTTOM_LEFT]
+
+    def dist(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+        return np.hypot(p[:, 0] - q[:, 0], p[:, 1] - q[:, 1])
+
+    left = dist(top_left, bottom_left)
+    right = dist(top_right, bottom_right)
+    apical = dist(top_left, top_right)
+    basal = dist(bottom_left, bottom_right)
+    perimeter = left + right + apical + basal
+    s = perimeter / 2
+    with np.errstate(invalid="ignore"):
+        area = np.sqrt((s - left) * (s - right) * (s - apical) * (s - basal))
+    xs = corners[:, :, 0]
+    ys = corners[:, :, 1]
+    return {
+        "apical_memlen": apical,
+        "basal_memlen": basal,
+        "left_memlen": left,
+        "right_memlen": right,
+        "perimeter_len": perimeter,
+        "area": np.asarray(round_geometry(area, 6), dtype=coords.dtype),
+        "centroid_x": xs.mean(axis=1),
+        "centroid_y": ys.mean(axis=1),
+        "min_x": xs.min(axis=1),
+        "max_x": xs.max(axis=1),
+        "min_y": ys.min(axis=1),
+        "max_y": ys.max(axis=1),
+    }
+
+
+class TissueGeometry:
+    """
+    Geometry of every cell in a simulation, computed in one pass by `compute_tissue_geometry`.
+
+    Attributes
+    ----------
+    cells : list[Cell]
+        The cells, in the order of the rows of the geometry arrays.
+    vertices : list[Vertex]
+        The distinct corner vertices of the cells, in the order of the rows of `coords`.
+    coords : np.ndarray
+        (n_vertices, 2) array of vertex coordinates, in the state dtype.
+    corner_indices : np.ndarray
+        (n_cells, 4) array of the rows of `coords` holding each cell's corners, in
+        QuadPerimeter.get_vs order.
+    arrays : dict[str, np.ndarray]
+        Per-cell geometry arrays returned by `compute_tissue_geometry`.
+
+    Parameters
+    ----------
+    cells : list[Cell]
+        The cells to compute the geometry of.
+    """
+
+    def __init__(self, cells: list["Cell"]):
+        self.cells = list(cells)
+        self.vertices: list["Vertex"] = []
+        self.cell_rows: dict["Cell", int] = {}
+        vertex_rows: dict["Vertex", int] = {}
+        corner_indices = np.empty((len(self.cells), 4), dtype=int)
+        for row, cell in enumerate(self.cells):
+            self.cell_rows[cell] = row
+            for col, vertex in enumerate(cell.get_quad_perimeter().get_vs()):
+                if vertex not in vertex_rows:
+                    vertex_rows[vertex] = len(self.vertices)
+                    self.vertices.append(vertex)
+                corner_indices[row, col] = vertex_rows[vertex]
+        self.coords = np.array(
+            [(vertex.get_x(), vertex.get_y()) for vertex in self.vertices],
+            dtype=get_state_dtype(),
+        ).reshape(-1, 2)
+        self.corner_indices = corner_indices
+        self.arrays = compute_tissue_geometry(self.coords, self.corner_indices)
+
+    def __getitem__(self, quantity: str) -> np.ndarray:
+        return self.arrays[quantity]
+
+    def get_cell_value(self, cell: "Cell", quantity: str) -> float:
+        """
+        Returns one geometric quantity of one cell.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell.
+        quantity : str
+            Name of the quantity, one of the keys returned by `compute_tissue_geometry`.
+
+        Returns
+        -------
+        float
+            The cell's value of the quantity.
+        """
+        return float(self.arrays[quantity][self.cell_rows[cell]])
@@ -12,6 +12,9 @@ class Vertex:
         A list containing the x and y coordinates of the vertex.
     v_id : int, optional
         An optional identifier for the vertex.
+    version : int
+        Incremented every time the vertex moves, so objects caching quantities derived from
+        the vertex's position can tell when they are stale.
 
     Parameters
     ----------
@@ -46,6 +49,7 @@ class Vertex:
         self.y = y
         self.xy = [x, y]
         self.v_id = v_id
+        self.version = 0
 
     def get_xy(self) -> list[float]:
         """
@@ -91,6 +95,7 @@ class Vertex:
         """
         self.x = newx
         self.xy[0] = self.x
+        self.version += 1
 
     def set_y(self, newy: float) -> None:
         """
@@ -103,6 +108,7 @@ class Vertex:
         """
         self.y = newy
         self.xy[1] = self.y
+        self.version += 1
 
     def get_vid(self) -> int | None:
         """
@@ -114,3 +120,25 @@ class Vertex:
             The identifier of the vertex, or None if not set.
         """
         return self.v_id
+
+    def set_vid(self, v_id: int) -> None:
+        """
+        Set the identifier of the vertex.
+
+        Parameters
+        ----------
+        v_id : int
+            The new identifier of the vertex.
+        """
+        self.v_id = v_id
+
+    def get_version(self) -> int:
+        """
+        Get the number of times the vertex has moved.
+
+        Returns
+        -------
+        int
+            The vertex's version.
+        """
+        return self.version
@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from src.agent.cell import Cell
+    from src.loc.vertex.vertex import Vertex
+
+
+class VertexRegistry:
+    """
+    Tracks the vertices of the live tissue.
+
+    Every registered vertex has a unique ID. Vertices read from file keep the ID they were read
+    with, and vertices created during the simulation are given IDs after the largest ID seen so
+    far, so IDs are never reused. Each vertex is registered once per cell perimeter it belongs
+    to, and is dropped from the registry when the last of those cells is removed.
+
+    Attributes
+    ----------
+    ref_counts : dict[Vertex, int]
+        Number of references to each live vertex, in the order the vertices were registered.
+    vertices_by_id : dict[int, Vertex]
+        Each live vertex keyed by its ID.
+    next_v_id : int
+        The ID to be assigned to the next vertex registered without one.
+    """
+
+    def __init__(self) -> None:
+        self.ref_counts: dict["Vertex", int] = {}
+        self.vertices_by_id: dict[int, "Vertex"] = {}
+        self.next_v_id = 0
+
+    def add_vertex(self, vertex: "Vertex") -> None:
+        """
+        Adds a reference to a vertex, registering it and assigning it an ID if it is new.
+
+        Parameters
+        ----------
+        vertex : Vertex
+            The vertex to reference.
+
+        Raises
+        ------
+        ValueError
+            If the vertex is new and its ID belongs to another live vertex.
+        """
+        if vertex in self.ref_counts:
+            self.ref_counts[vertex] += 1
+            return
+        v_id = vertex.get_vid()
+        if v_id is None:
+            v_id = self.next_v_id
+            vertex.set_vid(v_id)
+        elif v_id in self.vertices_by_id:
+            raise ValueError(f"Vertex ID {v_id} already belongs to another vertex")
+        self.next_v_id = max(self.next_v_id, v_id + 1)
+        self.ref_counts[vertex] = 1
+        self.vertices_by_id[v_id] = vertex
+
+    def remove_vertex(self, vertex: "Vertex") -> None:
+        """
+        Removes a reference to a vertex, dropping the vertex once nothing references it.
+
+        Parameters
+        ----------
+        vertex : Vertex
+            The vertex to dereference.
+
+        Raises
+        ------
+        ValueError
+            If the vertex is not registered.
+        """
+        if vertex not in self.ref_counts:
+            raise ValueError("Vertex not in registry being removed from registry")
+        self.ref_counts[vertex] -= 1
+        if self.ref_counts[vertex] == 0:
+            del self.ref_counts[vertex]
+            # registered vertices always have an ID
+            del self.vertices_by_id[cast(int, vertex.get_vid())]
+
+    def add_cell(self, cell: "Cell") -> None:
+        """
+        Adds a reference to each vertex of a cell's perimeter.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell being added to the tissue.
+        """
+        for vertex in cell.get_quad_perimeter().get_vs():
+            self.add_vertex(vertex)
+
+    def remove_cell(self, cell: "Cell") -> None:
+        """
+        Removes a reference to each vertex of a cell's perimeter.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell being removed from the tissue.
+        """
+        for vertex in cell.get_quad_perimeter().get_vs():
+            self.remove_vertex(vertex)
+
+    def get_vertices(self) -> list["Vertex"]:
+        """
+        Returns the live vertices, in the order they were registered.
+
+        Returns
+        -------
+        list[Vertex]
+            The live vertices.
+        """
+        return list(self.ref_counts)
+
+    def get_vertex(self, v_id: int) -> "Vertex":
+        """
+        Returns the live vertex with an ID.
+
+        Parameters
+        ----------
+        v_id : int
+            The ID of the vertex.
+
+        Returns
+        -------
+        Vertex
+            The vertex.
+        """
+        return self.vertices_by_id[v_id]
+
+    def get_ref_count(self, vertex: "Vertex") -> int:
+        """
+        Returns the number of references to a vertex, 0 if it is not registered.
+
+        Parameters
+        ----------
+        vertex : Vertex
+            The vertex.
+
+        Returns
+        -------
+        int
+            The number of references to the vertex.
+        """
+        return self.ref_counts.get(vertex, 0)
+
+    def __len__(self) -> int:
+        return len(self.ref_counts)
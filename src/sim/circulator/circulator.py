@@ -1,10 +1,18 @@
+from math import ceil
 from typing import TYPE_CHECKING
-from src.sim.util.math_helpers import round_to_sf
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix, identity
+from scipy.sparse.linalg import spsolve
+from src.sim.util.math_helpers import get_state_dtype, round_in_stage, round_stage_output
 
 if TYPE_CHECKING:
     from src.sim.simulation.sim import GrowingSim
     from src.agent.cell import Cell
 
+TRANSPORT_SCHEMES = ("explicit", "implicit", "subcycled")
+# Schemes under which cells report transport rates rather than exchanged auxin
+RATE_TRANSPORT_SCHEMES = ("implicit", "subcycled")
+
 
 class Circulator:
     """
@@ -14,11 +22,29 @@ class Circulator:
     for each cell during a simulation. Cells report their auxin changes to the Circulator, which
     aggregates these changes and applies them at the end of each time step.
 
+    Under the 'explicit' transport scheme cells report both their own synthesis and
+    degradation and the auxin they exchange with neighbors as deltas, so transport is one
+    forward Euler step per tick. Under the 'implicit' scheme cells report only synthesis and
+    degradation as deltas, and their transport rates separately; the Circulator then takes one
+    backward Euler step of the tissue-wide transport system, which stays stable and keeps
+    auxin non-negative however fast transport is. The 'subcycled' scheme also has cells
+    report transport rates, but splits the tick into as many forward Euler substeps as the
+    fastest transport needs to stay non-negative, up to `max_transport_substeps`.
+
     Attributes
     ----------
     delta_auxins : dict[Cell, float]
         A dictionary to store the delta auxins for each cell, where keys are `Cell` instances
         and values are the delta auxins.
+    transport_rates : dict[Cell, list[tuple[Cell, float, float]]]
+        The transport rates reported by each cell under the 'implicit' and 'subcycled'
+        schemes, see `add_transport_rates`.
+    transport_scheme : str
+        How auxin transport is integrated, one of `TRANSPORT_SCHEMES`.
+    max_transport_substeps : int
+        The most substeps a tick is split into under the 'subcycled' scheme.
+    transport_substeps : int
+        The number of substeps the last tick was split into under the 'subcycled' scheme.
     sim : GrowingSim
         The simulation instance that this Circulator is a part of.
 
@@ -26,9 +52,18 @@ class Circulator:
     ----------
     sim : GrowingSim
         The simulation instance to which this Circulator belongs.
+    transport_scheme : str, optional
+        How auxin transport is integrated, 'explicit' (default), 'implicit' or 'subcycled'.
+    max_transport_substeps : int, optional
+        The most substeps a tick is split into under the 'subcycled' scheme. Default is 64.
     """
 
-    def __init__(self, sim: "GrowingSim"):
+    def __init__(
+        self,
+        sim: "GrowingSim",
+        transport_scheme: str = "explicit",
+        max_transport_substeps: int = 64,
+    ):
         """
         Initializes a new Circulator instance for managing delta auxins within a simulation.
 
@@ -36,10 +71,41 @@ class Circulator:
         ----------
         sim : GrowingSim
             The simulation instance to which this Circulator belongs.
+        transport_scheme : str, optional
+            How auxin transport is integrated, 'explicit' (default), 'implicit' or 'subcycled'.
+        max_transport_substeps : int, optional
+            The most substeps a tick is split into under the 'subcycled' scheme. Default is 64.
+
+        Raises
+        ------
+        ValueError
+            If `transport_scheme` is not one of `TRANSPORT_SCHEMES` or `max_transport_substeps`
+            is less than 1.
         """
+        if transport_scheme not in TRANSPORT_SCHEMES:
+            raise ValueError(
+                f"Unknown transport scheme {transport_scheme}, expected one of {TRANSPORT_SCHEMES}"
+            )
+        if max_transport_substeps < 1:
+            raise ValueError("max_transport_substeps must be at least 1")
         self.delta_auxins: dict["Cell", float] = dict()
+        self.transport_rates: dict["Cell", list[tuple["Cell", float, float]]] = dict()
+        self.transport_scheme = transport_scheme
+        self.max_transport_substeps = max_transport_substeps
+        self.transport_substeps = 0
         self.sim = sim
 
+    def get_transport_scheme(self) -> str:
+        """
+        Retrieve how auxin transport is integrated.
+
+        Returns
+        -------
+        str
+            One of `TRANSPORT_SCHEMES`.
+        """
+        return self.transport_scheme
+
     def get_delta_auxins(self) -> dict["Cell", float]:
         """
         Retrieve the current delta auxins managed by the Circulator.
@@ -58,7 +124,7 @@ class Circulator:
 
         If the cell already exists in the Circulator, the new delta is added to the existing value.
         If the cell does not exist, it is added with the specified delta auxin value. Values are
-        rounded to significant figures for precision management.
+        rounded to significant figures if the precision policy is 'legacy'.
 
         Parameters
         ----------
@@ -69,19 +135,112 @@ class Circulator:
 
         Notes
         -----
-        Infinites are checked and logged, and values are rounded to 10 significant figures.
+        Infinites are checked and logged, and under the 'legacy' precision policy values are
+        rounded to 10 significant figures.
         """
         if cell in self.delta_auxins:
             if delta == float("inf") or delta == float("-inf"):
                 print(f"cell {cell.get_c_id()} delta = {delta}")
-            delta = round_to_sf(delta, 10)
-            old_delta = round_to_sf(self.delta_auxins[cell], 10)
-            new_delta = round_to_sf(old_delta + delta, 10)
+            delta = round_in_stage(delta, 10)
+            old_delta = round_in_stage(self.delta_auxins[cell], 10)
+            new_delta = round_in_stage(old_delta + delta, 10)
             self.delta_auxins[cell] = new_delta
         else:
             if delta == float("inf") or delta == float("-inf"):
                 print(f"cell {cell.get_c_id()} delta = {delta}")
-            self.delta_auxins[cell] = round_to_sf(delta, 10)
+            self.delta_auxins[cell] = round_in_stage(delta, 10)
+
+    def add_transport_rates(self, cell: "Cell", rates: list[tuple["Cell", float, float]]) -> None:
+        """
+        Adds the rates at which auxin is transported between a cell and its neighbors.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell reporting its transport rates.
+        rates : list[tuple[Cell, float, float]]
+            One (neighbor, influx rate, efflux rate) tuple per neighbor, as returned by the
+            cell's circ module's `get_transport_rates`.
+        """
+        self.transport_rates.setdefault(cell, []).extend(rates)
+
+    def get_transport_system(self) -> tuple[list["Cell"], csc_matrix, np.ndarray, np.ndarray]:
+        """
+        Assembles the tissue-wide auxin transport system from the reported transport rates.
+
+        Each reported rate moves auxin from one cell to another, so every column of the
+        transport matrix T sums to zero and transport conserves total auxin. The negated
+        diagonal of T is the fraction of its auxin each cell exports per tick. T and the
+        vectors are in the state dtype, see `set_state_dtype`.
+
+        Returns
+        -------
+        tuple[list[Cell], csc_matrix, np.ndarray, np.ndarray]
+            The cells with delta auxins or transport rates, the transport matrix T over them,
+            and their auxin levels and delta auxins.
+        """
+        cells = list(self.delta_auxins)
+        index = {cell: i for i, cell in enumerate(cells)}
+        for cell, rates in self.transport_rates.items():
+            for other in [cell] + [neighbor for neighbor, _, _ in rates]:
+                if other not in index:
+                    index[other] = len(cells)
+                    cells.append(other)
+        rows, cols, vals = [], [], []
+        for cell, rates in self.transport_rates.items():
+            i = index[cell]
+            for neighbor, influx_rate, efflux_rate in rates:
+                j = index[neighbor]
+                rows.extend([i, j, i, j])
+                cols.extend([j, j, i, i])
+                vals.extend([influx_rate, -influx_rate, -efflux_rate, efflux_rate])
+        n = len(cells)
+        dtype = get_state_dtype()
+        transport = coo_matrix((vals, (rows, cols)), shape=(n, n), dtype=dtype).tocsc()
+        auxins = np.array([cell.get_circ_mod().get_auxin() for cell in cells], dtype=dtype)
+        deltas = np.array([self.delta_auxins.get(cell, 0) for cell in cells], dtype=dtype)
+        return cells, transport, auxins, deltas
+
+    def get_implicit_transport_auxins(self) -> tuple[list["Cell"], np.ndarray]:
+        """
+        Takes one backward Euler step of auxin transport from each cell's auxin level plus its
+        delta auxin.
+
+        Solves (I - T) x = a + d, where a and d are the cells' auxin levels and delta auxins and
+        T is the transport matrix from `get_transport_system`. I - T is an M-matrix, so x is
+        non-negative whenever a + d is.
+
+        Returns
+        -------
+        tuple[list[Cell], np.ndarray]
+            The cells with delta auxins or transport rates and their new auxin levels.
+        """
+        cells, transport, auxins, deltas = self.get_transport_system()
+        system = identity(len(cells), format="csc") - transport
+        return cells, np.atleast_1d(spsolve(system, auxins + deltas))
+
+    def get_subcycled_transport_auxins(self) -> tuple[list["Cell"], np.ndarray]:
+        """
+        Takes forward Euler substeps of auxin transport through the tick, adding an equal share
+        of each cell's delta auxin in every substep.
+
+        A forward Euler substep keeps auxin non-negative if no cell exports more than all of
+        its auxin in it, so the tick is split into the smallest number of substeps for which
+        the fastest exporting cell exports at most its whole auxin per substep, capped at
+        `max_transport_substeps`. With one substep this is the 'explicit' scheme's update.
+
+        Returns
+        -------
+        tuple[list[Cell], np.ndarray]
+            The cells with delta auxins or transport rates and their new auxin levels.
+        """
+        cells, transport, auxins, deltas = self.get_transport_system()
+        max_export = float(np.max(-transport.diagonal(), initial=0.0))
+        substeps = min(self.max_transport_substeps, max(1, ceil(max_export)))
+        self.transport_substeps = substeps
+        for _ in range(substeps):
+            auxins = auxins + (deltas + transport @ auxins) / substeps
+        return cells, auxins
 
     def update(self) -> None:
         """
@@ -89,12 +248,31 @@ class Circulator:
 
         This method iterates over all cells with recorded delta auxins, updates their
         auxin levels accordingly, and then resets the delta auxins for the next time step.
+        Under the 'implicit' and 'subcycled' transport schemes the reported transport rates are
+        applied too, see `get_implicit_transport_auxins` and `get_subcycled_transport_auxins`.
+        New auxin levels are widened to float64 and rounded together, as the output of the
+        tick's circulation stage, according to the precision policy.
+
+        Raises
+        ------
+        ValueError
+            If a cell's new auxin level is negative.
         """
-        for cell in self.delta_auxins:
-            old_aux = cell.get_circ_mod().get_auxin()
-            new_aux = round_to_sf(old_aux + self.delta_auxins[cell], 6)
+        if self.transport_scheme == "implicit":
+            cells, transport_auxs = self.get_implicit_transport_auxins()
+            new_auxs = round_stage_output(transport_auxs.astype(float), 6)
+        elif self.transport_scheme == "subcycled":
+            cells, transport_auxs = self.get_subcycled_transport_auxins()
+            new_auxs = round_stage_output(transport_auxs.astype(float), 6)
+        else:
+            cells = list(self.delta_auxins)
+            new_auxs = round_stage_output(
+                [cell.get_circ_mod().get_auxin() + self.delta_auxins[cell] for cell in cells], 6
+            )
+        for cell, new_aux in zip(cells, new_auxs):
             if new_aux < 0:
                 print(f"cell {cell.get_c_id()} new_aux = {new_aux}")
                 raise ValueError(f"Negative Auxin")
             cell.get_circ_mod().set_auxin(new_aux)
         self.delta_auxins = dict()
+        self.transport_rates = dict()
@@ -0,0 +1,182 @@
+from typing import TYPE_CHECKING, cast
+import numpy as np
+from scipy.sparse import coo_matrix, csc_matrix, identity
+from scipy.sparse.linalg import spsolve
+
+if TYPE_CHECKING:
+    from src.sim.simulation.sim import GrowingSim
+    from src.agent.cell import Cell
+
+
+class SteadyStateSolver:
+    """
+    Solves for the auxin distribution the circulation modules settle to on the simulation's
+    current, frozen geometry, without time-stepping the simulation.
+
+    At steady state each cell's ARR, AUX/LAX and PINs depend only on its own auxin, see
+    `calculate_steady_state` of the circulation modules, so the coupled synthesis,
+    degradation and transport system of all cells reduces to one equation per cell: the
+    cell's auxin synthesis and degradation plus the auxin it exchanges with its neighbors is
+    zero. This system is solved by Newton's method damped with pseudo-transient continuation,
+    each iteration one sparse direct solve, which converges from the cells' current auxin
+    even where the undamped Newton iteration would not.
+
+    Attributes
+    ----------
+    sim : GrowingSim
+        The simulation whose steady state is solved for.
+    tol : float
+        Relative tolerance on the largest net auxin change of any cell at the solution.
+    max_iterations : int
+        The most Newton iterations taken before giving up.
+    iterations : int
+        The number of Newton iterations the last solve took.
+
+    Parameters
+    ----------
+    sim : GrowingSim
+        The simulation whose steady state is solved for.
+    tol : float, optional
+        Relative tolerance on the largest net auxin change of any cell at the solution.
+        Default is 1e-12.
+    max_iterations : int, optional
+        The most Newton iterations taken before giving up. Default is 500.
+    """
+
+    sim: "GrowingSim"
+    tol: float
+    max_iterations: int
+    iterations: int
+
+    def __init__(self, sim: "GrowingSim", tol: float = 1e-12, max_iterations: int = 500):
+        self.sim = sim
+        self.tol = tol
+        self.max_iterations = max_iterations
+        self.iterations = 0
+
+    def get_transport_network(self) -> tuple[list["Cell"], np.ndarray]:
+        """
+        Collect the transport coefficients of every cell towards each of its neighbors.
+
+        Returns
+        -------
+        tuple[list[Cell], ndarray]
+            The cells, and one (cell index, neighbor index, membrane, influx coefficient,
+            efflux coefficient) row per cell and neighbor, see `get_transport_coefficients`.
+        """
+        cells = cast(list["Cell"], list(self.sim.get_cell_list()))
+        indices = {cell: index for index, cell in enumerate(cells)}
+        network = [
+            (index, indices[neighbor], membrane, influx, efflux)
+            for index, cell in enumerate(cells)
+            for neighbor, membrane, influx, efflux in (
+                cell.get_circ_mod().get_transport_coefficients()
+            )
+        ]
+        return cells, np.array(network, dtype=float).reshape(-1, 5)
+
+    def get_residual(
+        self, cells: list["Cell"], network: np.ndarray, auxins: np.ndarray
+    ) -> tuple[np.ndarray, csc_matrix, np.ndarray]:
+        """
+        Calculate every cell's net auxin change at the steady state of its other species, and
+        its Jacobian with respect to the cells' auxins.
+
+        Auxin synthesis and degradation and their derivative are evaluated with the circulation
+        modules' `rates` and `jacobian`, both generated by the modules' compiled models.
+
+        Parameters
+        ----------
+        cells : list[Cell]
+            The cells, as returned by `get_transport_network`.
+        network : ndarray
+            The transport coefficients, as returned by `get_transport_network`.
+        auxins : ndarray
+            The auxin concentration of each cell.
+
+        Returns
+        -------
+        tuple[ndarray, csc_matrix, ndarray]
+            The net auxin change of each cell, its Jacobian, and the steady state of each cell
+            as a row, ordered as in the circulation modules' `rates`.
+        """
+        n_cells = len(cells)
+        states = np.empty((n_cells, 8))
+        dstates = np.empty((n_cells, 8))
+        residual = np.empty(n_cells)
+        dresidual = np.empty(n_cells)
+        for index, cell in enumerate(cells):
+            circ_mod = cell.get_circ_mod()
+            states[index], dstates[index] = circ_mod.calculate_steady_state(auxins[index])
+            residual[index] = circ_mod.rates(states[index], 0.0)[0]
+            dresidual[index] = circ_mod.jacobian(states[index], 0.0)[0, 0]
+
+        source = network[:, 0].astype(int)
+        target = network[:, 1].astype(int)
+        pin_column = 4 + network[:, 2].astype(int)
+        influx = network[:, 3]
+        efflux = network[:, 4]
+        # Net auxin each source cell takes up from each target cell
+        auxlax = states[source, 2]
+        pindi = states[source, pin_column]
+        exchange = influx * auxlax * auxins[target] - efflux * pindi * auxins[source]
+        residual += np.bincount(source, exchange, n_cells)
+        residual -= np.bincount(target, exchange, n_cells)
+
+        dexchange_target = influx * auxlax
+        dexchange_source = influx * dstates[source, 2] * auxins[target] - efflux * (
+            dstates[source, pin_column] * auxins[source] + pindi
+        )
+        diagonal = np.arange(n_cells)
+        rows = np.concatenate([diagonal, source, source, target, target])
+        cols = np.concatenate([diagonal, target, source, target, source])
+        vals = np.concatenate(
+            [dresidual, dexchange_target, dexchange_source, -dexchange_target, -dexchange_source]
+        )
+        jacobian = coo_matrix((vals, (rows, cols)), shape=(n_cells, n_cells)).tocsc()
+        return residual, jacobian, states
+
+    def solve(self) -> dict["Cell", np.ndarray]:
+        """
+        Solve for the steady state of every cell, starting from the cells' current auxin.
+
+        Returns
+        -------
+        dict[Cell, ndarray]
+            The steady state of each cell, ordered as in the circulation modules' `rates`.
+
+        Raises
+        ------
+        ValueError
+            If the solve does not converge within `max_iterations` iterations.
+        """
+        cells, network = self.get_transport_network()
+        auxins = np.array([cell.get_circ_mod().get_auxin() for cell in cells], dtype=float)
+        residual, jacobian, states = self.get_residual(cells, network, auxins)
+        eye = identity(len(cells), format="csc")
+        pseudo_time_step = 1.0
+        for iteration in range(self.max_iterations + 1):
+            if np.abs(residual).max(initial=0.0) <= self.tol * max(1.0, auxins.max(initial=0.0)):
+                self.iterations = iteration
+                return {cell: state for cell, state in zip(cells, states)}
+            step = spsolve(eye / pseudo_time_step - jacobian, residual)
+            auxins = np.maximum(auxins + step, 0.0)
+            previous_norm = float(np.linalg.norm(residual))
+            residual, jacobian, states = self.get_residual(cells, network, auxins)
+            norm = float(np.linalg.norm(residual))
+            if norm > 0:
+                # Grow the pseudo time step as the residual falls, towards a pure Newton step
+                pseudo_time_step = min(pseudo_time_step * previous_norm / norm, 1e12)
+        raise ValueError(f"Steady state did not converge in {self.max_iterations} iterations")
+
+    def apply(self, states: dict["Cell", np.ndarray]) -> None:
+        """
+        Set every cell's species to its steady state.
+
+        Parameters
+        ----------
+        states : dict[Cell, ndarray]
+            The steady state of each cell, as returned by `solve`.
+        """
+        for cell, state in states.items():
+            cell.get_circ_mod().set_steady_state(state)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from src.loc.vertex.vertex import Vertex
 from src.agent.cell import Cell
 from src.agent.default_geo_neighbor_helpers import NeighborHelpers
@@ -18,6 +18,9 @@ class Divider:
     ----------
     cells_to_divide : list[Cell]
         A list of cells that are ready to divide.
+    split_vertices : dict[frozenset[Vertex], Vertex]
+        Vertices created to split a cell edge shared with a neighbor, keyed by the edge's two
+        end vertices, kept until the neighbor divides and reuses them.
     sim : GrowingSim
         The simulation instance this Divider is part of.
 
@@ -28,6 +31,7 @@ class Divider:
     """
 
     cells_to_divide: list["Cell"] = []
+    split_vertices: dict[frozenset["Vertex"], "Vertex"]
 
     def __init__(self, sim: "GrowingSim"):
         """
@@ -40,6 +44,7 @@ class Divider:
         """
         self.sim = sim
         self.cells_to_divide = []
+        self.split_vertices = {}
 
     def add_cell(self, cell: "Cell") -> None:
         """
@@ -76,50 +81,104 @@ class Divider:
             meristematic_cells_to_divide = [
                 cell for cell in self.cells_to_divide if cell.get_dev_zone() == "meristematic"
             ]
-            for cell in meristematic_cells_to_divide:
-                new_vs = self.get_new_vs(cell)
-                # check if those vertices exist by iterating through all vs in all neighbor cells' qps
-                left_v = self.check_neighbors_for_v_existence(cell, new_vs[0])
-                right_v = self.check_neighbors_for_v_existence(cell, new_vs[1])
-
-                # make new cell qp lists
-                new_upper_vs: list["Vertex"] = [
-                    cell.get_quad_perimeter().get_top_left(),
-                    cell.get_quad_perimeter().get_top_right(),
-                    right_v,
-                    left_v,
-                ]
-                new_lower_vs: list["Vertex"] = [
-                    left_v,
-                    right_v,
-                    cell.get_quad_perimeter().get_bottom_right(),
-                    cell.get_quad_perimeter().get_bottom_left(),
-                ]
-
-                # make new cells using those vertices
-                new_top_cell = Cell(
-                    self.sim,
-                    new_upper_vs,
-                    cell.get_circ_mod().get_state(),
-                    self.sim.get_next_cell_id(),
-                )
-
-                new_top_cell.set_growing(cell.get_growing())
-                new_bottom_cell = Cell(
-                    self.sim,
-                    new_lower_vs,
-                    cell.get_circ_mod().get_state(),
-                    self.sim.get_next_cell_id(),
-                )
-
-                # TODO: reconsider why I am setting growing here as opposed to when the cells are made?
-                new_bottom_cell.set_growing(cell.get_growing())
-                # update neighbor lists
-                self.update_neighbor_lists(new_top_cell, new_bottom_cell, cell)
-
-                self.sim.get_cell_list().remove(cell)
+            daughter_vs = self.get_daughter_vs(meristematic_cells_to_divide)
+            with self.sim.defer_cell_list_updates():
+                for cell in meristematic_cells_to_divide:
+                    self.divide_cell(cell, *daughter_vs[cell])
             self.cells_to_divide = []
 
+    def get_daughter_vs(
+        self, cells: list["Cell"]
+    ) -> dict["Cell", tuple[list["Vertex"], list["Vertex"]]]:
+        """
+        Finds the vertices of the daughters of every cell dividing this tick before any of
+        them divides.
+
+        Parameters
+        ----------
+        cells : list[Cell]
+            The cells to divide, in the order they divide.
+
+        Returns
+        -------
+        dict[Cell, tuple[list[Vertex], list[Vertex]]]
+            The vertices of the upper and lower daughter of each cell.
+        """
+        daughter_vs = {}
+        planned_split_vs: dict["Cell", list["Vertex"]] = {}
+        for cell in cells:
+            new_vs = self.get_new_vs(cell)
+            # reuse the vertices a neighbor created when it split the same edges
+            left_v = self.get_split_vertex(
+                cell,
+                new_vs[0],
+                cell.get_quad_perimeter().get_top_left(),
+                cell.get_quad_perimeter().get_bottom_left(),
+                planned_split_vs,
+            )
+            right_v = self.get_split_vertex(
+                cell,
+                new_vs[1],
+                cell.get_quad_perimeter().get_top_right(),
+                cell.get_quad_perimeter().get_bottom_right(),
+                planned_split_vs,
+            )
+            planned_split_vs[cell] = [left_v, right_v]
+
+            # make new cell qp lists
+            new_upper_vs: list["Vertex"] = [
+                cell.get_quad_perimeter().get_top_left(),
+                cell.get_quad_perimeter().get_top_right(),
+                right_v,
+                left_v,
+            ]
+            new_lower_vs: list["Vertex"] = [
+                left_v,
+                right_v,
+                cell.get_quad_perimeter().get_bottom_right(),
+                cell.get_quad_perimeter().get_bottom_left(),
+            ]
+            daughter_vs[cell] = (new_upper_vs, new_lower_vs)
+        return daughter_vs
+
+    def divide_cell(
+        self, cell: "Cell", new_upper_vs: list["Vertex"], new_lower_vs: list["Vertex"]
+    ) -> None:
+        """
+        Replaces a cell with two daughter cells.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell to divide.
+        new_upper_vs : list[Vertex]
+            The vertices of the upper daughter.
+        new_lower_vs : list[Vertex]
+            The vertices of the lower daughter.
+        """
+        # make new cells using those vertices
+        new_top_cell = Cell(
+            self.sim,
+            new_upper_vs,
+            cell.get_circ_mod().get_state(),
+            self.sim.get_next_cell_id(),
+        )
+
+        new_top_cell.set_growing(cell.get_growing())
+        new_bottom_cell = Cell(
+            self.sim,
+            new_lower_vs,
+            cell.get_circ_mod().get_state(),
+            self.sim.get_next_cell_id(),
+        )
+
+        # TODO: reconsider why I am setting growing here as opposed to when the cells are made?
+        new_bottom_cell.set_growing(cell.get_growing())
+        # update neighbor lists
+        self.update_neighbor_lists(new_top_cell, new_bottom_cell, cell)
+
+        self.sim.remove_from_cell_list(cell)
+
     def get_new_vs(self, cell: "Cell") -> list["Vertex"]:
         """
         Calculates locations of new vertices needed to dividide a given cell.
@@ -142,7 +201,59 @@ class Divider:
         new_right = Vertex(topright.get_x(), (topright.get_y() + bottomright.get_y()) / 2)
         return [new_left, new_right]
 
-    def check_neighbors_for_v_existence(self, cell: "Cell", new_vertex: Vertex) -> Vertex:
+    def get_split_vertex(
+        self,
+        cell: "Cell",
+        new_vertex: Vertex,
+        edge_top: Vertex,
+        edge_bottom: Vertex,
+        planned_split_vs: Optional[dict["Cell", list["Vertex"]]] = None,
+    ) -> Vertex:
+        """
+        Finds or creates the vertex splitting an edge of a dividing cell.
+
+        An edge is shared by at most one cell on each side, so the first cell to split it
+        records the split vertex under the edge's end vertices and the second cell takes it
+        from there. The two cells' daughters then share the vertex regardless of how the
+        vertices have moved since the first split. Edges no neighbor shares, e.g. on the
+        tissue boundary, are not recorded, as no other cell will split them.
+
+        Parameters
+        ----------
+        cell : Cell
+            The dividing cell.
+        new_vertex : Vertex
+            Vertex at the midpoint of the edge, used if the edge has not been split yet.
+        edge_top : Vertex
+            The top vertex of the edge.
+        edge_bottom : Vertex
+            The bottom vertex of the edge.
+        planned_split_vs : dict[Cell, list[Vertex]], optional
+            Split vertices already chosen for neighbors dividing earlier in the same tick.
+
+        Returns
+        -------
+        Vertex
+            The vertex splitting the edge.
+        """
+        edge = frozenset((edge_top, edge_bottom))
+        if edge in self.split_vertices:
+            return self.split_vertices.pop(edge)
+        # vertices not created by a split, e.g. read from file, are found by location
+        split_vertex = self.check_neighbors_for_v_existence(cell, new_vertex, planned_split_vs)
+        if any(
+            edge <= set(neighbor.get_quad_perimeter().get_vs())
+            for neighbor in cell.get_all_neighbors()
+        ):
+            self.split_vertices[edge] = split_vertex
+        return split_vertex
+
+    def check_neighbors_for_v_existence(
+        self,
+        cell: "Cell",
+        new_vertex: Vertex,
+        planned_split_vs: Optional[dict["Cell", list["Vertex"]]] = None,
+    ) -> Vertex:
         """
         Checks the neighboring cells for the existence of a given vertex.
 
@@ -152,15 +263,20 @@ class Divider:
             The cell whose neighbors are to be checked.
         new_vertex : Vertex
             The vertex to check for in the neighbors.
+        planned_split_vs : dict[Cell, list[Vertex]], optional
+            Split vertices already chosen for neighbors dividing earlier in the same tick,
+            which are checked as if those neighbors had already divided.
 
         Returns
         -------
         Vertex
             The existing vertex from neighbors if found; otherwise, the input new_vertex.
         """
+        if planned_split_vs is None:
+            planned_split_vs = {}
         for neighbor in cell.get_all_neighbors():
             neighbor_quad_p = neighbor.get_quad_perimeter()
-            for neighbor_vertex in neighbor_quad_p.get_vs():
+            for neighbor_vertex in neighbor_quad_p.get_vs() + planned_split_vs.get(neighbor, []):
                 if new_vertex.get_xy() == neighbor_vertex.get_xy():
                     return neighbor_vertex
         return new_vertex
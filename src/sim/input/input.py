@@ -4,6 +4,7 @@ import numpy as np
 import json
 from src.loc.vertex.vertex import Vertex
 from src.agent.cell import Cell
+from src.agent.adjacency_builder import build_adjacency
 from typing import TYPE_CHECKING
 import typing
 
@@ -112,7 +113,8 @@ class Input:
         elif vertex_file.endswith(".csv"):
             self.vertex_input = pd.read_csv(vertex_file)
             self.make_cell_vertices_to_list()
-            self.make_neighbors_to_list()
+            if "neighbors" in self.init_vals_input.columns:
+                self.make_neighbors_to_list()
         else:
             raise ValueError("Input file must be a JSON or CSV file.")
 
@@ -157,10 +159,14 @@ class Input:
         Creates new cells based on input files and updates their neighbors in the simulation.
 
         This method reads cell and vertex information from input files, creates new Cell instances,
-        assigns neighbors to these cells, and updates the simulation's cell list.
+        assigns neighbors to these cells, and updates the simulation's cell list. If the
+        initial values have no neighbors column, neighbors are derived from the cells' vertices.
         """
         cell_list = self.sim.get_cell_list()
         new_cells = self.create_cells()
+        if "neighbors" not in self.init_vals_input.columns:
+            self.assign_neighbors_from_geometry(new_cells)
+            return
         cell_neigbors = self.get_neighbors(new_cells)
 
         # update neighbors
@@ -259,7 +265,7 @@ class Input:
                         raise ValueError(f"Error evaluating {val}: {e}")
 
                 # Specifically handling neighbors to strip spaces from entries if it's a list of strings
-                if val == "neighbors" and isinstance(init_vals_dict[cell_num][val], list):
+                if val == "neighbors" and isinstance(init_vals_dict[cell_num].get(val), list):
                     init_vals_dict[cell_num][val] = [
                         item.strip()
                         for item in init_vals_dict[cell_num][val]
@@ -409,6 +415,21 @@ class Input:
             for neighbor in neighbors[cell]:
                 new_cells[cell].add_neighbor(neighbor)
 
+    def assign_neighbors_from_geometry(self, new_cells: dict) -> None:
+        """
+        Adds every pair of new cells that share a membrane as neighbors, with directions derived
+        from the cells' vertices.
+
+        Parameters
+        ----------
+        new_cells : dict
+            A dictionary with cell indices as keys and newly created Cell objects as values.
+        """
+        adjacency = build_adjacency(list(new_cells.values()), self.sim.get_root_midpointx())
+        for cell, neighbors in adjacency.items():
+            for neighbor, neighbor_dir, _ in neighbors:
+                cell.add_neighbor_in_dir(neighbor, neighbor_dir)
+
     def make_arr_hist_to_list(self) -> None:
         """
         Change arr_hist in init_vals from string to list after reading in.
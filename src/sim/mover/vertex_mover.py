@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+import numpy as np
 from src.agent.cell import Cell
 from src.loc.quad_perimeter.quad_perimeter import QuadPerimeter
 from src.loc.vertex.vertex import Vertex
@@ -180,15 +181,103 @@ class VertexMover:
         Propogates delta values to all basal neighbors of the top row of cells
         and adds the delta values to the bottom vertices of the cells.
 
+        The delta of each cell is the sum of the deltas of the cells above it in its file, so
+        it is computed as a cumulative sum along the files found by `get_file_order`.
+
         Parameters
         ----------
         top_row: list[Cell]
             The top row of cells in the root tip.
         """
-        for cell in top_row:
-            this_delta = self.cell_deltas[cell]
-            self.add_cell_b_vertices_to_vertex_deltas(cell, this_delta)
-            self.propogate_deltas_to_b_neighbors(cell, this_delta)
+        cells, files, writes = self.get_file_order(top_row)
+        deltas = [self.cell_deltas.get(cell, 0) for cell in cells]
+        cell_deltas = np.array(deltas, dtype=float)
+        # Growth rates can be the integer 0, sums of integer deltas are kept as integers
+        cell_int = np.array([isinstance(delta, int) for delta in deltas], dtype=bool)
+        file_deltas = np.empty(len(cells))
+        file_int = np.empty(len(cells), dtype=bool)
+        for start, stop, parent in files:
+            if parent < 0:
+                file_deltas[start:stop] = np.cumsum(cell_deltas[start:stop])
+                file_int[start:stop] = np.logical_and.accumulate(cell_int[start:stop])
+            else:
+                # Sum down the file from the parent's delta, in the same order as cell by cell
+                file_deltas[start:stop] = np.cumsum(
+                    np.concatenate(([file_deltas[parent]], cell_deltas[start:stop]))
+                )[1:]
+                file_int[start:stop] = np.logical_and.accumulate(
+                    np.concatenate(([file_int[parent]], cell_int[start:stop]))
+                )[1:]
+        written = np.array([position for position, _ in writes], dtype=int)
+        writers = np.array([writer for _, writer in writes], dtype=int)
+        has_writer = writers >= 0
+        writers = np.maximum(writers, 0)
+        written_deltas = np.where(
+            has_writer, file_deltas[writers] + cell_deltas[written], cell_deltas[written]
+        )
+        written_int = cell_int[written] & (file_int[writers] | ~has_writer)
+        for position, delta, is_int in zip(
+            written.tolist(), written_deltas.tolist(), written_int.tolist()
+        ):
+            if is_int:
+                delta = int(delta)
+            self.add_cell_b_vertices_to_vertex_deltas(cells[position], delta)
+
+    def get_file_order(
+        self, top_row: list["Cell"]
+    ) -> tuple[list["Cell"], list[tuple[int, int, int]], list[tuple[int, int]]]:
+        """
+        Orders the growing cells below the top row into files.
+
+        Cells are ordered depth first through growing basal neighbors, starting from each
+        top row cell in turn, and each cell is expanded once. A file is a run of consecutive
+        cells in this order in which each cell was reached from the previous one. A cell's
+        bottom vertices take the delta of the first expanded cell above it, which can differ
+        from the cell it was reached from where a cell has more than one apical neighbor.
+
+        Parameters
+        ----------
+        top_row: list[Cell]
+            The sorted top row of cells in the root tip.
+
+        Returns
+        -------
+        tuple[list[Cell], list[tuple[int, int, int]], list[tuple[int, int]]]
+            The cells in file order; for each file the start and stop positions of its cells
+            and the position of the cell above its first cell (-1 for files starting in the
+            top row); and, in the order their bottom vertices are assigned deltas, the
+            position of each cell and of the cell whose delta it adds to its own (-1 for top
+            row cells).
+        """
+        cells: list["Cell"] = []
+        positions: dict["Cell", int] = {}
+        files: list[tuple[int, int, int]] = []
+        written: list[tuple["Cell", int]] = []
+        written_cells: set["Cell"] = set()
+        for top_cell in top_row:
+            if top_cell not in written_cells:
+                written_cells.add(top_cell)
+                written.append((top_cell, -1))
+            stack = [(top_cell, -1)]
+            while stack:
+                cell, parent = stack.pop()
+                if cell in positions:
+                    continue
+                position = len(cells)
+                positions[cell] = position
+                cells.append(cell)
+                if parent >= 0 and parent == position - 1:
+                    files[-1] = (files[-1][0], position + 1, files[-1][2])
+                else:
+                    files.append((position, position + 1, parent))
+                for b_neighbor in cell.get_b_neighbors():
+                    if b_neighbor.get_growing():
+                        if b_neighbor not in written_cells:
+                            written_cells.add(b_neighbor)
+                            written.append((b_neighbor, position))
+                        stack.append((b_neighbor, position))
+        writes = [(positions[cell], writer) for cell, writer in written]
+        return cells, files, writes
 
     def add_cell_b_vertices_to_vertex_deltas(self, cell: Cell, delta: float) -> None:
         """
@@ -212,29 +301,6 @@ class VertexMover:
         else:
             self.vertex_deltas[bottom_right_v] = delta
 
-    def propogate_deltas_to_b_neighbors(self, cell: Cell, delta: float) -> None:
-        """
-        Propogates the delta value to all basal neighbor cells.
-
-        Parameters
-        ----------
-        cell: Cell
-            The cell for which the delta value is being propogated.
-        delta: float
-            The delta value to be propogated.
-        """
-        stack = [(cell, delta)]
-        while stack:
-            cell, delta = stack.pop()
-            for b_neighbor in cell.get_b_neighbors():
-                if b_neighbor.get_growing():
-                    if b_neighbor in self.cell_deltas:
-                        neighbor_delta = self.cell_deltas[b_neighbor]
-                    else:
-                        neighbor_delta = 0
-                    self.add_cell_b_vertices_to_vertex_deltas(b_neighbor, delta + neighbor_delta)
-                    stack.append((b_neighbor, delta + neighbor_delta))
-
     def execute_vertex_movement(self, max_delta: float) -> None:
         """
         Moves the vertices based on the delta values in the vertex_deltas dictionary.
@@ -247,14 +313,14 @@ class VertexMover:
         for vertex in self.vertex_deltas:
             vertex.set_y(vertex.get_y() + self.vertex_deltas[vertex])
         # iterate through all nongrowing cells in root tip, move all basal vertices not yet moved
-        moved_vs = list(self.vertex_deltas.keys())
+        moved_vs = set(self.vertex_deltas)
         for cell in self.sim.get_cell_list():
             if not cell.get_growing() and cell.get_dev_zone() is "roottip":
                 vertices = cell.get_quad_perimeter().get_vs()
                 for vertex in vertices:
                     if vertex not in moved_vs:
                         vertex.set_y(vertex.get_y() + max_delta)
-                        moved_vs.append(vertex)
+                        moved_vs.add(vertex)
 
     def check_if_divide(self, cells: list["Cell"]) -> None:
         """
@@ -265,8 +331,9 @@ class VertexMover:
         cells: list[Cell]
             The list of cells this VertexMover affected this time point.
         """
+        tissue_geometry = self.sim.get_tissue_geometry()
         for cell in cells:
-            if cell.get_quad_perimeter().get_area() >= (
+            if tissue_geometry.get_cell_value(cell, "area") >= (
                 2 * cell.get_quad_perimeter().get_init_area()
             ):
                 self.sim.get_divider().add_cell(cell)
@@ -1,6 +1,6 @@
 import csv
 import json
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from src.sim.simulation.sim import GrowingSim
@@ -22,6 +22,8 @@ class Output:
         The name of the CSV file to which output data will be written.
     filename_json : str
         The name of the JSON file to which output data will be written.
+    write_vertex_ids : bool
+        Whether the IDs of each cell's vertices are written, in the order of its location.
 
     Parameters
     ----------
@@ -31,9 +33,17 @@ class Output:
         The filename for the output CSV file.
     filename_json : str
         The filename for the output JSON file.
+    write_vertex_ids : bool, optional
+        Whether the IDs of each cell's vertices are written, in the order of its location.
     """
 
-    def __init__(self, sim: "GrowingSim", filename_csv: str, filename_json: str):
+    def __init__(
+        self,
+        sim: "GrowingSim",
+        filename_csv: str,
+        filename_json: str,
+        write_vertex_ids: bool = False,
+    ):
         """
         Initializes the Output object with a simulation instance and output filenames.
 
@@ -45,10 +55,13 @@ class Output:
             The filename for the output CSV file.
         filename_json : str
             The filename for the output JSON file.
+        write_vertex_ids : bool, optional
+            Whether the IDs of each cell's vertices are written, in the order of its location.
         """
         self.sim = sim
         self.filename_csv = filename_csv
         self.filename_json = filename_json
+        self.write_vertex_ids = write_vertex_ids
         self.title_labels_written_to_output_file = False
 
     def output_cells(self) -> None:
@@ -57,7 +70,9 @@ class Output:
 
         This method gathers data from each cell within the simulation, including
         concentrations, locations, and PIN distributions, and writes this information
-        to the specified output files.
+        to the specified output files. Membrane lengths are read from the simulation's
+        `TissueGeometry`, so they have the precision of the state dtype, see
+        `set_state_dtype`.
         """
         if self.title_labels_written_to_output_file == False:
             if len(self.sim.get_cell_list()) <= 0:
@@ -74,6 +89,8 @@ class Output:
                 "dev_zone",
                 "cell_type",
             ]
+            if self.write_vertex_ids:
+                sim_and_cell_contents.insert(3, "vertex_ids")
             self.sim_and_cell_contents = sim_and_cell_contents
             circ_contents = list(self.sim.get_cell_list()[0].get_circ_mod().get_state().keys())
             self.circ_contents = circ_contents
@@ -82,16 +99,20 @@ class Output:
                 writer.writerow(sim_and_cell_contents + circ_contents)
             self.title_labels_written_to_output_file = True
         output = []
-        cell_list = list(self.sim.get_cell_list())
-        for cell in cell_list:
+        tissue_geometry = self.sim.get_tissue_geometry()
+        memlens = {
+            memlen: tissue_geometry[memlen].tolist()
+            for memlen in ["apical_memlen", "basal_memlen", "left_memlen", "right_memlen"]
+        }
+        for row, cell in enumerate(tissue_geometry.cells):
             summary: dict[str, Any] = {}
             summary["tick"] = self.sim.get_tick()
             summary["cell"] = cell.get_c_id()
             summary["location"] = cell.quad_perimeter.get_corners_for_disp()
-            summary["apical_memlen"] = cell.quad_perimeter.get_apical_memlen()
-            summary["basal_memlen"] = cell.quad_perimeter.get_basal_memlen()
-            summary["left_memlen"] = cell.quad_perimeter.get_left_memlen()
-            summary["right_memlen"] = cell.quad_perimeter.get_right_memlen()
+            if self.write_vertex_ids:
+                summary["vertex_ids"] = self.get_vertex_ids(cell)
+            for memlen, values in memlens.items():
+                summary[memlen] = values[row]
             summary["dev_zone"] = cell.get_dev_zone()
             summary["cell_type"] = cell.get_cell_type()
             summary.update(self.get_circ_contents(summary, cell))
@@ -125,6 +146,32 @@ class Output:
         """
         return cell.get_circ_mod().get_state()
 
+    def get_vertex_ids(self, cell: "Cell") -> list[int]:
+        """
+        Returns the IDs of a cell's vertices, in the order of the cell's location.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell whose vertex IDs are returned.
+
+        Returns
+        -------
+        list[int]
+            The IDs of the bottom right, bottom left, top left and top right vertices.
+        """
+        qp = cell.get_quad_perimeter()
+        # the vertices of live cells are registered, so they all have IDs
+        return [
+            cast(int, vertex.get_vid())
+            for vertex in [
+                qp.get_bottom_right(),
+                qp.get_bottom_left(),
+                qp.get_top_left(),
+                qp.get_top_right(),
+            ]
+        ]
+
     def get_division_number(self, cell: "Cell") -> int:
         """
         Retrieves the number of divisions a cell has undergone.
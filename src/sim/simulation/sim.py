@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Optional, cast
+from contextlib import contextmanager
 import os
 import pyglet
 import pandas
@@ -7,19 +8,26 @@ import matplotlib.pyplot as plt
 from arcade import Window, draw_polygon_filled
 from arcade import SpriteList
 from arcade import set_background_color
-from arcade import close_window, set_window
+from arcade import close_window, get_window, set_window
 import time
 from src.sim.circulator.circulator import Circulator
+from src.sim.circulator.steady_state_solver import SteadyStateSolver
+from src.agent.arr_delay_line import ArrDelayLine
+from src.agent.circ_module import set_ode_warm_start
 from src.sim.divider.divider import Divider
 from src.sim.mover.vertex_mover import VertexMover
 from src.sim.input.input import Input
 from src.sim.output.output import Output
+from src.loc.quad_perimeter.tissue_geometry import TissueGeometry
+from src.loc.vertex.vertex_registry import VertexRegistry
+from src.sim.util.math_helpers import set_precision_policy, set_state_dtype
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 800
 SCREEN_TITLE = "ARORA"
 
 if TYPE_CHECKING:
+    import numpy as np
     from src.agent.cell import Cell
     from pandas import Series
 
@@ -46,8 +54,11 @@ class GrowingSim(Window):
         The x-coordinate of the midpoint of the root, used for positioning.
     cell_list : SpriteList
         A list of cells currently present in the simulation.
-    vertex_list : list
-        A list of vertices currently present in the simulation.
+    vertex_registry : VertexRegistry
+        The vertices of the cells currently present in the simulation.
+    arr_delay_lines : dict[int, ArrDelayLine]
+        The ARR histories of the cells currently present in the simulation, keyed by
+        history length.
     vis : bool
         Indicates whether the simulation should be visualized.
     next_cell_id : int
@@ -60,6 +71,8 @@ class GrowingSim(Window):
         Path to the file containing vertex information.
     input_from_file : bool, optional
         Specifies whether initial values for the simulation are being loaded from files.
+    cell_list_version : int
+        Incremented every time a cell is added to or removed from the cell list.
 
     Parameters
     ----------
@@ -81,6 +94,25 @@ class GrowingSim(Window):
         Series containing global parameters for the simulation.
     geometry : str, optional
         Indicates the geometric configuration of the simulation.
+    output_file : str, optional
+        Path, without extension, of the CSV and JSON output files.
+    output_vertex_ids : bool, optional
+        Whether the IDs of each cell's vertices are written to the output files.
+    precision_policy : str, optional
+        How values are rounded during the run, one of 'legacy', 'vectorized' or 'none'. See
+        `set_precision_policy`.
+    state_dtype : str, optional
+        Floating point type of the run's bulk arrays, 'float64' or 'float32'. See
+        `set_state_dtype`.
+    transport_scheme : str, optional
+        How the circulator integrates auxin transport, 'explicit', 'implicit' or 'subcycled'.
+        See `Circulator`.
+    max_transport_substeps : int, optional
+        The most substeps the circulator splits a tick into under the 'subcycled' transport
+        scheme.
+    ode_warm_start : bool, optional
+        Whether each cell's ODE solve starts from the step size its previous solve ended
+        with. See `set_ode_warm_start`.
 
     """
 
@@ -90,13 +122,15 @@ class GrowingSim(Window):
     divider: "Divider"
     root_midpointx: float
     cell_list: SpriteList
-    vertex_list: list
+    vertex_registry: VertexRegistry
+    arr_delay_lines: dict[int, ArrDelayLine]
     vis: bool
     next_cell_id: int
     root_tip_y: float = 0
     cell_val_file: str
     v_file: str
     input_from_file: bool = False
+    cell_list_version: int = 0
 
     def __init__(
         self,
@@ -110,12 +144,28 @@ class GrowingSim(Window):
         gparam_series: pandas.core.series.Series | str = "",
         geometry: str = "",
         output_file: str = "output",
+        output_vertex_ids: bool = False,
+        precision_policy: str = "legacy",
+        state_dtype: str = "float64",
+        transport_scheme: str = "explicit",
+        max_transport_substeps: int = 64,
+        ode_warm_start: bool = False,
     ):
         """
         Initializes a new instance of the GrowingSim class, setting up the simulation environment and parameters.
         """
+        set_precision_policy(precision_policy)
+        set_state_dtype(state_dtype)
+        set_ode_warm_start(ode_warm_start)
+        self.transport_scheme = transport_scheme
+        self.max_transport_substeps = max_transport_substeps
         self.cell_list = SpriteList(use_spatial_hash=False)
-        self.vertex_list = []
+        self.vertex_registry = VertexRegistry()
+        self.arr_delay_lines = {}
+        self.cell_list_version = 0
+        self._tissue_geometry: Optional[TissueGeometry] = None
+        self._tissue_geometry_key: Optional[tuple[int, int]] = None
+        self._deferred_cells: Optional[list["Cell"]] = None
         if vis is False:
             print("Running headless")
             # for mac
@@ -138,7 +188,9 @@ class GrowingSim(Window):
         self.vis = vis
         self.cmap = plt.get_cmap("coolwarm")
         self.setup()
-        self.output = Output(self, f"{output_file}.csv", f"{output_file}.json")
+        self.output = Output(
+            self, f"{output_file}.csv", f"{output_file}.json", write_vertex_ids=output_vertex_ids
+        )
         self.exit_flag = False
 
     def get_root_midpointx(self) -> float:
@@ -196,6 +248,10 @@ class GrowingSim(Window):
         """Returns the vertex mover of the simulation."""
         return self.vertex_mover
 
+    def get_vertex_registry(self) -> VertexRegistry:
+        """Returns the registry of the vertices in the simulation."""
+        return self.vertex_registry
+
     def get_cell_list(self) -> SpriteList:
         """Returns the list of all cells in the simulation."""
         return self.cell_list
@@ -215,16 +271,85 @@ class GrowingSim(Window):
     def add_to_cell_list(self, cell: "Cell") -> None:
         """Adds a cell to the cell_list."""
         self.cell_list.append(cell)
-        new_vs = cell.get_quad_perimeter().get_vs()
-        self.vertex_list.extend(new_vs)
+        self.cell_list_version += 1
+        self.vertex_registry.add_cell(cell)
+        if self._deferred_cells is not None:
+            self._deferred_cells.append(cell)
+            return
         self.root_midpointx = self.calculate_root_midpoint_x_from_vertex_list()
         cell.get_circ_mod().update_left_right()
 
+    @contextmanager
+    def defer_cell_list_updates(self) -> Iterator[None]:
+        """
+        Defers the root midpoint update and the lateral/medial sides of cells added to the
+        cell_list until the end of the block, so adding many cells at once updates them once.
+
+        Cells added inside the block see the root midpoint from before the block.
+        """
+        if self._deferred_cells is not None:
+            yield
+            return
+        self._deferred_cells = []
+        try:
+            yield
+        finally:
+            added_cells, self._deferred_cells = self._deferred_cells, None
+            self.root_midpointx = self.calculate_root_midpoint_x_from_vertex_list()
+            for cell in added_cells:
+                cell.get_circ_mod().update_left_right()
+
     def remove_from_cell_list(self, cell: "Cell") -> None:
         """Removes a cell from the cell_list."""
         if cell not in self.cell_list:
             raise ValueError("Cell not in cell_list being removed from cell_list")
         self.cell_list.remove(cell)
+        self.cell_list_version += 1
+        self.vertex_registry.remove_cell(cell)
+        cell.get_circ_mod().remove_arr_hist()
+
+    def get_arr_delay_line(self, length: int) -> ArrDelayLine:
+        """
+        Returns the delay line holding the ARR histories of the given length, creating it if
+        no cell has such a history yet.
+        """
+        if length not in self.arr_delay_lines:
+            self.arr_delay_lines[length] = ArrDelayLine(length)
+        return self.arr_delay_lines[length]
+
+    def get_tissue_geometry(self) -> TissueGeometry:
+        """
+        Returns the geometry of every cell, computed in one vectorized pass.
+
+        The geometry is recomputed only if a cell was added or removed or a vertex moved
+        since it was last computed, so all consumers within a tick share one computation.
+
+        Returns
+        -------
+        TissueGeometry
+            The current geometry of every cell in the cell list.
+        """
+        vertices = self.vertex_registry.get_vertices()
+        key = (self.cell_list_version, sum(vertex.version for vertex in vertices))
+        if self._tissue_geometry is None or key != self._tissue_geometry_key:
+            self._tissue_geometry = TissueGeometry(cast(list["Cell"], self.cell_list))
+            self._tissue_geometry_key = key
+        return self._tissue_geometry
+
+    def solve_steady_state(self) -> dict["Cell", "np.ndarray"]:
+        """
+        Sets every cell to the steady state its circulation module settles to on the current
+        geometry, solved for directly rather than by time-stepping the simulation.
+
+        Returns
+        -------
+        dict[Cell, np.ndarray]
+            The steady state of each cell, see `SteadyStateSolver.solve`.
+        """
+        solver = SteadyStateSolver(self)
+        states = solver.solve()
+        solver.apply(states)
+        return states
 
     def setup(self) -> None:
         """
@@ -236,7 +361,7 @@ class GrowingSim(Window):
         # find midpoint x of root basd on vertices that exist
         self.tick = 0
         self.next_cell_id = 0
-        self.circulator = Circulator(self)
+        self.circulator = Circulator(self, self.transport_scheme, self.max_transport_substeps)
         self.vertex_mover = VertexMover(self)
         self.divider = Divider(self)
         if self.input_from_file:
@@ -254,20 +379,16 @@ class GrowingSim(Window):
 
     def calculate_root_tip_y(self) -> float:
         """Calculates the y-coordinate of the tip of the root."""
-        ys = []
         if len(self.cell_list) == 0:
             return 0
-        for cell in self.cell_list:
-            y = cell.get_quad_perimeter().get_min_y()
-            ys.append(y)
-        return min(ys)
+        return float(self.get_tissue_geometry()["min_y"].min())
 
     def calculate_root_midpoint_x_from_vertex_list(self) -> float:
-        """Calculates the midpoint of the x-coordinates from the vertex list."""
+        """Calculates the midpoint of the x-coordinates from the vertex registry."""
         xs = []
-        if len(self.vertex_list) == 0:
+        if len(self.vertex_registry) == 0:
             return 0
-        for vertex in self.vertex_list:
+        for vertex in self.vertex_registry.get_vertices():
             x = vertex.get_x()
             xs.append(x)
         min_x = min(xs)
@@ -329,12 +450,14 @@ class GrowingSim(Window):
                     self.update_viewport_position()
                     self.on_draw()
                 self.cell_list.update()
+                for arr_delay_line in self.arr_delay_lines.values():
+                    arr_delay_line.advance()
                 self.vertex_mover.update()
                 self.circulator.update()
                 self.divider.update()
                 self.root_tip_y = self.calculate_root_tip_y()
                 total_aux = sum([cell.get_circ_mod().get_auxin() for cell in self.cell_list])
-                total_area = sum([cell.get_quad_perimeter().get_area() for cell in self.cell_list])
+                total_area = sum(self.get_tissue_geometry()["area"].tolist())
                 print(f"Total auxin: {total_aux}")
                 print(f"Total area: {total_area}")
                 print(f"Total auxin/area = {total_aux/total_area}")
@@ -357,6 +480,21 @@ class GrowingSim(Window):
         print("WINDOW CLOSED")
         pyglet.app.exit()  # Exit the pyglet event loop
 
+    def close(self) -> None:
+        """
+        Closes the window without unsetting another simulation's active window.
+
+        arcade unsets the active window whenever any window is closed, including when pyglet
+        closes a simulation's window again as it is garbage collected.
+        """
+        try:
+            active_window = get_window()
+        except RuntimeError:
+            active_window = None
+        super().close()
+        if active_window is not None and active_window is not self:
+            set_window(active_window)
+
 
 def main(
     timestep: int,
@@ -1,4 +1,5 @@
 from math import log10, floor
+from typing import Iterable, overload
 import numpy as np
 
 
@@ -30,3 +31,212 @@ def round_to_sf(number: float, sf: int) -> float:
     magnitude = int(floor(log10(abs(number))))
     rounding_digit = sf - 1 - magnitude
     return round(number, rounding_digit)
+
+
+def round_to_sf_array(numbers: np.ndarray, sf: int) -> np.ndarray:
+    """
+    Rounds every element of an array to a specified number of significant figures.
+
+    Gives the same result as calling `round_to_sf` on each element as a Python float.
+    Elements whose scaled value lies too close to a rounding tie, or whose magnitude lies too
+    close to a power of ten, for the vectorized computation to be exact are rounded with
+    `round_to_sf`.
+
+    Parameters
+    ----------
+    numbers : np.ndarray
+        The numbers to be rounded.
+    sf : int
+        The number of significant figures to round to.
+
+    Returns
+    -------
+    np.ndarray
+        The numbers rounded to the specified number of significant figures. Zero, NaN and
+        infinite elements are returned unchanged.
+    """
+    numbers = np.asarray(numbers, dtype=float)
+    rounded = numbers.copy()
+    to_round = np.isfinite(numbers) & (numbers != 0)
+    values = numbers[to_round]
+    log = np.log10(np.abs(values))
+    digits = sf - 1 - np.floor(log)
+    # Scale so the digits to keep are integral; powers of ten are exact up to 1e22
+    scale = 10.0 ** np.abs(digits)
+    scaled = np.where(digits >= 0, values * scale, values / scale)
+    integral = np.rint(scaled)
+    result = np.where(digits >= 0, integral / scale, integral * scale)
+    fraction = np.abs(scaled - np.trunc(scaled))
+    inexact = (
+        (np.abs(log - np.rint(log)) < 1e-9)
+        | (np.abs(fraction - 0.5) < 1e-6)
+        | (np.abs(digits) > 22)
+    )
+    for i in np.flatnonzero(inexact):
+        result[i] = round_to_sf(float(values[i]), sf)
+    rounded[to_round] = result
+    return rounded
+
+
+PRECISION_POLICIES = ("legacy", "vectorized", "none")
+_precision_policy = "legacy"
+
+
+def set_precision_policy(policy: str) -> None:
+    """
+    Sets how simulation values are rounded for the rest of the run.
+
+    Parameters
+    ----------
+    policy : str
+        'legacy' rounds every intermediate and stage output to significant figures one value at
+        a time, as the model always has. 'vectorized' rounds only stage outputs, whole arrays at
+        a time with `round_to_sf_array`, and keeps intermediates at full precision. 'none' keeps
+        every value at full float64 precision.
+
+    Raises
+    ------
+    ValueError
+        If `policy` is not one of `PRECISION_POLICIES`.
+    """
+    global _precision_policy
+    if policy not in PRECISION_POLICIES:
+        raise ValueError(f"Unknown precision policy {policy}, expected one of {PRECISION_POLICIES}")
+    _precision_policy = policy
+
+
+def get_precision_policy() -> str:
+    """
+    Returns the precision policy in effect.
+
+    Returns
+    -------
+    str
+        One of `PRECISION_POLICIES`.
+    """
+    return _precision_policy
+
+
+def round_in_stage(number: float, sf: int) -> float:
+    """
+    Rounds an intermediate value computed within a stage, such as an auxin exchange or a
+    partial delta, to significant figures if the precision policy is 'legacy'.
+
+    Parameters
+    ----------
+    number : float
+        The number to be rounded.
+    sf : int
+        The number of significant figures to round to.
+
+    Returns
+    -------
+    float
+        The rounded number under the 'legacy' policy, otherwise `number` unchanged.
+    """
+    if _precision_policy == "legacy":
+        return round_to_sf(number, sf)
+    return number
+
+
+def round_stage_output(numbers: Iterable[float], sf: int) -> list[float]:
+    """
+    Rounds the values a stage hands on to the rest of the simulation, such as a cell's new
+    concentrations, according to the precision policy.
+
+    Parameters
+    ----------
+    numbers : iterable of float
+        The numbers to be rounded.
+    sf : int
+        The number of significant figures to round to.
+
+    Returns
+    -------
+    list[float]
+        The numbers rounded one at a time with `round_to_sf` under the 'legacy' policy, rounded
+        together with `round_to_sf_array` under the 'vectorized' policy and unchanged under the
+        'none' policy.
+    """
+    if _precision_policy == "legacy":
+        return [round_to_sf(number, sf) for number in numbers]
+    if _precision_policy == "vectorized":
+        return round_to_sf_array(np.fromiter(numbers, dtype=float), sf).tolist()
+    return list(numbers)
+
+
+@overload
+def round_geometry(numbers: float, sf: int) -> float: ...
+
+
+@overload
+def round_geometry(numbers: np.ndarray, sf: int) -> np.ndarray: ...
+
+
+def round_geometry(numbers: float | np.ndarray, sf: int) -> float | np.ndarray:
+    """
+    Rounds geometric quantities, such as areas and membrane fractions, to significant figures
+    unless the precision policy is 'none'. These are computed once per shape change rather than
+    per tick, so both 'legacy' and 'vectorized' keep rounding them.
+
+    Parameters
+    ----------
+    numbers : float or np.ndarray
+        The number or array of numbers to be rounded.
+    sf : int
+        The number of significant figures to round to.
+
+    Returns
+    -------
+    float or np.ndarray
+        The rounded number or array, or `numbers` unchanged under the 'none' policy.
+    """
+    if _precision_policy == "none":
+        return numbers
+    if isinstance(numbers, np.ndarray):
+        return round_to_sf_array(numbers, sf)
+    return round_to_sf(numbers, sf)
+
+
+STATE_DTYPES = ("float64", "float32")
+_state_dtype = np.dtype("float64")
+
+
+def set_state_dtype(dtype: str) -> None:
+    """
+    Sets the floating point type of the simulation's bulk arrays for the rest of the run.
+
+    The type covers the arrays held or rebuilt every tick for the whole tissue: the ARR delay
+    lines, the vertex coordinates and per-cell geometry of `TissueGeometry` and the transport
+    operator and auxin vectors the circulator assembles. 'float32' halves their memory and
+    memory traffic. The ODE integration, the steady-state solver and reductions such as total
+    auxin and area stay in float64, and values handed back to the cells are widened to
+    float64. The membrane lengths `Output` writes are read from `TissueGeometry`, so under
+    'float32' they carry float32 rounding, up to about 1e-6 relative to float64.
+
+    Parameters
+    ----------
+    dtype : str
+        'float64' or 'float32'.
+
+    Raises
+    ------
+    ValueError
+        If `dtype` is not one of `STATE_DTYPES`.
+    """
+    global _state_dtype
+    if dtype not in STATE_DTYPES:
+        raise ValueError(f"Unknown state dtype {dtype}, expected one of {STATE_DTYPES}")
+    _state_dtype = np.dtype(dtype)
+
+
+def get_state_dtype() -> np.dtype:
+    """
+    Returns the floating point type of the simulation's bulk arrays.
+
+    Returns
+    -------
+    np.dtype
+        float64 or float32, see `set_state_dtype`.
+    """
+    return _state_dtype
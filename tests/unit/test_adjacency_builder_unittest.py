@@ -0,0 +1,92 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from src.agent.adjacency_builder import build_adjacency, find_edge_contacts
+from src.agent.cell import Cell
+from src.loc.vertex.vertex import Vertex
+from src.sim.simulation.sim import GrowingSim
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+init_vals = {
+    "auxin": 2,
+    "arr": 3,
+    "al": 3,
+    "pin": 1,
+    "pina": 0.5,
+    "pinb": 0.7,
+    "pinl": 0.4,
+    "pinm": 0.2,
+    "k1": 1,
+    "k2": 1,
+    "k3": 1,
+    "k4": 1,
+    "k5": 1,
+    "k6": 1,
+    "k_s": 0.005,
+    "k_d": 0.0015,
+    "auxin_w": 1,
+    "arr_hist": [0.1, 0.2, 0.3],
+    "growing": False,
+    "circ_mod": "cont",
+}
+
+
+class TestAdjacencyBuilder(unittest.TestCase):
+
+    def test_find_edge_contacts(self):
+        edges = [
+            ("line", 0, 0, 20, "long"),
+            ("line", 1, 0, 10, "first"),
+            ("line", 1, 10, 20, "second"),
+            ("line", 1, 20, 30, "touching"),
+            ("other line", 1, 0, 20, "other"),
+        ]
+        contacts = find_edge_contacts(edges)
+        self.assertEqual(contacts, [("long", "first", 0, 10), ("long", "second", 10, 20)])
+
+    def test_build_adjacency(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v0 = Vertex(0, 10)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(20, 10)
+        v3 = Vertex(0, 20)
+        v4 = Vertex(10, 20)
+        v5 = Vertex(20, 20)
+        v6 = Vertex(0, 30)
+        v7 = Vertex(20, 30)
+        v8 = Vertex(30, 30)
+        v9 = Vertex(20, 40)
+        v10 = Vertex(30, 40)
+        top = Cell(sim, [v6, v7, v5, v3], init_vals, sim.get_next_cell_id())
+        bottom_left = Cell(sim, [v3, v4, v1, v0], init_vals, sim.get_next_cell_id())
+        bottom_right = Cell(sim, [v4, v5, v2, v1], init_vals, sim.get_next_cell_id())
+        corner = Cell(sim, [v9, v10, v8, v7], init_vals, sim.get_next_cell_id())
+        adjacency = build_adjacency([top, bottom_left, bottom_right, corner], 100)
+        self.assertEqual(adjacency[top], [(bottom_left, "b", 10.0), (bottom_right, "b", 10.0)])
+        self.assertEqual(adjacency[bottom_left], [(top, "a", 10.0), (bottom_right, "m", 10.0)])
+        self.assertEqual(adjacency[bottom_right], [(top, "a", 10.0), (bottom_left, "l", 10.0)])
+        self.assertEqual(adjacency[corner], [])
+
+    def test_build_adjacency_slanted_edge(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v0 = Vertex(0, 0)
+        v1 = Vertex(6, 0)
+        v2 = Vertex(0, 10)
+        v3 = Vertex(6, 18)
+        v4 = Vertex(0, 20)
+        v5 = Vertex(6, 28)
+        lower = Cell(sim, [v2, v3, v1, v0], init_vals, sim.get_next_cell_id())
+        upper = Cell(sim, [v4, v5, v3, v2], init_vals, sim.get_next_cell_id())
+        adjacency = build_adjacency([lower, upper], 100)
+        self.assertEqual(adjacency[lower], [(upper, "a", 10.0)])
+        self.assertEqual(adjacency[upper], [(lower, "b", 10.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
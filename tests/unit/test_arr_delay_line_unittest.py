@@ -0,0 +1,59 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from src.agent.arr_delay_line import ArrDelayLine
+
+
+class TestArrDelayLine(unittest.TestCase):
+
+    def test_add_row(self):
+        delay_line = ArrDelayLine(3, capacity=1)
+        first = delay_line.add_row([0.1, 0.2, 0.3])
+        second = delay_line.add_row([1, 2, 3])
+        self.assertEqual((first, second), (0, 1))
+        self.assertEqual(delay_line.get_history(first), [0.1, 0.2, 0.3])
+        self.assertEqual(delay_line.get_history(second), [1.0, 2.0, 3.0])
+        self.assertEqual(delay_line.get_delayed(second), 1.0)
+        with self.assertRaises(ValueError):
+            delay_line.add_row([0.1, 0.2])
+        with self.assertRaises(ValueError):
+            ArrDelayLine(0)
+
+    def test_push(self):
+        delay_line = ArrDelayLine(3)
+        row = delay_line.add_row([0.1, 0.2, 0.3])
+        delay_line.push(row, 0.4)
+        self.assertEqual(delay_line.get_history(row), [0.2, 0.3, 0.4])
+        self.assertEqual(delay_line.get_delayed(row), 0.2)
+        delay_line.push(row, 0.5)
+        self.assertEqual(delay_line.get_history(row), [0.3, 0.4, 0.5])
+        delay_line.advance()
+        self.assertEqual(delay_line.get_history(row), [0.3, 0.4, 0.5])
+
+    def test_advance(self):
+        delay_line = ArrDelayLine(3)
+        pushed = delay_line.add_row([0.1, 0.2, 0.3])
+        unpushed = delay_line.add_row([1, 2, 3])
+        for tick, value in enumerate([0.4, 0.5, 0.6, 0.7]):
+            delay_line.push(pushed, value)
+            delay_line.advance()
+            self.assertEqual(delay_line.head, (tick + 1) % 3)
+        self.assertEqual(delay_line.get_history(pushed), [0.5, 0.6, 0.7])
+        self.assertEqual(delay_line.get_delayed(pushed), 0.5)
+        self.assertEqual(delay_line.get_history(unpushed), [1.0, 2.0, 3.0])
+
+    def test_remove_row(self):
+        delay_line = ArrDelayLine(2)
+        row = delay_line.add_row([0.1, 0.2])
+        delay_line.push(row, 0.3)
+        delay_line.remove_row(row)
+        delay_line.advance()
+        self.assertEqual(delay_line.add_row([1, 2]), row)
+        self.assertEqual(delay_line.get_history(row), [1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
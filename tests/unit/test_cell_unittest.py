@@ -139,5 +139,49 @@ class TestCell(unittest.TestCase):
         self.assertEqual(cell1.get_l_neighbors(), [])
         cell1.remove_neighbor(m_neighbor)
         self.assertEqual(cell1.get_m_neighbors(), [])
-        # with self.assertRaises(ValueError):
-        #    cell1.remove_neighbor(a_neighbor)
+        self.assertEqual(cell1.get_all_neighbors(), [])
+        self.assertFalse(cell1.check_if_neighbor(a_neighbor))
+        with self.assertRaises(ValueError):
+            cell1.remove_neighbor(a_neighbor)
+
+    def test_neighbor_dir_and_order(self):
+        timestep = 1
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        cell1 = Cell(simulation, [v1, v2, v3, v4], self.init_vals, simulation.get_next_cell_id())
+        v5 = Vertex(10, 40)
+        v6 = Vertex(20, 40)
+        v7 = Vertex(30, 40)
+        v8 = Vertex(20, 30)
+        a_neighbor_left = Cell(
+            simulation, [v2, v8, v5, v6], self.init_vals, simulation.get_next_cell_id()
+        )
+        a_neighbor_right = Cell(
+            simulation, [v8, v3, v6, v7], self.init_vals, simulation.get_next_cell_id()
+        )
+        v9 = Vertex(1, 10)
+        v10 = Vertex(1, 30)
+        side_neighbor = Cell(
+            simulation, [v9, v10, v1, v2], self.init_vals, simulation.get_next_cell_id()
+        )
+        cell1.add_neighbor(a_neighbor_right)
+        cell1.add_neighbor(side_neighbor)
+        cell1.add_neighbor(a_neighbor_left)
+        self.assertEqual(cell1.get_neighbor_dir(a_neighbor_left), "a")
+        self.assertIn(cell1.get_neighbor_dir(side_neighbor), ["l", "m"])
+        self.assertIsNone(cell1.get_neighbor_dir(cell1))
+        self.assertEqual(cell1.get_a_neighbors(), [a_neighbor_right, a_neighbor_left])
+        self.assertEqual(
+            cell1.get_all_neighbors(), [a_neighbor_right, a_neighbor_left, side_neighbor]
+        )
+
+        # Getters return copies, so callers can modify neighbors while iterating
+        for a_neighbor in cell1.get_a_neighbors():
+            cell1.remove_neighbor(a_neighbor)
+        self.assertEqual(cell1.get_a_neighbors(), [])
+        self.assertEqual(cell1.get_all_neighbors(), [side_neighbor])
+        cell1.add_neighbor(a_neighbor_left)
+        self.assertEqual(cell1.get_all_neighbors(), [a_neighbor_left, side_neighbor])
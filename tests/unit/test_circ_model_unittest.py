@@ -0,0 +1,112 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+from src.agent.circ_model import (
+    CircModelSpec,
+    Factor,
+    Term,
+    Transport,
+    activation,
+    compile_model,
+    inhibition,
+    linear,
+)
+from src.agent.circ_module_indep_syn_deg import INDEP_SYNDEG_MODEL
+
+
+def make_spec(rates=None):
+    # A toy model: x is made under inhibition by z and degraded, y is made from x
+    if rates is None:
+        rates = {
+            "x": [
+                Term("ks", [linear("w"), inhibition("z", "k")]),
+                Term("kd", [linear("x")], sign=-1),
+            ],
+            "y": [Term("ks", [activation("x", "k"), linear("x")])],
+        }
+    return CircModelSpec(
+        "toy",
+        [("x", "x"), ("y", "why"), ("z", "z"), ("a", "a"), ("b", "b"), ("c", "c"), ("d", "d")],
+        [("ks", "ks"), ("kd", "kd"), ("k", "k")],
+        ["w"],
+        rates,
+        Transport("x", "y", "ks", ("a", "b", "c", "d"), "kd"),
+        extra_state=[],
+    )
+
+
+class TestCircModel(unittest.TestCase):
+
+    def test_compile_model(self):
+        model = compile_model(make_spec())
+        y = np.array([0.5, 0.2, 3.0, 0.0, 0.0, 0.0, 0.0])
+        p = (2.0, 0.4, 1.5)
+        u = (0.8,)
+        rates = model.rhs(y, 0.0, p, u)
+        self.assertAlmostEqual(rates[0], 2.0 * 0.8 * 1.5 / 4.5 - 0.4 * 0.5)
+        self.assertAlmostEqual(rates[1], 2.0 * 0.5 / 2.0 * 0.5)
+        self.assertEqual(rates[2:], [0.0] * 5)
+        self.assertEqual(model.jacobian_pattern, [(0, 0), (0, 2), (1, 0)])
+        jac = model.jacobian(y, 0.0, p, u)
+        h = 1e-6
+        for j in range(7):
+            dy = np.zeros(7)
+            dy[j] = h
+            expected_column = (
+                np.array(model.rhs(y + dy, 0.0, p, u)) - np.array(model.rhs(y - dy, 0.0, p, u))
+            ) / (2 * h)
+            np.testing.assert_allclose(jac[:, j], expected_column, atol=1e-6)
+
+    def test_get_rates(self):
+        model = compile_model(make_spec())
+        y = np.array([[0.5, 1.0], [0.2, 0.1], [3.0, 0.5], [0] * 2, [0] * 2, [0] * 2, [0] * 2])
+        p = (np.array([2.0, 1.0]), 0.4, np.array([1.5, 0.3]))
+        u = (np.array([0.8, 1.2]),)
+        rates = model.get_rates(y, p, u)
+        jac = model.jacobian(y, 0.0, p, u)
+        self.assertEqual(rates.shape, (7, 2))
+        self.assertEqual(jac.shape, (7, 7, 2))
+        for cell in range(2):
+            cell_p = (p[0][cell], p[1], p[2][cell])
+            cell_u = (u[0][cell],)
+            np.testing.assert_allclose(rates[:, cell], model.rhs(y[:, cell], 0.0, cell_p, cell_u))
+            np.testing.assert_allclose(
+                jac[:, :, cell], model.jacobian(y[:, cell], 0.0, cell_p, cell_u)
+            )
+
+    def test_compile_model_invalid(self):
+        with self.assertRaises(ValueError):
+            compile_model(make_spec({"x": [Term("ks", [linear("unknown")])]}))
+        with self.assertRaises(ValueError):
+            compile_model(make_spec({"x": [Term("ks", [activation("x", "w")])]}))
+        with self.assertRaises(ValueError):
+            compile_model(make_spec({"q": [Term("ks", [])]}))
+        with self.assertRaises(ValueError):
+            Factor("hill", "x", "k")
+        with self.assertRaises(ValueError):
+            Factor("linear", "x", "k")
+        with self.assertRaises(ValueError):
+            Term("ks", [], sign=2)
+        spec = make_spec()
+        spec.inputs = ["x"]
+        with self.assertRaises(ValueError):
+            compile_model(spec)
+
+    def test_transport_rates(self):
+        model = INDEP_SYNDEG_MODEL
+        y = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+        p = np.arange(1.0, 16.0)
+        influx, efflux = model.transport_rates(
+            y, p, np.array([0, 3]), np.array([0.2, 0.5]), np.array([0.25, 0.4])
+        )
+        # k5 and k6 are the fifth and sixth parameters
+        np.testing.assert_allclose(influx, [0.25 * 0.3 * 0.2 * 5.0, 0.4 * 0.3 * 0.5 * 5.0])
+        np.testing.assert_allclose(efflux, [0.2 * 0.5 * 6.0, 0.5 * 0.8 * 6.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ from scipy.integrate import odeint
 import numpy as np
 from src.loc.vertex.vertex import Vertex
 from src.agent.cell import Cell
+from src.agent.circ_module import set_ode_warm_start
 from src.sim.simulation.sim import GrowingSim
 from src.sim.util.math_helpers import round_to_sf
 
@@ -63,7 +64,7 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         found_auxin = found_soln[-1][0]
         self.assertAlmostEqual(expected_auxin, found_auxin, places=3)
 
-    def test_calculate_arr(self):
+    def test_arr_rate(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
         cell = Cell(
             sim,
@@ -83,12 +84,11 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         expected_arr = (
             init_vals["k_s"] * (init_vals["k1"] / (init_vals["arr_hist"][0] + init_vals["k1"]))
         ) - (init_vals["k_d"] * init_vals["arr"])
-        found_arr = circ_module_cont.calculate_arr(
-            3,
-        )
+        y = circ_module_cont.model.get_state_vector(circ_module_cont)
+        found_arr = circ_module_cont.rates(y, 0)[1]
         self.assertAlmostEqual(expected_arr, found_arr, places=5)
 
-    def test_calculate_auxlax(self):
+    def test_auxlax_rate(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, 40, False)
         cell = Cell(
             sim,
@@ -108,10 +108,11 @@ class BaseCirculateModuleContTests(unittest.TestCase):
             init_vals["k_s"] * (init_vals["auxin"] / (init_vals["auxin"] + init_vals["k2"]))
             - init_vals["k_d"] * init_vals["al"]
         )
-        found_al = circ_module_cont.calculate_auxlax(2, 3)
+        y = circ_module_cont.model.get_state_vector(circ_module_cont)
+        found_al = circ_module_cont.rates(y, 0)[2]
         self.assertAlmostEqual(expected_al, found_al, places=5)
 
-    def test_calculate_pin(self):
+    def test_pin_rate(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
         cell = Cell(
             sim,
@@ -133,10 +134,11 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         )
         circ_module_cont = cell.get_circ_mod()
         sim.setup()
-        found_pin = circ_module_cont.calculate_pin(2, 3)
+        y = circ_module_cont.model.get_state_vector(circ_module_cont)
+        found_pin = circ_module_cont.rates(y, 0)[3]
         self.assertAlmostEqual(expected_pin, found_pin, places=5)
 
-    def test_calculate_membrane_pin(self):
+    def test_membrane_pin_rate(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
         cell = Cell(
             sim,
@@ -165,9 +167,9 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         sim.setup()
         # test apical neighbor
         expected_pin = init_vals["w_pina"] * init_vals["pin"] - init_vals["k_d"] * init_vals["pina"]
-        found_pin = circ_module_cont.calculate_membrane_pin(
-            init_vals["pin"], init_vals["pina"], "a", init_vals["w_pina"]
-        )
+        circ_module_cont.pin_weights["a"] = init_vals["w_pina"]
+        y = circ_module_cont.model.get_state_vector(circ_module_cont)
+        found_pin = circ_module_cont.rates(y, 0)[4]
         self.assertAlmostEqual(expected_pin, found_pin, places=3)
 
     def test_calculate_neighbor_memfrac(self):
@@ -313,6 +315,117 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         for i in range(8):
             self.assertAlmostEqual(expected_soln[-1, i], found_soln[-1, i], places=3)
 
+    def test_solve_equations_endpoint_only(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circ_module_cont = cell.get_circ_mod()
+        y0 = [
+            circ_module_cont.auxin,
+            circ_module_cont.arr,
+            circ_module_cont.auxlax,
+            circ_module_cont.pin,
+            circ_module_cont.pina,
+            circ_module_cont.pinb,
+            circ_module_cont.pinl,
+            circ_module_cont.pinm,
+        ]
+        t = np.linspace(0, self.duration, int(self.duration / self.time_step) + 1)
+        every_step_soln = odeint(circ_module_cont.rates, y0, t)
+        found_soln = circ_module_cont.solve_equations()
+        self.assertEqual(found_soln.shape, (2, 8))
+        np.testing.assert_array_equal(found_soln[0], y0)
+        np.testing.assert_array_equal(found_soln[-1], every_step_soln[-1])
+
+        circ_module_cont.ode_rtol = 1e-3
+        circ_module_cont.ode_atol = 1e-3
+        loose_soln = circ_module_cont.solve_equations()
+        for i in range(8):
+            self.assertAlmostEqual(every_step_soln[-1, i], loose_soln[-1, i], places=2)
+
+    def test_solve_equations_warm_start(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, ode_warm_start=True)
+        try:
+            cell = Cell(
+                sim,
+                [
+                    Vertex(10.0, 10.0),
+                    Vertex(10.0, 30.0),
+                    Vertex(30.0, 30.0),
+                    Vertex(30.0, 10.0),
+                ],
+                make_init_vals(),
+                sim.get_next_cell_id(),
+            )
+            circ_module_cont = cell.get_circ_mod()
+            self.assertTrue(circ_module_cont.ode_warm_start)
+            cold_soln = circ_module_cont.solve_equations()
+            self.assertGreater(circ_module_cont.ode_step, 0)
+            warm_soln = circ_module_cont.solve_equations()
+            np.testing.assert_allclose(warm_soln, cold_soln, rtol=1e-6)
+        finally:
+            set_ode_warm_start(False)
+
+    def test_jacobian(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circ_module_cont = cell.get_circ_mod()
+        y = np.array([0.5, 0.4, 0.3, 0.2, 0.1, 0.2, 0.3, 0.4])
+        jac = circ_module_cont.jacobian(y, 0)
+        h = 1e-6
+        for j in range(8):
+            dy = np.zeros(8)
+            dy[j] = h
+            expected_column = (
+                np.array(circ_module_cont.rates(y + dy, 0))
+                - np.array(circ_module_cont.rates(y - dy, 0))
+            ) / (2 * h)
+            np.testing.assert_allclose(jac[:, j], expected_column, atol=1e-8)
+
+    def test_calculate_steady_state(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circ_module_cont = cell.get_circ_mod()
+        state, dstate = circ_module_cont.calculate_steady_state(2.5)
+        circ_module_cont.set_steady_state(state)
+        self.assertEqual(circ_module_cont.get_auxin(), 2.5)
+        np.testing.assert_allclose(circ_module_cont.rates(state, 0)[1:], np.zeros(7), atol=1e-12)
+        h = 1e-6
+        expected_dstate = (
+            circ_module_cont.calculate_steady_state(2.5 + h)[0]
+            - circ_module_cont.calculate_steady_state(2.5 - h)[0]
+        ) / (2 * h)
+        np.testing.assert_allclose(dstate, expected_dstate, atol=1e-8)
+
     def test_update_arr_hist(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
         cell = Cell(
@@ -333,6 +446,29 @@ class BaseCirculateModuleContTests(unittest.TestCase):
         found_arr_hist = circ_module_cont.arr_hist
         self.assertEqual(expected_arr_hist, found_arr_hist)
 
+    def test_arr_hist_not_shared(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        init_vals = make_init_vals()
+        cells = [
+            Cell(
+                sim,
+                [
+                    Vertex(10.0, 10.0),
+                    Vertex(10.0, 30.0),
+                    Vertex(30.0, 30.0),
+                    Vertex(30.0, 10.0),
+                ],
+                init_vals,
+                sim.get_next_cell_id(),
+            )
+            for _ in range(2)
+        ]
+        cells[0].get_circ_mod().update_arr_hist()
+        sim.get_arr_delay_line(3).advance()
+        self.assertEqual(cells[0].get_circ_mod().get_arr_hist(), [0.2, 0.3, 3])
+        self.assertEqual(cells[1].get_circ_mod().get_arr_hist(), [0.1, 0.2, 0.3])
+        self.assertEqual(init_vals["arr_hist"], [0.1, 0.2, 0.3])
+
     def test_update_circ_contents(self):
         sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
         cell = Cell(
@@ -9,8 +9,9 @@ from scipy.integrate import odeint
 import unittest
 from unittest.mock import MagicMock, patch
 from src.sim.util.math_helpers import round_to_sf
+from src.agent.arr_delay_line import ArrDelayLine
+from src.agent.circ_module import WARM_START_STEP_FRACTION, set_ode_warm_start
 from src.agent.circ_module_indep_syn_deg import CirculateModuleIndSynDeg
-from typing import cast
 
 
 class TestCirculateModuleIndSynDeg(unittest.TestCase):
@@ -25,6 +26,7 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
         self.cell_mock.get_sim.return_value.get_root_midpointx.return_value = 0.5
         self.cell_mock.get_c_id.return_value = 1
         self.cell_mock.get_quad_perimeter.return_value.get_perimeter_len.return_value = 100.0
+        self.cell_mock.get_sim.return_value.get_arr_delay_line.side_effect = ArrDelayLine
 
         self.init_vals = {
             "auxin": 0.1,
@@ -120,55 +122,6 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
         pin_weights = self.circ_mod.initialize_pin_weights()
         self.assertDictEqual(pin_weights, expected_weights)
 
-    def test_calculate_auxin(self):
-        auxin_initial = 0.1
-        expected_auxin = (self.circ_mod.ks_aux * self.circ_mod.auxin_w) - (
-            self.circ_mod.kd_aux * auxin_initial
-        )
-        calculated_auxin = self.circ_mod.calculate_auxin(auxin_initial)
-        self.assertAlmostEqual(calculated_auxin, expected_auxin, places=5)
-
-    def test_calculate_arr(self):
-        arr_initial = 0.1
-        expected_arr = (
-            self.circ_mod.ks_arr
-            * (self.circ_mod.k_arr_arr / (self.circ_mod.arr_hist[0] + self.circ_mod.k_arr_arr))
-        ) - (self.circ_mod.kd_arr * arr_initial)
-        calculated_arr = self.circ_mod.calculate_arr(arr_initial)
-        self.assertAlmostEqual(calculated_arr, expected_arr, places=5)
-
-    def test_calculate_auxlax(self):
-        auxin_initial = 0.1
-        auxlax_initial = 0.2
-        expected_auxlax = (self.circ_mod.ks_auxlax) * (
-            auxin_initial / (auxin_initial + self.circ_mod.k_auxin_auxlax)
-        ) - (self.circ_mod.kd_auxlax * auxlax_initial)
-        calculated_auxlax = self.circ_mod.calculate_auxlax(auxin_initial, auxlax_initial)
-        self.assertAlmostEqual(calculated_auxlax, expected_auxlax, places=5)
-
-    def test_calculate_pin(self):
-        auxin_initial = 0.2
-        arr_initial = 0.1
-        expected_pin = self.circ_mod.ks_pinu * (
-            self.circ_mod.k_arr_pin / (arr_initial + self.circ_mod.k_arr_pin)
-        ) * (auxin_initial / (auxin_initial + self.circ_mod.k_auxin_pin)) - (
-            self.circ_mod.kd_pinu * self.circ_mod.pin
-        )
-        calculated_pin = self.circ_mod.calculate_pin(auxin_initial, arr_initial)
-        self.assertAlmostEqual(calculated_pin, expected_pin, places=5)
-
-    def test_calculate_membrane_pin(self):
-        pin_initial = 0.1
-        pind_initial = 0.2
-        direction = "lateral"
-        pin_weight = 0.3
-        memfrac = 0.4
-        expected_membrane_pin = pin_weight * pin_initial - (self.circ_mod.kd_pinloc * pind_initial)
-        calculated_membrane_pin = self.circ_mod.calculate_membrane_pin(
-            pin_initial, pind_initial, direction, pin_weight
-        )
-        self.assertAlmostEqual(calculated_membrane_pin, expected_membrane_pin, places=5)
-
     def test_calculate_neighbor_memfrac(self):
         neighbor_mock = MagicMock()
         neighbor_mock.get_c_id.return_value = 2
@@ -204,6 +157,60 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
                 aux_exchange[self.neighbor_mock], expected_neighbor_aux_exchange, places=5
             )
 
+    def test_get_transport_rates(self):
+        self.cell_mock.get_a_neighbors.return_value = [self.neighbor_mock]
+        self.cell_mock.get_b_neighbors.return_value = []
+        self.cell_mock.get_l_neighbors.return_value = []
+        self.cell_mock.get_m_neighbors.return_value = []
+
+        with unittest.mock.patch.object(
+            self.circ_mod, "calculate_neighbor_memfrac", return_value=0.2
+        ):
+            rates = self.circ_mod.get_transport_rates()
+            exchange = self.circ_mod.get_aux_exchange_across_membrane(
+                self.circ_mod.auxlax, self.circ_mod.pina, [self.neighbor_mock]
+            )
+        self.assertEqual(len(rates), 1)
+        neighbor, influx_rate, efflux_rate = rates[0]
+        self.assertIs(neighbor, self.neighbor_mock)
+        self.assertAlmostEqual(
+            influx_rate * 0.5 - efflux_rate * self.circ_mod.auxin,
+            exchange[self.neighbor_mock],
+            places=5,
+        )
+
+    def test_get_transport_coefficients(self):
+        self.cell_mock.get_a_neighbors.return_value = []
+        self.cell_mock.get_b_neighbors.return_value = []
+        self.cell_mock.get_l_neighbors.return_value = [self.neighbor_mock]
+        self.cell_mock.get_m_neighbors.return_value = []
+
+        with unittest.mock.patch.object(
+            self.circ_mod, "calculate_neighbor_memfrac", return_value=0.25
+        ):
+            coefficients = self.circ_mod.get_transport_coefficients()
+            rates = self.circ_mod.get_transport_rates()
+        self.assertEqual(len(coefficients), 1)
+        neighbor, membrane, influx_coefficient, efflux_coefficient = coefficients[0]
+        self.assertIs(neighbor, self.neighbor_mock)
+        self.assertEqual(membrane, 2)
+        self.assertAlmostEqual(influx_coefficient * self.circ_mod.auxlax, rates[0][1])
+        self.assertAlmostEqual(efflux_coefficient * self.circ_mod.pinl, rates[0][2])
+
+    def test_update_auxin_implicit_transport(self):
+        self.circulator_mock.get_transport_scheme.return_value = "implicit"
+        self.circ_mod.get_transport_rates = MagicMock(return_value=[(self.neighbor_mock, 1, 2)])
+        soln = np.array([[0.1] * 8, [0.3] * 8])
+
+        self.circ_mod.update_auxin(soln)
+
+        self.circulator_mock.add_delta.assert_called_once_with(
+            self.cell_mock, round_to_sf(0.3 - 0.1, 5)
+        )
+        self.circulator_mock.add_transport_rates.assert_called_once_with(
+            self.cell_mock, [(self.neighbor_mock, 1, 2)]
+        )
+
     def test_calculate_delta_auxin(self):
         syn_deg_auxin = 0.5
         neighbors_auxin = [{self.neighbor_mock: 0.1}, {self.neighbor_mock: -0.05}]
@@ -394,44 +401,32 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
         self.circ_mod.set_auxin(new_auxin)
         self.assertEqual(self.circ_mod.get_auxin(), new_auxin)
 
-    def test_f(self):
-        # Mock the methods that are called within `f`
-        self.circ_mod.calculate_auxin = MagicMock(return_value=0.1)
-        self.circ_mod.calculate_arr = MagicMock(return_value=0.2)
-        self.circ_mod.calculate_auxlax = MagicMock(return_value=0.3)
-        self.circ_mod.calculate_pin = MagicMock(return_value=0.4)
-        self.circ_mod.calculate_membrane_pin = MagicMock(side_effect=[0.5, 0.6, 0.7, 0.8])
-
-        # Test input values
+    def test_rates(self):
         y = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
-        t = 0.0
-
-        # Call the `f` function
-        result = self.circ_mod.f(y, t)
-
-        # Expected values based on the mocks
-        expected_result = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
-
-        # Verify the results
-        self.assertEqual(result, expected_result)
-
-        # Verify that the dependent methods were called with correct arguments
-        self.circ_mod.calculate_auxin.assert_called_once_with(0.1)
-        self.circ_mod.calculate_arr.assert_called_once_with(0.2)
-        self.circ_mod.calculate_auxlax.assert_called_once_with(0.1, 0.3)
-        self.circ_mod.calculate_pin.assert_called_once_with(0.1, 0.2)
-        self.circ_mod.calculate_membrane_pin.assert_any_call(
-            0.4, 0.5, "a", cast(float, self.circ_mod.pin_weights.get("a"))
-        )
-        self.circ_mod.calculate_membrane_pin.assert_any_call(
-            0.4, 0.6, "b", cast(float, self.circ_mod.pin_weights.get("b"))
-        )
-        self.circ_mod.calculate_membrane_pin.assert_any_call(
-            0.4, 0.7, "l", cast(float, self.circ_mod.pin_weights.get("l"))
-        )
-        self.circ_mod.calculate_membrane_pin.assert_any_call(
-            0.4, 0.8, "m", cast(float, self.circ_mod.pin_weights.get("m"))
+        rates = self.circ_mod.rates(y, 0)
+        expected_auxin = (self.circ_mod.ks_aux * self.circ_mod.auxin_w) - (
+            self.circ_mod.kd_aux * 0.1
         )
+        self.assertAlmostEqual(rates[0], expected_auxin, places=5)
+        expected_arr = (
+            self.circ_mod.ks_arr
+            * (self.circ_mod.k_arr_arr / (self.circ_mod.arr_hist[0] + self.circ_mod.k_arr_arr))
+        ) - (self.circ_mod.kd_arr * 0.2)
+        self.assertAlmostEqual(rates[1], expected_arr, places=5)
+        expected_auxlax = (self.circ_mod.ks_auxlax) * (
+            0.1 / (0.1 + self.circ_mod.k_auxin_auxlax)
+        ) - (self.circ_mod.kd_auxlax * 0.3)
+        self.assertAlmostEqual(rates[2], expected_auxlax, places=5)
+        # PIN degradation reads the unlocalized PIN level at the start of the solve
+        expected_pin = self.circ_mod.ks_pinu * (
+            self.circ_mod.k_arr_pin / (0.2 + self.circ_mod.k_arr_pin)
+        ) * (0.1 / (0.1 + self.circ_mod.k_auxin_pin)) - (self.circ_mod.kd_pinu * self.circ_mod.pin)
+        self.assertAlmostEqual(rates[3], expected_pin, places=5)
+        for index, direction in enumerate(["a", "b", "l", "m"]):
+            expected_membrane_pin = self.circ_mod.pin_weights[direction] * 0.4 - (
+                self.circ_mod.kd_pinloc * y[4 + index]
+            )
+            self.assertAlmostEqual(rates[4 + index], expected_membrane_pin, places=5)
 
     @patch("src.agent.circ_module.odeint")
     def test_solve_equations(self, mock_odeint):
@@ -442,11 +437,11 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
                 [0.11, 0.21, 0.31, 0.41, 0.51, 0.61, 0.71, 0.81],
             ]
         )
-        mock_odeint.return_value = mock_solution
+        mock_odeint.return_value = (mock_solution, {"hu": np.array([0.0004])})
 
         # Expected initial conditions and time array
         expected_y0 = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
-        expected_t = np.linspace(0, 1.0, int(1.0 / 0.001) + 1)
+        expected_t = [0.0, 0.001]
 
         # Call the function
         result = self.circ_mod.solve_equations()
@@ -454,16 +449,75 @@ class TestCirculateModuleIndSynDeg(unittest.TestCase):
         # Verify the correct calls to odeint
         args, kwargs = mock_odeint.call_args
 
-        # Check the function f and initial conditions
-        self.assertEqual(args[0], self.circ_mod.f)
+        # Check the compiled rates and initial conditions
+        self.assertEqual(args[0], self.circ_mod.model.rhs)
         np.testing.assert_array_equal(args[1], expected_y0)
+        self.assertEqual(kwargs["Dfun"], self.circ_mod.model.jacobian)
+        self.assertEqual(
+            kwargs["args"],
+            (
+                self.circ_mod.model.get_params(self.circ_mod),
+                self.circ_mod.model.get_inputs(self.circ_mod),
+            ),
+        )
 
-        # Check the time array
+        # Check that only the state after the first time step is requested
         np.testing.assert_array_equal(args[2], expected_t)
+        self.assertEqual(kwargs["rtol"], self.circ_mod.ode_rtol)
+        self.assertEqual(kwargs["atol"], self.circ_mod.ode_atol)
+
+        # Without warm starts the solver sizes its own first step, but the last step is kept
+        self.assertEqual(kwargs["h0"], 0.0)
+        self.assertEqual(self.circ_mod.ode_step, 0.0004)
 
         # Verify the result
         np.testing.assert_array_equal(result, mock_solution)
 
+    def test_solve_equations_warm_start(self):
+        cold_soln = self.circ_mod.solve_equations()
+        last_step = self.circ_mod.ode_step
+        self.assertGreater(last_step, 0)
+        set_ode_warm_start(True)
+        try:
+            with patch("src.agent.circ_module.odeint", wraps=odeint) as mock_odeint:
+                warm_soln = self.circ_mod.solve_equations()
+        finally:
+            set_ode_warm_start(False)
+        self.assertEqual(mock_odeint.call_args.kwargs["h0"], last_step * WARM_START_STEP_FRACTION)
+        np.testing.assert_allclose(warm_soln, cold_soln, rtol=1e-6)
+
+    def test_jacobian(self):
+        y = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+        jac = self.circ_mod.jacobian(y, 0)
+        h = 1e-6
+        for j in range(8):
+            dy = np.zeros(8)
+            dy[j] = h
+            expected_column = (
+                np.array(self.circ_mod.rates(y + dy, 0)) - np.array(self.circ_mod.rates(y - dy, 0))
+            ) / (2 * h)
+            np.testing.assert_allclose(jac[:, j], expected_column, atol=1e-8)
+
+    def test_solve_equations_stiff(self):
+        self.circ_mod.kd_aux = 1e4
+        self.circ_mod.kd_pinloc = 1e4
+        soln = self.circ_mod.solve_equations(time_step=1.0)
+        steady_auxin = self.circ_mod.ks_aux * self.circ_mod.auxin_w / self.circ_mod.kd_aux
+        self.assertAlmostEqual(soln[-1, 0], steady_auxin, places=8)
+
+    def test_calculate_steady_state(self):
+        state, dstate = self.circ_mod.calculate_steady_state(0.7)
+        self.assertEqual(state[0], 0.7)
+        self.circ_mod.set_steady_state(state)
+        self.assertEqual(self.circ_mod.arr_hist, [state[1]] * 3)
+        np.testing.assert_allclose(self.circ_mod.rates(state, 0)[1:], np.zeros(7), atol=1e-12)
+        h = 1e-6
+        expected_dstate = (
+            self.circ_mod.calculate_steady_state(0.7 + h)[0]
+            - self.circ_mod.calculate_steady_state(0.7 - h)[0]
+        ) / (2 * h)
+        np.testing.assert_allclose(dstate, expected_dstate, atol=1e-8)
+
     @patch("src.agent.circ_module_indep_syn_deg.CirculateModuleIndSynDeg.update_auxin")
     @patch("src.agent.circ_module_indep_syn_deg.CirculateModuleIndSynDeg.solve_equations")
     @patch("src.agent.circ_module_indep_syn_deg.CirculateModuleIndSynDeg.update_circ_contents")
@@ -4,10 +4,12 @@ import platform
 if platform.system() == "Linux":
     os.environ["ARCADE_HEADLESS"] = "True"
 import unittest
+import numpy as np
 from src.loc.vertex.vertex import Vertex
 from src.agent.circ_module_universal_syndeg import CirculateModuleUniversalSynDeg
 from src.agent.cell import Cell
 from src.sim.simulation.sim import GrowingSim
+from src.sim.util.math_helpers import set_state_dtype
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -80,3 +82,172 @@ class TestCirculator(unittest.TestCase):
         sim.get_circulator().add_delta(cell, delta)
         sim.get_circulator().update()
         self.assertEqual(cell.get_circ_mod().get_auxin(), delta + make_init_vals()["auxin"])
+
+    def test_unknown_transport_scheme(self):
+        with self.assertRaises(ValueError):
+            GrowingSim(
+                SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, transport_scheme="magic"
+            )
+
+    def test_update_implicit_transport(self):
+        sim = GrowingSim(
+            SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, transport_scheme="implicit"
+        )
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        neighbor = Cell(
+            sim,
+            [
+                Vertex(30.0, 10.0),
+                Vertex(30.0, 30.0),
+                Vertex(50.0, 30.0),
+                Vertex(50.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circulator = sim.get_circulator()
+        circulator.add_delta(cell, 1)
+        # Fast enough that a forward Euler step would take the cell's auxin negative
+        circulator.add_transport_rates(cell, [(neighbor, 0.5, 3)])
+        circulator.update()
+        # Backward Euler: [[4, -0.5], [-3, 1.5]] x = [3, 2]
+        self.assertAlmostEqual(cell.get_circ_mod().get_auxin(), 11 / 9, places=5)
+        self.assertAlmostEqual(neighbor.get_circ_mod().get_auxin(), 34 / 9, places=5)
+        self.assertEqual(circulator.transport_rates, {})
+
+    def test_update_subcycled_transport(self):
+        for max_substeps, expected_substeps in [(64, 3), (2, 2)]:
+            sim = GrowingSim(
+                SCREEN_WIDTH,
+                SCREEN_HEIGHT,
+                SCREEN_TITLE,
+                1,
+                False,
+                transport_scheme="subcycled",
+                max_transport_substeps=max_substeps,
+            )
+            cell = Cell(
+                sim,
+                [
+                    Vertex(10.0, 10.0),
+                    Vertex(10.0, 30.0),
+                    Vertex(30.0, 30.0),
+                    Vertex(30.0, 10.0),
+                ],
+                make_init_vals(),
+                sim.get_next_cell_id(),
+            )
+            neighbor = Cell(
+                sim,
+                [
+                    Vertex(30.0, 10.0),
+                    Vertex(30.0, 30.0),
+                    Vertex(50.0, 30.0),
+                    Vertex(50.0, 10.0),
+                ],
+                make_init_vals(),
+                sim.get_next_cell_id(),
+            )
+            circulator = sim.get_circulator()
+            circulator.add_delta(cell, 1)
+            circulator.add_transport_rates(cell, [(neighbor, 0.5, 3)])
+            circulator.update()
+            self.assertEqual(circulator.transport_substeps, expected_substeps)
+            cell_auxin, neighbor_auxin = 2.0, 2.0
+            for _ in range(expected_substeps):
+                exchange = 0.5 * neighbor_auxin - 3 * cell_auxin
+                cell_auxin, neighbor_auxin = (
+                    cell_auxin + (1 + exchange) / expected_substeps,
+                    neighbor_auxin - exchange / expected_substeps,
+                )
+            self.assertAlmostEqual(cell.get_circ_mod().get_auxin(), cell_auxin, places=5)
+            self.assertAlmostEqual(neighbor.get_circ_mod().get_auxin(), neighbor_auxin, places=5)
+            self.assertGreaterEqual(cell.get_circ_mod().get_auxin(), 0)
+
+    def test_single_substep_matches_explicit_transport(self):
+        sim = GrowingSim(
+            SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, transport_scheme="subcycled"
+        )
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        neighbor = Cell(
+            sim,
+            [
+                Vertex(30.0, 10.0),
+                Vertex(30.0, 30.0),
+                Vertex(50.0, 30.0),
+                Vertex(50.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circulator = sim.get_circulator()
+        circulator.add_delta(cell, 1)
+        circulator.add_transport_rates(cell, [(neighbor, 0.1, 0.2)])
+        circulator.update()
+        self.assertEqual(circulator.transport_substeps, 1)
+        exchange = 0.1 * 2 - 0.2 * 2
+        self.assertAlmostEqual(cell.get_circ_mod().get_auxin(), 2 + 1 + exchange, places=5)
+        self.assertAlmostEqual(neighbor.get_circ_mod().get_auxin(), 2 - exchange, places=5)
+
+    def test_update_implicit_transport_float32(self):
+        sim = GrowingSim(
+            SCREEN_WIDTH,
+            SCREEN_HEIGHT,
+            SCREEN_TITLE,
+            1,
+            False,
+            state_dtype="float32",
+            transport_scheme="implicit",
+        )
+        self.addCleanup(set_state_dtype, "float64")
+        cell = Cell(
+            sim,
+            [
+                Vertex(10.0, 10.0),
+                Vertex(10.0, 30.0),
+                Vertex(30.0, 30.0),
+                Vertex(30.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        neighbor = Cell(
+            sim,
+            [
+                Vertex(30.0, 10.0),
+                Vertex(30.0, 30.0),
+                Vertex(50.0, 30.0),
+                Vertex(50.0, 10.0),
+            ],
+            make_init_vals(),
+            sim.get_next_cell_id(),
+        )
+        circulator = sim.get_circulator()
+        circulator.add_delta(cell, 1)
+        circulator.add_transport_rates(cell, [(neighbor, 0.5, 3)])
+        _, transport, auxins, _ = circulator.get_transport_system()
+        self.assertEqual(transport.dtype, np.float32)
+        self.assertEqual(auxins.dtype, np.float32)
+        circulator.update()
+        self.assertAlmostEqual(cell.get_circ_mod().get_auxin(), 11 / 9, places=5)
+        self.assertIsInstance(cell.get_circ_mod().get_auxin(), float)
@@ -4,6 +4,7 @@ import platform
 if platform.system() == "Linux":
     os.environ["ARCADE_HEADLESS"] = "True"
 import unittest
+from unittest.mock import patch
 from src.sim.divider.divider import Divider
 from src.agent.cell import Cell
 from src.sim.simulation.sim import GrowingSim
@@ -72,6 +73,43 @@ class TestDivider(unittest.TestCase):
         self.assertEqual(v6, thisv2)
         self.assertEqual(v7, thisv3)
 
+    def test_get_split_vertex_shares_vertex_across_edge(self):
+        timestep = 1
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
+        divider = simulation.get_divider()
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        v5 = Vertex(50, 30)
+        v6 = Vertex(50, 10)
+        left_cell = Cell(
+            simulation, [v1, v2, v3, v4], self.init_vals, simulation.get_next_cell_id()
+        )
+        right_cell = Cell(
+            simulation, [v4, v3, v5, v6], self.init_vals, simulation.get_next_cell_id()
+        )
+        left_cell.add_neighbor(right_cell)
+        right_cell.add_neighbor(left_cell)
+
+        split_v = divider.get_split_vertex(left_cell, Vertex(30, 20), v3, v4)
+        self.assertEqual([30, 20], split_v.get_xy())
+        self.assertEqual(split_v, divider.split_vertices[frozenset((v3, v4))])
+
+        # The split vertex drifts away from the midpoint of the edge before the cell on
+        # the other side divides; it is still reused
+        split_v.set_y(20.000001)
+        reused_v = divider.get_split_vertex(right_cell, Vertex(30, 20), v3, v4)
+        self.assertIs(split_v, reused_v)
+        self.assertEqual({}, divider.split_vertices)
+
+        # Unrelated edges get their own vertex
+        other_v = divider.get_split_vertex(right_cell, Vertex(50, 20), v5, v6)
+        self.assertIsNot(split_v, other_v)
+        self.assertEqual([50, 20], other_v.get_xy())
+        # No neighbor shares that edge, so its vertex is not kept for reuse
+        self.assertEqual({}, divider.split_vertices)
+
     def test_swap_neighbors(self):
         timestep = 1
         simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
@@ -103,7 +141,8 @@ class TestDivider(unittest.TestCase):
         simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
         v12 = Vertex(110, 10)
         v13 = Vertex(110, 30)
-        simulation.vertex_list.extend([v12, v13])
+        simulation.get_vertex_registry().add_vertex(v12)
+        simulation.get_vertex_registry().add_vertex(v13)
         v1 = Vertex(10, 10)
         v2 = Vertex(10, 30)
         v3 = Vertex(30, 30)
@@ -186,7 +225,8 @@ class TestDivider(unittest.TestCase):
         v11 = Vertex(60, 30)
         v12 = Vertex(110, 10)
         v13 = Vertex(110, 30)
-        simulation.vertex_list.extend([v12, v13])
+        simulation.get_vertex_registry().add_vertex(v12)
+        simulation.get_vertex_registry().add_vertex(v13)
 
         cell = Cell(simulation, [v1, v2, v3, v4], self.init_vals, simulation.get_next_cell_id())
         m_top_neighbor = Cell(
@@ -237,7 +277,8 @@ class TestDivider(unittest.TestCase):
         v11 = Vertex(60, 30)
         v12 = Vertex(110, 10)
         v13 = Vertex(110, 30)
-        simulation.vertex_list.extend([v12, v13])
+        simulation.get_vertex_registry().add_vertex(v12)
+        simulation.get_vertex_registry().add_vertex(v13)
         cell = Cell(simulation, [v1, v2, v3, v4], self.init_vals, simulation.get_next_cell_id())
         m_top_neighbor = Cell(
             simulation, [v3, v11, v6, v10], self.init_vals, simulation.get_next_cell_id()
@@ -272,3 +313,43 @@ class TestDivider(unittest.TestCase):
             m_top_neighbor.get_l_neighbors()[0].get_quad_perimeter().get_bottom_left().get_xy(),
             [10, 20],
         )
+
+    def test_update_divides_cells_in_one_batch(self):
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        v5 = Vertex(50, 30)
+        v6 = Vertex(50, 10)
+        left_cell = Cell(
+            simulation, [v1, v2, v3, v4], self.init_vals, simulation.get_next_cell_id()
+        )
+        right_cell = Cell(
+            simulation, [v4, v3, v5, v6], self.init_vals, simulation.get_next_cell_id()
+        )
+        left_cell.add_neighbor(right_cell)
+        right_cell.add_neighbor(left_cell)
+        for cell in [left_cell, right_cell]:
+            cell.set_dev_zone("meristematic")
+            simulation.get_divider().add_cell(cell)
+        with patch.object(
+            simulation,
+            "calculate_root_midpoint_x_from_vertex_list",
+            wraps=simulation.calculate_root_midpoint_x_from_vertex_list,
+        ) as mock_midpoint:
+            simulation.get_divider().update()
+        mock_midpoint.assert_called_once()
+        self.assertEqual(4, len(simulation.get_cell_list()))
+        self.assertNotIn(left_cell, simulation.get_cell_list())
+        self.assertNotIn(right_cell, simulation.get_cell_list())
+        left_top, left_bottom, right_top, right_bottom = simulation.get_cell_list()
+        # the daughters on either side of the shared edge share the vertex splitting it
+        self.assertIs(
+            left_top.get_quad_perimeter().get_bottom_right(),
+            right_top.get_quad_perimeter().get_bottom_left(),
+        )
+        self.assertEqual(left_top.get_m_neighbors() + left_top.get_l_neighbors(), [right_top])
+        self.assertEqual(
+            left_bottom.get_m_neighbors() + left_bottom.get_l_neighbors(), [right_bottom]
+        )
@@ -400,6 +400,20 @@ class TestInput(unittest.TestCase):
                 found_cell_list[i].get_circ_mod().get_auxin(),
             )
 
+    def test_input_without_neighbors(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        input = Input(
+            "tests/unit/test_input_files/init_vals_no_neighbors.json",
+            "tests/unit/test_input_files/vertex.json",
+            sim,
+        )
+        input.make_cells_from_input_files()
+        cell0, cell1 = sim.get_cell_list()
+        self.assertEqual(cell0.get_a_neighbors(), [cell1])
+        self.assertEqual(cell0.get_all_neighbors(), [cell1])
+        self.assertEqual(cell1.get_b_neighbors(), [cell0])
+        self.assertEqual(cell1.get_all_neighbors(), [cell0])
+
     def test_replace_default_to_gparam(self):
         gparam_file = "src/sim/input/default_input_gparam.json"
         with open(gparam_file, "r") as file:
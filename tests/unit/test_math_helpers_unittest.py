@@ -0,0 +1,88 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+from src.sim.simulation.sim import GrowingSim
+from src.sim.util.math_helpers import (
+    get_precision_policy,
+    get_state_dtype,
+    round_geometry,
+    round_in_stage,
+    round_stage_output,
+    set_precision_policy,
+    set_state_dtype,
+)
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+
+class TestMathHelpers(unittest.TestCase):
+
+    def tearDown(self):
+        set_precision_policy("legacy")
+        set_state_dtype("float64")
+
+    def test_set_precision_policy(self):
+        set_precision_policy("none")
+        self.assertEqual(get_precision_policy(), "none")
+        with self.assertRaises(ValueError):
+            set_precision_policy("fast")
+        self.assertEqual(get_precision_policy(), "none")
+
+    def test_sim_sets_precision_policy(self):
+        GrowingSim(
+            SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, precision_policy="vectorized"
+        )
+        self.assertEqual(get_precision_policy(), "vectorized")
+        GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        self.assertEqual(get_precision_policy(), "legacy")
+
+    def test_legacy_precision_policy(self):
+        set_precision_policy("legacy")
+        self.assertEqual(round_in_stage(0.123456789, 5), 0.12346)
+        row = np.array([0.123456789, 98765.4321])
+        rounded = round_stage_output(row, 5)
+        self.assertEqual(rounded, [0.12346, 98765.0])
+        self.assertIsInstance(rounded[0], np.float64)
+        self.assertEqual(round_geometry(0.123456789, 6), 0.123457)
+
+    def test_vectorized_precision_policy(self):
+        set_precision_policy("vectorized")
+        self.assertEqual(round_in_stage(0.123456789, 5), 0.123456789)
+        rounded = round_stage_output(np.array([0.123456789, 98765.4321]), 5)
+        self.assertEqual(rounded, [0.12346, 98765.0])
+        self.assertIsInstance(rounded[0], float)
+        self.assertEqual(round_geometry(0.123456789, 6), 0.123457)
+        np.testing.assert_array_equal(
+            round_geometry(np.array([0.123456789, 2.0]), 6), [0.123457, 2.0]
+        )
+
+    def test_no_precision_policy(self):
+        set_precision_policy("none")
+        self.assertEqual(round_in_stage(0.123456789, 5), 0.123456789)
+        self.assertEqual(round_stage_output((0.123456789, 2.0), 5), [0.123456789, 2.0])
+        self.assertEqual(round_geometry(0.123456789, 6), 0.123456789)
+
+    def test_set_state_dtype(self):
+        self.assertEqual(get_state_dtype(), np.float64)
+        set_state_dtype("float32")
+        self.assertEqual(get_state_dtype(), np.float32)
+        with self.assertRaises(ValueError):
+            set_state_dtype("float16")
+        self.assertEqual(get_state_dtype(), np.float32)
+
+    def test_sim_sets_state_dtype(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False, state_dtype="float32")
+        self.assertEqual(get_state_dtype(), np.float32)
+        self.assertEqual(sim.get_arr_delay_line(3).values.dtype, np.float32)
+        GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        self.assertEqual(get_state_dtype(), np.float64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,8 @@ if platform.system() == "Linux":
     os.environ["ARCADE_HEADLESS"] = "True"
 
 import unittest
-from unittest.mock import MagicMock, patch
-from src.agent.default_geo_neighbor_helpers import NeighborHelpers
+from unittest.mock import ANY, MagicMock, patch
+from src.agent.default_geo_neighbor_helpers import NeighborHelpers, RootCapIndex
 from src.agent.cell import Cell
 
 
@@ -316,13 +316,69 @@ class TestNeighborHelpers(unittest.TestCase):
         NeighborHelpers.fix_lrc_neighbors_after_growth(sim)
 
         # Assertions to ensure the appropriate methods were called
-        mock_check_new_neighbors.assert_called_with(non_root_tip_cell, sim)
-        mock_check_new_neighbors.assert_called_once()
+        mock_check_new_neighbors.assert_called_once_with(non_root_tip_cell, sim, lrc_index=ANY)
         mock_check_no_longer_neighbors.assert_called_with(
             non_root_tip_cell, l_neighbor_root_cap_cell
         )
         mock_check_no_longer_neighbors.assert_called_once()
 
+    def _make_mock_lrc_cell(self, side, min_y, max_y):
+        lrc_cell = MagicMock()
+        lrc_cell.get_quad_perimeter().get_left_lateral_or_medial.return_value = side
+        lrc_cell.get_quad_perimeter().get_min_y.return_value = min_y
+        lrc_cell.get_quad_perimeter().get_max_y.return_value = max_y
+        return lrc_cell
+
+    def test_root_cap_index_finds_overlapping_cells_on_same_side(self):
+        bottom = self._make_mock_lrc_cell("lateral", 0, 10)
+        medial_side = self._make_mock_lrc_cell("medial", 10, 20)
+        top = self._make_mock_lrc_cell("lateral", 20, 30)
+        middle = self._make_mock_lrc_cell("lateral", 10, 20)
+        lrc_index = RootCapIndex([bottom, medial_side, top, middle], 50)
+
+        # Closed intervals, so touching intervals overlap; results are in input order
+        self.assertEqual(lrc_index.get_overlapping("lateral", 10, 20), [bottom, top, middle])
+        self.assertEqual(lrc_index.get_overlapping("lateral", 12, 18), [middle])
+        self.assertEqual(lrc_index.get_overlapping("lateral", 31, 40), [])
+        self.assertEqual(lrc_index.get_overlapping("lateral", -5, 35), [bottom, top, middle])
+        self.assertEqual(lrc_index.get_overlapping("medial", 0, 5), [])
+        self.assertEqual(lrc_index.get_overlapping("medial", 15, 15), [medial_side])
+
+    def test_root_cap_index_handles_overlapping_intervals(self):
+        long_cell = self._make_mock_lrc_cell("lateral", 0, 100)
+        short_cell = self._make_mock_lrc_cell("lateral", 10, 20)
+        lrc_index = RootCapIndex([long_cell, short_cell], 50)
+        self.assertEqual(lrc_index.get_overlapping("lateral", 50, 60), [long_cell])
+        self.assertEqual(lrc_index.get_overlapping("lateral", 15, 16), [long_cell, short_cell])
+
+    def test_root_cap_index_matches_cell_and_lrc_cell_are_neighbors(self):
+        lrc_cells = [
+            self._make_mock_lrc_cell("lateral", min_y, min_y + 10) for min_y in range(0, 100, 10)
+        ]
+        lrc_index = RootCapIndex(lrc_cells, 50)
+        cell = MagicMock()
+        cell.get_quad_perimeter().get_left_lateral_or_medial.return_value = "lateral"
+        with patch.object(NeighborHelpers, "cell_and_lrc_cell_are_neighbors", return_value=True):
+            for cell_min_y, cell_max_y in [(5, 8), (10, 20), (35, 62), (99, 120), (101, 120)]:
+                cell.get_quad_perimeter().get_min_y.return_value = cell_min_y
+                cell.get_quad_perimeter().get_max_y.return_value = cell_max_y
+                expected = [
+                    lrc_cell
+                    for lrc_cell in lrc_cells
+                    if lrc_cell.get_quad_perimeter().get_min_y() <= cell_max_y
+                    and cell_min_y <= lrc_cell.get_quad_perimeter().get_max_y()
+                ]
+                self.assertEqual(lrc_index.get_overlapping_lrc_cells(cell), expected)
+
+                cell.get_l_neighbors.return_value = []
+                cell.add_l_neighbor.reset_mock()
+                NeighborHelpers.check_if_neighbors_with_new_root_cap_cell(
+                    cell, MagicMock(), lrc_index=lrc_index
+                )
+                self.assertEqual(
+                    [call.args[0] for call in cell.add_l_neighbor.call_args_list], expected
+                )
+
     def test_check_if_no_longer_neighbors_with_root_cap_cell(self):
         # Mocking Cell instances
         cell = MagicMock()
@@ -160,6 +160,21 @@ class TestOutput(unittest.TestCase):
         self.assertGreater(os.path.getsize(self.output_csv), 0)
         self.assertGreater(os.path.getsize(self.output_json), 0)
 
+    def test_output_vertex_ids(self):
+        output = Output(self.sim, self.output_csv, self.output_json, write_vertex_ids=True)
+        output.output_cells()
+        with open(self.output_json) as file:
+            rows = json.load(file)
+        qp = self.cell0.get_quad_perimeter()
+        expected = [
+            qp.get_bottom_right().get_vid(),
+            qp.get_bottom_left().get_vid(),
+            qp.get_top_left().get_vid(),
+            qp.get_top_right().get_vid(),
+        ]
+        self.assertEqual(rows[0]["vertex_ids"], expected)
+        self.assertEqual(sorted(expected), [0, 1, 2, 3])
+
     def test_get_division_number(self):
         # TODO: Implement
         pass
@@ -209,6 +209,36 @@ class TestQuadPerimeter(unittest.TestCase):
         self.assertEqual(v3, qp1.get_top_right())
         self.assertEqual(v4, qp1.get_bottom_right())
 
+    def test_derived_quantities_update_when_vertices_move(self):
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        qp = QuadPerimeter([v1, v2, v3, v4])
+        self.assertEqual(400, qp.get_area())
+        self.assertEqual(80, qp.get_perimeter_len())
+        self.assertEqual(30, qp.get_max_y())
+        self.assertEqual(20, qp.get_midpointy())
+        self.assertEqual(0.25, qp.get_memfrac("l", "lateral"))
+
+        v2.set_y(50)
+        v3.set_y(50)
+        self.assertEqual(1, v2.get_version())
+        self.assertEqual(40, qp.get_left_memlen())
+        self.assertEqual(120, qp.get_perimeter_len())
+        self.assertEqual(800, qp.get_area())
+        self.assertEqual(50, qp.get_max_y())
+        self.assertEqual(10, qp.get_min_y())
+        self.assertEqual(30, qp.get_midpointy())
+        self.assertEqual(round(40 / 120, 6), qp.get_memfrac("l", "lateral"))
+        self.assertEqual(round(20 / 120, 6), qp.get_memfrac("a", "lateral"))
+
+        v5 = Vertex(10, 0)
+        v6 = Vertex(30, 0)
+        qp.set_corners([v5, v2, v3, v6])
+        self.assertEqual(0, qp.get_min_y())
+        self.assertEqual(1000, qp.get_area())
+
     def test_determine_left_right(self):
         v1 = Vertex(10, 10)
         v2 = Vertex(10, 30)
@@ -0,0 +1,31 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from arcade import get_window
+from src.sim.simulation.sim import GrowingSim
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+
+class TestGrowingSim(unittest.TestCase):
+
+    def test_close(self):
+        old_sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        old_sim.close()
+        self.assertIs(get_window(), sim)
+        # pyglet closes windows again when they are garbage collected
+        old_sim.close()
+        self.assertIs(get_window(), sim)
+        sim.close()
+        with self.assertRaises(RuntimeError):
+            get_window()
+
+
+if __name__ == "__main__":
+    unittest.main()
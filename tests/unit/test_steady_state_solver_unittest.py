@@ -0,0 +1,148 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+from src.agent.cell import Cell
+from src.loc.vertex.vertex import Vertex
+from src.sim.circulator.steady_state_solver import SteadyStateSolver
+from src.sim.simulation.sim import GrowingSim
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+
+def make_init_vals():
+    init_vals = {
+        "auxin": 2,
+        "arr": 3,
+        "al": 3,
+        "pin": 1,
+        "pina": 0.5,
+        "pinb": 0.7,
+        "pinl": 0.4,
+        "pinm": 0.2,
+        "k1": 1,
+        "k2": 1,
+        "k3": 1,
+        "k4": 1,
+        "k5": 1,
+        "k6": 1,
+        "k_s": 0.005,
+        "k_d": 0.0015,
+        "auxin_w": 1,
+        "arr_hist": [0.1, 0.2, 0.3],
+        "growing": False,
+        "circ_mod": "cont",
+    }
+    return init_vals
+
+
+def make_cells(sim, init_vals, other_init_vals):
+    bottom_left = Vertex(10.0, 10.0)
+    bottom_right = Vertex(30.0, 10.0)
+    middle_left = Vertex(10.0, 30.0)
+    middle_right = Vertex(30.0, 30.0)
+    top_left = Vertex(10.0, 50.0)
+    top_right = Vertex(30.0, 50.0)
+    cell = Cell(
+        sim,
+        [middle_left, middle_right, bottom_right, bottom_left],
+        init_vals,
+        sim.get_next_cell_id(),
+    )
+    neighbor = Cell(
+        sim,
+        [top_left, top_right, middle_right, middle_left],
+        other_init_vals,
+        sim.get_next_cell_id(),
+    )
+    cell.add_neighbor(neighbor)
+    neighbor.add_neighbor(cell)
+    return cell, neighbor
+
+
+class TestSteadyStateSolver(unittest.TestCase):
+
+    def test_get_transport_network(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        cell, neighbor = make_cells(sim, make_init_vals(), make_init_vals())
+        cells, network = SteadyStateSolver(sim).get_transport_network()
+        self.assertEqual(cells, [cell, neighbor])
+        self.assertEqual(network.shape, (2, 5))
+        coefficients = cell.get_circ_mod().get_transport_coefficients()
+        _, membrane, influx, efflux = coefficients[0]
+        np.testing.assert_array_equal(network[0], [0, 1, membrane, influx, efflux])
+
+    def test_solve(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        weighted_init_vals = make_init_vals()
+        weighted_init_vals["auxin_w"] = 3
+        cell, neighbor = make_cells(sim, make_init_vals(), weighted_init_vals)
+        solver = SteadyStateSolver(sim)
+        states = solver.solve()
+        self.assertEqual(list(states), [cell, neighbor])
+        auxins = np.array([states[cell][0], states[neighbor][0]])
+        cells, network = solver.get_transport_network()
+        residual, _, _ = solver.get_residual(cells, network, auxins)
+        np.testing.assert_allclose(residual, np.zeros(2), atol=1e-12)
+        # Transport only moves auxin, so synthesis balances degradation across the tissue
+        self.assertAlmostEqual(
+            cell.get_circ_mod().rates(states[cell], 0)[0]
+            + neighbor.get_circ_mod().rates(states[neighbor], 0)[0],
+            0,
+        )
+        self.assertEqual(cell.get_circ_mod().get_auxin(), 2)
+
+    def test_solve_steady_state(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        init_vals = make_init_vals()
+        init_vals["circ_mod"] = "aux_syndegonly"
+        init_vals["ks_aux"] = 0.4
+        init_vals["kd_aux"] = 0.1
+        other_init_vals = dict(init_vals, ks_aux=0.6)
+        cell, neighbor = make_cells(sim, init_vals, other_init_vals)
+        states = sim.solve_steady_state()
+        # Without AUX/LAX or PIN the cells exchange no auxin
+        self.assertAlmostEqual(states[cell][0], 4)
+        self.assertAlmostEqual(states[neighbor][0], 6)
+        self.assertEqual(cell.get_circ_mod().get_auxin(), states[cell][0])
+        self.assertEqual(neighbor.get_circ_mod().get_arr_hist(), [0.0] * 3)
+
+    def test_steady_state_zeroes_rates(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        module_init_vals = {
+            "universal_syndeg": {},
+            "indep_syndeg": {
+                "ks_aux": 0.004,
+                "kd_aux": 0.002,
+                "ks_arr": 0.006,
+                "kd_arr": 0.003,
+                "ks_pinu": 0.005,
+                "kd_pinu": 0.001,
+                "kd_pinloc": 0.0025,
+                "ks_auxlax": 0.007,
+                "kd_auxlax": 0.0015,
+            },
+            "aux_syndegonly": {"ks_aux": 0.4, "kd_aux": 0.1},
+        }
+        for circ_mod_name, extra_init_vals in module_init_vals.items():
+            init_vals = dict(make_init_vals(), circ_mod=circ_mod_name, **extra_init_vals)
+            cell, _ = make_cells(sim, init_vals, init_vals)
+            circ_mod = cell.get_circ_mod()
+            state, _ = circ_mod.calculate_steady_state(0.7)
+            circ_mod.set_steady_state(state)
+            np.testing.assert_allclose(circ_mod.rates(state, 0)[1:], np.zeros(7), atol=1e-12)
+
+    def test_solve_does_not_converge(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        make_cells(sim, make_init_vals(), make_init_vals())
+        with self.assertRaises(ValueError):
+            SteadyStateSolver(sim, max_iterations=0).solve()
+
+
+if __name__ == "__main__":
+    unittest.main()
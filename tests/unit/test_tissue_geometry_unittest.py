@@ -0,0 +1,143 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+import numpy as np
+from src.agent.cell import Cell
+from src.loc.quad_perimeter.quad_perimeter import QuadPerimeter
+from src.loc.quad_perimeter.tissue_geometry import TissueGeometry, compute_tissue_geometry
+from src.loc.vertex.vertex import Vertex
+from src.sim.simulation.sim import GrowingSim
+from src.sim.util.math_helpers import round_to_sf, round_to_sf_array, set_state_dtype
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+init_vals = {
+    "auxin": 2,
+    "arr": 3,
+    "al": 3,
+    "pin": 1,
+    "pina": 0.5,
+    "pinb": 0.7,
+    "pinl": 0.4,
+    "pinm": 0.2,
+    "k1": 1,
+    "k2": 1,
+    "k3": 1,
+    "k4": 1,
+    "k5": 1,
+    "k6": 1,
+    "k_s": 0.005,
+    "k_d": 0.0015,
+    "auxin_w": 1,
+    "arr_hist": [0.1, 0.2, 0.3],
+    "growing": False,
+    "circ_mod": "cont",
+}
+
+
+class TestTissueGeometry(unittest.TestCase):
+
+    def test_compute_tissue_geometry_matches_quad_perimeter(self):
+        rng = np.random.default_rng(0)
+        quads = []
+        for _ in range(50):
+            x, y = rng.uniform(0, 500, size=2)
+            width, height = rng.uniform(1, 40, size=2)
+            slant = rng.uniform(-3, 3)
+            quads.append(
+                [
+                    Vertex(x, y + height + slant),
+                    Vertex(x + width, y + height),
+                    Vertex(x + width, y),
+                    Vertex(x, y + slant),
+                ]
+            )
+        qps = [QuadPerimeter(quad) for quad in quads]
+        coords = np.array([v.get_xy() for qp in qps for v in qp.get_vs()])
+        corner_indices = np.arange(len(coords)).reshape(-1, 4)
+        geometry = compute_tissue_geometry(coords, corner_indices)
+        for row, qp in enumerate(qps):
+            self.assertEqual(geometry["apical_memlen"][row], qp.get_apical_memlen())
+            self.assertEqual(geometry["basal_memlen"][row], qp.get_basal_memlen())
+            self.assertEqual(geometry["left_memlen"][row], qp.get_left_memlen())
+            self.assertEqual(geometry["right_memlen"][row], qp.get_right_memlen())
+            self.assertEqual(geometry["perimeter_len"][row], qp.get_perimeter_len())
+            self.assertEqual(geometry["area"][row], qp.get_area())
+            self.assertEqual(geometry["min_y"][row], qp.get_min_y())
+            self.assertEqual(geometry["max_x"][row], qp.get_max_x())
+            self.assertAlmostEqual(geometry["centroid_y"][row], qp.get_midpointy())
+
+    def test_compute_tissue_geometry_float32(self):
+        coords = np.array([[0.0, 10.0], [20.0, 10.0], [20.0, 0.0], [0.0, 0.0]])
+        expected = compute_tissue_geometry(coords, np.arange(4))
+        set_state_dtype("float32")
+        self.addCleanup(set_state_dtype, "float64")
+        geometry = compute_tissue_geometry(coords, np.arange(4))
+        for quantity, values in geometry.items():
+            self.assertEqual(values.dtype, np.float32)
+            np.testing.assert_allclose(values, expected[quantity], rtol=1e-6)
+
+    def test_shared_vertices_stored_once(self):
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        v5 = Vertex(10, 40)
+        v6 = Vertex(30, 40)
+        cell1 = Cell(simulation, [v1, v2, v3, v4], init_vals, simulation.get_next_cell_id())
+        cell2 = Cell(simulation, [v2, v3, v5, v6], init_vals, simulation.get_next_cell_id())
+        geometry = TissueGeometry([cell1, cell2])
+        self.assertEqual(6, len(geometry.vertices))
+        self.assertEqual(geometry.corner_indices[0, 0], geometry.corner_indices[1, 3])
+        self.assertEqual(400, geometry.get_cell_value(cell1, "area"))
+        self.assertEqual(200, geometry.get_cell_value(cell2, "area"))
+        self.assertEqual(35, geometry.get_cell_value(cell2, "centroid_y"))
+
+    def test_sim_recomputes_geometry_only_after_changes(self):
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        cell1 = Cell(simulation, [v1, v2, v3, v4], init_vals, simulation.get_next_cell_id())
+        geometry = simulation.get_tissue_geometry()
+        self.assertIs(geometry, simulation.get_tissue_geometry())
+
+        v2.set_y(50)
+        v3.set_y(50)
+        moved_geometry = simulation.get_tissue_geometry()
+        self.assertIsNot(geometry, moved_geometry)
+        self.assertEqual(800, moved_geometry.get_cell_value(cell1, "area"))
+
+        v7 = Vertex(10, 60)
+        v8 = Vertex(30, 60)
+        cell2 = Cell(simulation, [v2, v3, v7, v8], init_vals, simulation.get_next_cell_id())
+        self.assertEqual(2, len(simulation.get_tissue_geometry().cells))
+        simulation.remove_from_cell_list(cell1)
+        self.assertEqual([cell2], simulation.get_tissue_geometry().cells)
+
+    def test_round_to_sf_array_matches_round_to_sf(self):
+        rng = np.random.default_rng(1)
+        numbers = np.concatenate(
+            [
+                rng.uniform(-1, 1, 5000) * 10.0 ** rng.integers(-8, 9, 5000),
+                np.round(rng.uniform(-1, 1, 5000), 4),
+                [2.675, 0.5, 1.5, 2.5, 1000.0, 999.9999999999999, 1e-5, 12345650.0],
+            ]
+        )
+        for sf in [1, 3, 6, 10]:
+            expected = [round_to_sf(float(number), sf) for number in numbers]
+            np.testing.assert_array_equal(round_to_sf_array(numbers, sf), expected)
+        np.testing.assert_array_equal(
+            round_to_sf_array(np.array([0.0, np.nan, np.inf]), 3), [0.0, np.nan, np.inf]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
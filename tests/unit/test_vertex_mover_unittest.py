@@ -4,6 +4,7 @@ import platform
 if platform.system() == "Linux":
     os.environ["ARCADE_HEADLESS"] = "True"
 import unittest
+from unittest.mock import MagicMock
 from src.sim.mover.vertex_mover import VertexMover
 from src.loc.vertex.vertex import Vertex
 from src.loc.quad_perimeter.quad_perimeter import QuadPerimeter
@@ -102,6 +103,45 @@ class TestVertexMover(unittest.TestCase):
         self.assertEqual(1.5, simulation.get_vertex_mover().get_vertex_delta_val(v9))
         self.assertEqual(1.5, simulation.get_vertex_mover().get_vertex_delta_val(v10))
 
+    def make_mock_cell(self, b_neighbors):
+        cell = MagicMock()
+        cell.get_b_neighbors.return_value = b_neighbors
+        cell.get_growing.return_value = True
+        cell.get_quad_perimeter.return_value.get_bottom_left.return_value = MagicMock()
+        cell.get_quad_perimeter.return_value.get_bottom_right.return_value = MagicMock()
+        return cell
+
+    def test_propogate_deltas_through_multiple_apical_neighbors(self):
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        vertex_mover = simulation.get_vertex_mover()
+        c_cell = self.make_mock_cell([])
+        a_cell = self.make_mock_cell([c_cell])
+        b_cell = self.make_mock_cell([a_cell])
+        top_cell = self.make_mock_cell([a_cell, b_cell])
+        for cell, delta in [(top_cell, 1.0), (a_cell, 2.0), (b_cell, 4.0), (c_cell, 8.0)]:
+            vertex_mover.add_cell_delta_val(cell, delta)
+        cells, files, writes = vertex_mover.get_file_order([top_cell])
+        self.assertEqual(cells, [top_cell, b_cell, a_cell, c_cell])
+        self.assertEqual(files, [(0, 4, -1)])
+        self.assertEqual(writes, [(0, -1), (2, 0), (1, 0), (3, 2)])
+        vertex_mover.propogate_deltas([top_cell])
+        # a_cell's vertices take top_cell's delta, c_cell sums down through b_cell and a_cell
+        expected = {top_cell: 1.0, a_cell: 3.0, b_cell: 5.0, c_cell: 15.0}
+        for cell, delta in expected.items():
+            bottom_left = cell.get_quad_perimeter().get_bottom_left()
+            self.assertEqual(vertex_mover.get_vertex_delta_val(bottom_left), delta)
+
+    def test_propogate_deltas_keeps_integer_deltas(self):
+        simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        vertex_mover = simulation.get_vertex_mover()
+        b_cell = self.make_mock_cell([])
+        top_cell = self.make_mock_cell([b_cell])
+        vertex_mover.add_cell_delta_val(top_cell, 0)
+        vertex_mover.propogate_deltas([top_cell])
+        delta = vertex_mover.get_vertex_delta_val(b_cell.get_quad_perimeter().get_bottom_left())
+        self.assertEqual(delta, 0)
+        self.assertIsInstance(delta, int)
+
     def test_execute_vertex_movement(self):
         timestep = 1
         simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
@@ -269,7 +309,7 @@ class TestVertexMover(unittest.TestCase):
         timestep = 1
         simulation = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, timestep, False)
         v50 = Vertex(50, 10)
-        simulation.vertex_list.append(v50)
+        simulation.get_vertex_registry().add_vertex(v50)
         v1 = Vertex(10, 10)
         v2 = Vertex(10, 30)
         v3 = Vertex(30, 30)
@@ -0,0 +1,100 @@
+import os
+import platform
+
+if platform.system() == "Linux":
+    os.environ["ARCADE_HEADLESS"] = "True"
+import unittest
+from src.agent.cell import Cell
+from src.loc.vertex.vertex import Vertex
+from src.loc.vertex.vertex_registry import VertexRegistry
+from src.sim.simulation.sim import GrowingSim
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Starting Template"
+
+init_vals = {
+    "auxin": 2,
+    "arr": 3,
+    "al": 3,
+    "pin": 1,
+    "pina": 0.5,
+    "pinb": 0.7,
+    "pinl": 0.4,
+    "pinm": 0.2,
+    "k1": 1,
+    "k2": 1,
+    "k3": 1,
+    "k4": 1,
+    "k5": 1,
+    "k6": 1,
+    "k_s": 0.005,
+    "k_d": 0.0015,
+    "auxin_w": 1,
+    "arr_hist": [0.1, 0.2, 0.3],
+    "growing": False,
+    "circ_mod": "cont",
+}
+
+
+class TestVertexRegistry(unittest.TestCase):
+
+    def test_add_and_remove_vertex(self):
+        registry = VertexRegistry()
+        read_vertex = Vertex(0, 0, 5)
+        new_vertex = Vertex(0, 10)
+        registry.add_vertex(read_vertex)
+        registry.add_vertex(new_vertex)
+        registry.add_vertex(new_vertex)
+        self.assertEqual(read_vertex.get_vid(), 5)
+        self.assertEqual(new_vertex.get_vid(), 6)
+        self.assertEqual(registry.get_ref_count(new_vertex), 2)
+        self.assertIs(registry.get_vertex(6), new_vertex)
+        self.assertEqual(registry.get_vertices(), [read_vertex, new_vertex])
+
+        registry.remove_vertex(new_vertex)
+        self.assertEqual(len(registry), 2)
+        registry.remove_vertex(new_vertex)
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(registry.get_ref_count(new_vertex), 0)
+        with self.assertRaises(KeyError):
+            registry.get_vertex(6)
+        with self.assertRaises(ValueError):
+            registry.remove_vertex(new_vertex)
+
+        # IDs of dropped vertices are not reused
+        another_vertex = Vertex(0, 20)
+        registry.add_vertex(another_vertex)
+        self.assertEqual(another_vertex.get_vid(), 7)
+
+    def test_add_vertex_with_id_in_use(self):
+        registry = VertexRegistry()
+        registry.add_vertex(Vertex(0, 0, 1))
+        with self.assertRaises(ValueError):
+            registry.add_vertex(Vertex(0, 10, 1))
+
+    def test_registry_follows_cell_list(self):
+        sim = GrowingSim(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, 1, False)
+        v1 = Vertex(10, 10)
+        v2 = Vertex(10, 30)
+        v3 = Vertex(30, 30)
+        v4 = Vertex(30, 10)
+        v5 = Vertex(50, 30)
+        v6 = Vertex(50, 10)
+        left_cell = Cell(sim, [v1, v2, v3, v4], init_vals, sim.get_next_cell_id())
+        right_cell = Cell(sim, [v4, v3, v5, v6], init_vals, sim.get_next_cell_id())
+        registry = sim.get_vertex_registry()
+        self.assertEqual(registry.get_vertices(), [v2, v3, v4, v1, v5, v6])
+        self.assertEqual(registry.get_ref_count(v3), 2)
+        v_ids = sorted(vertex.get_vid() for vertex in registry.get_vertices())
+        self.assertEqual(v_ids, list(range(6)))
+
+        sim.remove_from_cell_list(right_cell)
+        self.assertEqual(registry.get_vertices(), [v2, v3, v4, v1])
+        self.assertEqual(registry.get_ref_count(v3), 1)
+        sim.remove_from_cell_list(left_cell)
+        self.assertEqual(len(registry), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()